@@ -6,24 +6,77 @@ This module handles state configuration, argument parsing, and shared functional
 
 import json
 import os
+import re
 import argparse
-from typing import Dict, Any, Tuple
+import functools
+import time
+from typing import Dict, Any, List, Tuple
 
 # Base directories
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CONFIG_DIR = os.path.join(BASE_DIR, "config")
 INPUTS_DIR = os.path.join(BASE_DIR, "inputs")
-OUTPUTS_DIR = os.path.join(BASE_DIR, "outputs")
+# Outputs can be redirected (e.g. to faster local storage) with POLITECH_OUTPUTS_DIR
+OUTPUTS_DIR = os.path.abspath(os.environ.get("POLITECH_OUTPUTS_DIR") or os.path.join(BASE_DIR, "outputs"))
+_SEP = os.sep
+
+# Directories already created in this process
+_MKDIR_DONE = set()
+
+
+def _ensure_dir(path: str):
+    """Create a directory once per process; later calls skip the mkdir syscall."""
+    if path not in _MKDIR_DONE:
+        os.makedirs(path, exist_ok=True)
+        _MKDIR_DONE.add(path)
+
 
 # Ensure directories exist
 for dir_path in [CONFIG_DIR, INPUTS_DIR, OUTPUTS_DIR]:
-    os.makedirs(dir_path, exist_ok=True)
+    _ensure_dir(dir_path)
+
+# Validated state setup handed down by run_all_stages (see write_state_cache)
+STATE_CACHE_ENV = "POLITECH_STATE_CACHE"
+STATE_CACHE_MAX_AGE = 6 * 3600  # seconds
 
 # Load state configuration
 STATES_CONFIG_PATH = os.path.join(CONFIG_DIR, "states.json")
 
+# Precinct-district assignments: one JSON Lines shard per (state, plan year),
+# listed in an index so a re-run only rewrites its own shard
+ASSIGNMENTS_DIR = os.path.join(OUTPUTS_DIR, "assignments")
+ASSIGNMENTS_INDEX = os.path.join(ASSIGNMENTS_DIR, "index.json")
+
+# Input directory name patterns
+_ACS_DIR_RE = re.compile(r'acs_(\d{4})$')
+_TIGER_DIR_RE = re.compile(r'tiger_(\d{4})$')
+
+
+@functools.lru_cache(maxsize=64)
+def _plan_dir_re(state_abbr: str) -> re.Pattern:
+    """Compiled pattern for plan directories: {state}_{chamber}_adopted_{year}[_suffix]."""
+    return re.compile(rf'{re.escape(state_abbr)}_(cong|sl|sldl|sldu)_adopted_(\d{{4}})(?:_.*)?$')
+
+class _UnknownStateError(KeyError):
+    """KeyError for an unknown state code; the available list is only built when rendered."""
+
+    def __init__(self, state_code: str, states: Dict[str, Any]):
+        super().__init__(state_code)
+        self.state_code = state_code
+        self.states = states
+
+    def __str__(self) -> str:
+        available = ", ".join(sorted(self.states))
+        return f"State code '{self.state_code}' not found. Available: {available}"
+
+
+@functools.lru_cache(maxsize=1)
 def load_states_config() -> Dict[str, Any]:
-    """Load the states configuration from JSON file."""
+    """
+    Load the states configuration from JSON file (parsed once per process).
+
+    The cached dict is shared by every caller: treat it as read-only.
+    """
     with open(STATES_CONFIG_PATH, 'r') as f:
         return json.load(f)
 
@@ -44,10 +97,10 @@ def get_state_info(state_code: str) -> Dict[str, str]:
     state_code = state_code.upper()
     
     if state_code not in states_config["states"]:
-        available = ", ".join(sorted(states_config["states"].keys()))
-        raise KeyError(f"State code '{state_code}' not found. Available: {available}")
+        raise _UnknownStateError(state_code, states_config["states"])
     
-    return states_config["states"][state_code]
+    # A copy, so callers can modify their state_info without touching the cache
+    return dict(states_config["states"][state_code])
 
 def setup_argument_parser(description: str, stage_name: str = None) -> argparse.ArgumentParser:
     """
@@ -92,7 +145,8 @@ def setup_argument_parser(description: str, stage_name: str = None) -> argparse.
     
     return parser
 
-def get_state_paths(state_abbr: str, acs_year: int = None, census_year: int = None) -> Dict[str, str]:
+def get_state_paths(state_abbr: str, acs_year: int = None, census_year: int = None,
+                    state_info: Dict[str, str] = None) -> Dict[str, str]:
     """
     Generate all standard file paths for a given state.
     
@@ -100,11 +154,12 @@ def get_state_paths(state_abbr: str, acs_year: int = None, census_year: int = No
         state_abbr: Lowercase state abbreviation (e.g., 'az', 'ca')
         acs_year: ACS data year (auto-detects if None)
         census_year: Census year for TIGER data (auto-detects if None)
+        state_info: Optional state info from get_state_info (looked up if None)
         
     Returns:
         Dictionary of standard file paths for the state
     """
-    state_fips = get_state_info(state_abbr.upper())["fips"]
+    state_fips = (state_info or get_state_info(state_abbr.upper()))["fips"]
     
     # Auto-detect years if not provided
     if acs_year is None:
@@ -125,21 +180,29 @@ def get_state_paths(state_abbr: str, acs_year: int = None, census_year: int = No
             # Fallback to 2020 if no data found (e.g., for Stage 0 download)
             census_year = 2020
     
+    paths = dict(_build_state_paths(state_abbr, state_fips, acs_year, census_year))
+    
+    # Ensure output directories exist
+    _ensure_dir(paths["state_output_dir"])
+    _ensure_dir(OUTPUTS_DIR)
+    
+    return paths
+
+
+@functools.lru_cache(maxsize=256)
+def _build_state_paths(state_abbr: str, state_fips: str, acs_year: int, census_year: int) -> Tuple[Tuple[str, Any], ...]:
+    """Build the (key, path) pairs for get_state_paths; pure and memoized."""
     # Input directories
-    tiger_dir = os.path.join(INPUTS_DIR, f"tiger_{census_year}")
-    acs_dir = os.path.join(INPUTS_DIR, f"acs_{acs_year}", state_abbr)
-    cvap_dir = os.path.join(INPUTS_DIR, "cvap", "CVAP_2019-2023_ACS_csv_files")
-    precincts_dir = os.path.join(INPUTS_DIR, "precincts", state_abbr)
-    plans_dir = os.path.join(INPUTS_DIR, "plans", state_abbr)
+    tiger_dir = f"{INPUTS_DIR}{_SEP}tiger_{census_year}"
+    acs_dir = f"{INPUTS_DIR}{_SEP}acs_{acs_year}{_SEP}{state_abbr}"
+    cvap_dir = f"{INPUTS_DIR}{_SEP}cvap{_SEP}CVAP_2019-2023_ACS_csv_files"
+    precincts_dir = f"{INPUTS_DIR}{_SEP}precincts{_SEP}{state_abbr}"
+    plans_dir = f"{INPUTS_DIR}{_SEP}plans{_SEP}{state_abbr}"
     
     # Output directory
-    state_output_dir = os.path.join(OUTPUTS_DIR, state_abbr)
-    os.makedirs(state_output_dir, exist_ok=True)
+    state_output_dir = f"{OUTPUTS_DIR}{_SEP}{state_abbr}"
     
-    # Ensure outputs directory exists
-    os.makedirs(OUTPUTS_DIR, exist_ok=True)
-    
-    return {
+    return tuple({
         # Directories
         "tiger_dir": tiger_dir,
         "acs_dir": acs_dir,
@@ -157,31 +220,103 @@ def get_state_paths(state_abbr: str, acs_year: int = None, census_year: int = No
         "census_year": census_year,
         
         # TIGER shapefiles
-        "bg_shapefile": os.path.join(tiger_dir, f"{state_abbr}_bg", f"tl_{census_year}_{state_fips}_bg.shp"),
-        "tiger_bg_shp": os.path.join(tiger_dir, f"{state_abbr}_bg", f"tl_{census_year}_{state_fips}_bg.shp"),
-        "tabblock_dir": os.path.join(tiger_dir, f"{state_abbr}_tabblock20"),
+        "bg_shapefile": f"{tiger_dir}{_SEP}{state_abbr}_bg{_SEP}tl_{census_year}_{state_fips}_bg.shp",
+        "tiger_bg_shp": f"{tiger_dir}{_SEP}{state_abbr}_bg{_SEP}tl_{census_year}_{state_fips}_bg.shp",
+        "tabblock_dir": f"{tiger_dir}{_SEP}{state_abbr}_tabblock20",
         
         # ACS data files
-        "acs_race_csv": os.path.join(acs_dir, f"{state_abbr}_bg_race_{acs_year}.csv"),
-        "acs_income_csv": os.path.join(acs_dir, f"{state_abbr}_bg_income_{acs_year}.csv"),
+        "acs_race_csv": f"{acs_dir}{_SEP}{state_abbr}_bg_race_{acs_year}.csv",
+        "acs_income_csv": f"{acs_dir}{_SEP}{state_abbr}_bg_income_{acs_year}.csv",
         
         # CVAP file (national)
-        "cvap_blockgr_csv": os.path.join(cvap_dir, "BlockGr.csv"),
+        "cvap_blockgr_csv": f"{cvap_dir}{_SEP}BlockGr.csv",
         
         # Output files
-        "bg_geojson": os.path.join(state_output_dir, f"{state_abbr}_bg_all_data_{acs_year}.geojson"),
-        "precinct_geojson": os.path.join(state_output_dir, f"{state_abbr}_precinct_all_pop_{acs_year}.geojson"),
-        "dots_geojson": os.path.join(state_output_dir, f"{state_abbr}_dots_pop{str(acs_year)[-2:]}_unit{{dot_unit}}.geojson"),
+        "bg_layer": f"{state_output_dir}{_SEP}{state_abbr}_bg_all_data_{acs_year}.fgb",
+        "precinct_geojson": f"{state_output_dir}{_SEP}{state_abbr}_precinct_all_pop_{acs_year}.geojson",
+        "dots_geojson": f"{state_output_dir}{_SEP}{state_abbr}_dots_pop{str(acs_year)[-2:]}_unit{{dot_unit}}.geojson",
+        
+        # GeoParquet siblings (written when pyarrow is installed; precincts in EPSG:5070, dots in EPSG:4326)
+        "precinct_parquet": f"{state_output_dir}{_SEP}{state_abbr}_precinct_all_pop_{acs_year}.parquet",
+        "dots_parquet": f"{state_output_dir}{_SEP}{state_abbr}_dots_pop{str(acs_year)[-2:]}_unit{{dot_unit}}.parquet",
+        
+        # Stage 4's reprojected plot layers (GeoParquet, keyed by source file)
+        "plot_cache_dir": f"{state_output_dir}{_SEP}.cache",
+        
+        # Centralized plans file (all states in one file)
+        "plans_json": f"{OUTPUTS_DIR}{_SEP}plans.json",
         
-        # Centralized JSON files (all states in one file)
-        "plans_json": os.path.join(OUTPUTS_DIR, "plans.json"),
-        "assignments_json": os.path.join(OUTPUTS_DIR, "assignments.json"),
+        # Assignment shards (all states in one directory, see ASSIGNMENTS_INDEX)
+        "assignments_dir": ASSIGNMENTS_DIR,
+        "assignments_index": ASSIGNMENTS_INDEX,
         
         # Comparison CSV files
-        "pop_comparison_csv": os.path.join(state_output_dir, f"{state_abbr}_population_comparison_{acs_year}.csv"),
-        "cvap_comparison_csv": os.path.join(state_output_dir, f"{state_abbr}_cvap_comparison_{acs_year}.csv"),
-        "income_comparison_csv": os.path.join(state_output_dir, f"{state_abbr}_income_comparison_{acs_year}.csv"),
-    }
+        "pop_comparison_csv": f"{state_output_dir}{_SEP}{state_abbr}_population_comparison_{acs_year}.csv",
+        "cvap_comparison_csv": f"{state_output_dir}{_SEP}{state_abbr}_cvap_comparison_{acs_year}.csv",
+        "income_comparison_csv": f"{state_output_dir}{_SEP}{state_abbr}_income_comparison_{acs_year}.csv",
+    }.items())
+
+# detect_available_* results, keyed by scanned directory + its mtime
+_DETECT_CACHE = {}
+
+
+def _scan_cache_key(name: str, directory: str, *extra) -> tuple:
+    """Cache key that changes whenever the scanned directory is modified."""
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        mtime = None
+    return (name, directory, mtime) + extra
+
+
+def clear_detect_cache():
+    """
+    Forget cached detect_available_* results. The cache key only tracks the
+    top-level directory's mtime, so call this after writing files into
+    existing subdirectories (e.g. after Stage 0).
+    """
+    _DETECT_CACHE.clear()
+
+
+def is_up_to_date(path: str, source: str) -> bool:
+    """Return True if path exists and is at least as new as source (a sibling copy of it)."""
+    try:
+        return os.path.getmtime(path) >= os.path.getmtime(source)
+    except OSError:
+        return False
+
+
+def assignment_shard_name(state_abbr: str, year: int) -> str:
+    """File name of the assignments shard for one state and plan year."""
+    return f"{state_abbr.upper()}_{year}.jsonl"
+
+
+def read_assignment_index() -> Dict[str, Dict[str, Any]]:
+    """Load the assignments index ({"<STATE>_<YEAR>": {state, year, file, records}})."""
+    if not os.path.exists(ASSIGNMENTS_INDEX):
+        return {}
+    with open(ASSIGNMENTS_INDEX, "r") as f:
+        return json.load(f)
+
+
+def find_assignment_shards(state_abbr: str = None, year: int = None) -> List[str]:
+    """Paths of the indexed assignment shards, optionally limited to one state and/or year."""
+    state = state_abbr.upper() if state_abbr else None
+    return [
+        os.path.join(ASSIGNMENTS_DIR, entry["file"])
+        for entry in read_assignment_index().values()
+        if (state is None or entry["state"] == state) and (year is None or entry["year"] == year)
+    ]
+
+
+def _has_csv(directory: str, prefix: str = "") -> bool:
+    """Return True as soon as a .csv file starting with prefix is found in directory."""
+    try:
+        with os.scandir(directory) as it:
+            return any(e.name.startswith(prefix) and e.name.endswith('.csv') and e.is_file() for e in it)
+    except OSError:
+        return False
+
 
 def detect_available_acs_years(state_abbr: str = None) -> list:
     """
@@ -193,33 +328,40 @@ def detect_available_acs_years(state_abbr: str = None) -> list:
     Returns:
         List of available years (sorted, most recent first)
     """
-    import re
+    cache_key = _scan_cache_key("acs", INPUTS_DIR, state_abbr)
+    if cache_key in _DETECT_CACHE:
+        return list(_DETECT_CACHE[cache_key])
+    
     years = []
     
     if not os.path.exists(INPUTS_DIR):
         return years
     
     # Find all acs_* directories
-    for item in os.listdir(INPUTS_DIR):
-        match = re.match(r'acs_(\d{4})$', item)
+    with os.scandir(INPUTS_DIR) as entries:
+        acs_entries = [e for e in entries if e.is_dir()]
+    for entry in acs_entries:
+        item = entry.name
+        match = _ACS_DIR_RE.match(item)
         if match:
             year = int(match.group(1))
-            acs_dir = os.path.join(INPUTS_DIR, item)
+            acs_dir = entry.path
             
             # If state specified, check if data exists for that state
             if state_abbr:
                 # Check new structure
-                state_dir = os.path.join(acs_dir, state_abbr)
-                if os.path.isdir(state_dir) and any(f.endswith('.csv') for f in os.listdir(state_dir)):
+                if _has_csv(os.path.join(acs_dir, state_abbr)):
                     years.append(year)
                     continue
                 # Check old structure
-                if any(f.startswith(f"{state_abbr}_bg_") and f.endswith('.csv') for f in os.listdir(acs_dir)):
+                if _has_csv(acs_dir, prefix=f"{state_abbr}_bg_"):
                     years.append(year)
             else:
                 years.append(year)
     
-    return sorted(years, reverse=True)
+    years.sort(reverse=True)
+    _DETECT_CACHE[cache_key] = years
+    return list(years)
 
 
 def detect_available_tiger_years() -> list:
@@ -229,19 +371,26 @@ def detect_available_tiger_years() -> list:
     Returns:
         List of available years (sorted, most recent first)
     """
-    import re
+    cache_key = _scan_cache_key("tiger", INPUTS_DIR)
+    if cache_key in _DETECT_CACHE:
+        return list(_DETECT_CACHE[cache_key])
+    
     years = []
     
     if not os.path.exists(INPUTS_DIR):
         return years
     
     # Find all tiger_* directories
-    for item in os.listdir(INPUTS_DIR):
-        match = re.match(r'tiger_(\d{4})$', item)
+    with os.scandir(INPUTS_DIR) as entries:
+        tiger_dirs = [e.name for e in entries if e.is_dir()]
+    for item in tiger_dirs:
+        match = _TIGER_DIR_RE.match(item)
         if match:
             years.append(int(match.group(1)))
     
-    return sorted(years, reverse=True)
+    years.sort(reverse=True)
+    _DETECT_CACHE[cache_key] = years
+    return list(years)
 
 
 def find_acs_file(state_abbr: str, acs_year: int, file_type: str) -> str:
@@ -268,20 +417,23 @@ def find_acs_file(state_abbr: str, acs_year: int, file_type: str) -> str:
     # Old structure: inputs/acs_{year}/{state_abbr}_bg_{type}_{year}.csv  
     old_path = os.path.join(INPUTS_DIR, f"acs_{acs_year}", f"{state_abbr}_bg_{file_type}_{acs_year}.csv")
     
-    if os.path.exists(new_path):
-        return new_path
-    elif os.path.exists(old_path):
-        print(f"⚠ Using ACS {file_type} file from old location: {old_path}")
-        print(f"   Consider moving to new structure: {new_path}")
-        return old_path
-    else:
-        raise FileNotFoundError(
-            f"ACS {file_type} file not found for {state_abbr.upper()} {acs_year}.\n"
-            f"Searched locations:\n"
-            f"  - {new_path}\n" 
-            f"  - {old_path}\n"
-            f"Run Stage 0 first to download the data."
-        )
+    for path in (new_path, old_path):
+        try:
+            os.stat(path)
+        except FileNotFoundError:
+            continue
+        if path is old_path:
+            print(f"⚠ Using ACS {file_type} file from old location: {old_path}")
+            print(f"   Consider moving to new structure: {new_path}")
+        return path
+    
+    raise FileNotFoundError(
+        f"ACS {file_type} file not found for {state_abbr.upper()} {acs_year}.\n"
+        f"Searched locations:\n"
+        f"  - {new_path}\n" 
+        f"  - {old_path}\n"
+        f"Run Stage 0 first to download the data."
+    )
 
 def find_precinct_shapefile(precincts_dir: str) -> str:
     """
@@ -302,7 +454,8 @@ def find_precinct_shapefile(precincts_dir: str) -> str:
             "Create it and place your precinct shapefile there."
         )
 
-    shp_files = [f for f in os.listdir(precincts_dir) if f.lower().endswith(".shp")]
+    with os.scandir(precincts_dir) as it:
+        shp_files = [e.name for e in it if e.is_file() and e.name.lower().endswith('.shp')]
     if not shp_files:
         raise FileNotFoundError(
             f"No .shp files found in {precincts_dir}. "
@@ -329,25 +482,33 @@ def detect_available_plan_years(plans_dir: str, state_abbr: str) -> Dict[str, li
     Returns:
         Dictionary with chamber keys (e.g., 'cong', 'sldl', 'sldu', 'sl') mapping to lists of available years
     """
-    import re
+    cache_key = _scan_cache_key("plans", plans_dir, state_abbr)
+    if cache_key in _DETECT_CACHE:
+        return {chamber: list(y) for chamber, y in _DETECT_CACHE[cache_key].items()}
+    
     years = {}
     
     if not os.path.isdir(plans_dir):
         return years
     
-    for item in os.listdir(plans_dir):
-        item_path = os.path.join(plans_dir, item)
-        if not os.path.isdir(item_path):
-            continue
+    plan_re = _plan_dir_re(state_abbr)
+    with os.scandir(plans_dir) as entries:
+        plan_entries = [e for e in entries if e.is_dir()]
+    
+    for entry in plan_entries:
+        item = entry.name
+        item_path = entry.path
         
         # Match any chamber pattern: {state}_{chamber}_adopted_{year}
         # Common chambers: cong, sl, sldl, sldu
-        match = re.match(rf'{state_abbr}_(cong|sl|sldl|sldu)_adopted_(\d{{4}})(?:_.*)?$', item)
+        match = plan_re.match(item)
         if match:
             chamber = match.group(1)
             year = int(match.group(2))
             # Check if it has shapefiles
-            if any(f.endswith('.shp') for f in os.listdir(item_path)):
+            with os.scandir(item_path) as it:
+                has_shp = any(e.is_file() and e.name.endswith('.shp') for e in it)
+            if has_shp:
                 if chamber not in years:
                     years[chamber] = []
                 years[chamber].append(year)
@@ -356,7 +517,8 @@ def detect_available_plan_years(plans_dir: str, state_abbr: str) -> Dict[str, li
     for chamber in years:
         years[chamber].sort(reverse=True)
     
-    return years
+    _DETECT_CACHE[cache_key] = years
+    return {chamber: list(y) for chamber, y in years.items()}
 
 
 def find_plan_shapefiles(plans_dir: str, state_abbr: str, plan_year: int = None) -> Dict[str, str]:
@@ -374,7 +536,6 @@ def find_plan_shapefiles(plans_dir: str, state_abbr: str, plan_year: int = None)
     Raises:
         FileNotFoundError: If no plan directories or shapefiles are found
     """
-    import re
     plans = {}
     
     # Auto-detect year if not provided
@@ -396,17 +557,20 @@ def find_plan_shapefiles(plans_dir: str, state_abbr: str, plan_year: int = None)
         print(f"   Available years by chamber: {chambers_info}")
     
     # Scan for all chamber directories matching the pattern
+    plan_re = _plan_dir_re(state_abbr)
     if os.path.isdir(plans_dir):
-        for item in os.listdir(plans_dir):
+        with os.scandir(plans_dir) as entries:
+            plan_entries = [e for e in entries if e.is_dir()]
+        for entry in plan_entries:
             # Match pattern: {state}_{chamber}_adopted_{year} (with optional suffix like _cd119)
-            match = re.match(rf'{state_abbr}_(cong|sl|sldl|sldu)_adopted_{plan_year}(?:_.*)?$', item)
-            if match:
+            match = plan_re.match(entry.name)
+            if match and int(match.group(2)) == plan_year:
                 chamber = match.group(1)
-                chamber_dir = os.path.join(plans_dir, item)
-                if os.path.isdir(chamber_dir):
-                    shp_files = [f for f in os.listdir(chamber_dir) if f.endswith(".shp")]
-                    if shp_files:
-                        plans[chamber] = os.path.join(chamber_dir, shp_files[0])
+                chamber_dir = entry.path
+                with os.scandir(chamber_dir) as it:
+                    shp_files = [e.name for e in it if e.is_file() and e.name.endswith(".shp")]
+                if shp_files:
+                    plans[chamber] = os.path.join(chamber_dir, shp_files[0])
     
     if not plans:
         raise FileNotFoundError(
@@ -434,13 +598,17 @@ def validate_state_setup(state_code: str, stage: str = None, acs_year: int = Non
         KeyError: If state code is invalid
         RuntimeError: If required environment variables are missing
     """
-    # Validate state code
-    state_info = get_state_info(state_code)
-    state_paths = get_state_paths(state_info["abbr"], acs_year=acs_year, census_year=census_year)
+    cached = _read_state_cache(state_code, acs_year, census_year)
+    if cached is not None:
+        state_info, state_paths = cached
+    else:
+        # Validate state code
+        state_info = get_state_info(state_code)
+        state_paths = get_state_paths(state_info["abbr"], acs_year=acs_year, census_year=census_year,
+                                      state_info=state_info)
     
     # Check for required environment variables based on stage
     if stage in ["stage0", "stage_0", "get_inputs"]:
-        import os
         census_api_key = os.environ.get("CENSUS_API_KEY")
         if not census_api_key:
             raise RuntimeError(
@@ -450,6 +618,48 @@ def validate_state_setup(state_code: str, stage: str = None, acs_year: int = Non
     
     return state_info, state_paths
 
+def write_state_cache(cache_path: str, state_info: Dict[str, str], state_paths: Dict[str, Any]):
+    """
+    Persist a validated state setup so child stage processes can reuse it.
+    
+    Child processes pick the file up through the POLITECH_STATE_CACHE
+    environment variable in validate_state_setup.
+    
+    Args:
+        cache_path: Path of the JSON file to write
+        state_info: State info returned by validate_state_setup
+        state_paths: State paths returned by validate_state_setup
+    """
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"state_info": state_info, "state_paths": state_paths}, f)
+    os.replace(tmp_path, cache_path)
+
+
+def _read_state_cache(state_code: str, acs_year: int = None, census_year: int = None):
+    """Return (state_info, state_paths) from POLITECH_STATE_CACHE if it matches the request."""
+    cache_path = os.environ.get(STATE_CACHE_ENV)
+    if not cache_path:
+        return None
+    try:
+        if time.time() - os.stat(cache_path).st_mtime > STATE_CACHE_MAX_AGE:
+            return None
+        with open(cache_path) as f:
+            cached = json.load(f)
+        state_info = cached["state_info"]
+        state_paths = cached["state_paths"]
+    except (OSError, ValueError, KeyError):
+        return None
+    
+    if state_info.get("abbr") != state_code.lower():
+        return None
+    if acs_year is not None and acs_year != state_paths.get("acs_year"):
+        return None
+    if census_year is not None and census_year != state_paths.get("census_year"):
+        return None
+    return state_info, state_paths
+
+
 def print_state_info(state_info: Dict[str, str]):
     """Print formatted state information."""
     print(f"Processing state: {state_info['name']} ({state_info['abbr'].upper()})")
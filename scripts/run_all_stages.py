@@ -14,22 +14,124 @@ Examples:
     python run_all_stages.py CA --acs-year 2022
     python run_all_stages.py TX --skip-stage0  # if data already exists
     python run_all_stages.py FL --stages 0,1,2  # run specific stages
+    python run_all_stages.py AZ --serial        # run stages one at a time
+    python run_all_stages.py AZ --isolate       # fresh interpreter per stage
 
 Available Stages:
     0: Download TIGER shapefiles and ACS data
-    1: Build precinct-level demographics using maup
+    1: Build precinct-level demographics
     2: Build district plans and assignments
     3: Generate race dot maps
     4: Create comparison visualizations
+
+Stages run as soon as the stages they depend on have finished, so stage 2
+(plans) and stage 3 (dots) run concurrently after stage 1. Stages are
+executed in long-lived worker processes that keep geopandas/shapely/scipy
+imported between stages; --isolate runs each stage in its own interpreter.
 """
 
 import subprocess
 import sys
 import os
-from common import setup_argument_parser, validate_state_setup, print_state_info
+import re
+import importlib
+import logging
+import tempfile
+import traceback
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from common import (setup_argument_parser, validate_state_setup, print_state_info,
+                    write_state_cache, clear_detect_cache, STATE_CACHE_ENV)
+
+log = logging.getLogger(__name__)
+
+# Stage dependency graph: stage -> stages whose outputs it reads
+STAGE_DEPS = {
+    0: [],
+    1: [0],      # BG geometry + ACS inputs
+    2: [1],      # precinct GeoJSON
+    3: [1],      # BG all-data GeoJSON
+    4: [2, 3],   # assignments + dots
+}
+
+STAGE_SCRIPTS = {
+    0: "run_stage0.py",
+    1: "run_stage1.py",
+    2: "run_stage2.py",
+    3: "run_stage3_dots.py",
+    4: "run_stage4_comp.py",
+}
+
+# One --stages token: a stage number or an inclusive range ("2" or "1-3")
+STAGE_TOKEN_RE = re.compile(r'^(\d+)(?:-(\d+))?$')
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Stage modules already imported by this worker process
+_STAGE_MODULES = {}
+
+# Stage 1 precinct layer kept by this worker for Stage 2, keyed by stage argv
+_STAGE1_PRECINCTS = {}
+
+
+def _init_stage_worker(env: dict):
+    """Give a pool worker the same environment and cwd a stage subprocess would get."""
+    if env:
+        os.environ.update(env)
+    os.chdir(SCRIPTS_DIR)
 
 
-def run_stage(stage_num: int, state_code: str, extra_args: list = None) -> bool:
+def _stage1_key(argv: list) -> tuple:
+    """State and year arguments shared by a Stage 1 run and the Stage 2 run that follows it."""
+    key = [argv[0]]
+    for flag in ("--acs-year", "--census-year"):
+        if flag in argv:
+            key.append(argv[argv.index(flag) + 1])
+    return tuple(key)
+
+
+def _run_stage_in_worker(stage_num: int, argv: list) -> bool:
+    """
+    Run a stage's main() inside a pool worker, importing its module on first use.
+
+    Stage 1 returns its precinct layer; when Stage 2 for the same state later runs
+    in this worker (always the case with --serial), it gets that layer in memory
+    instead of re-parsing the precinct GeoJSON.
+    """
+    try:
+        module = _STAGE_MODULES.get(stage_num)
+        if module is None:
+            module = importlib.import_module(os.path.splitext(STAGE_SCRIPTS[stage_num])[0])
+            _STAGE_MODULES[stage_num] = module
+        if stage_num == 1:
+            _STAGE1_PRECINCTS.clear()
+            _STAGE1_PRECINCTS[_stage1_key(argv)] = module.main(argv)
+        elif stage_num == 2:
+            module.main(argv, precincts=_STAGE1_PRECINCTS.pop(_stage1_key(argv), None))
+        else:
+            module.main(argv)
+    except SystemExit as e:
+        return e.code in (None, 0)
+    except Exception:
+        traceback.print_exc()
+        return False
+    finally:
+        sys.stdout.flush()
+    return True
+
+
+def create_stage_pool(max_workers: int, env: dict = None) -> ProcessPoolExecutor:
+    """Create the pool of long-lived stage workers (spawned, so no state is forked)."""
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_stage_worker,
+        initargs=(env,),
+    )
+
+
+def run_stage(stage_num: int, state_code: str, extra_args: list = None, env: dict = None,
+              pool: ProcessPoolExecutor = None) -> bool:
     """
     Run a specific stage script.
     
@@ -37,27 +139,21 @@ def run_stage(stage_num: int, state_code: str, extra_args: list = None) -> bool:
         stage_num: Stage number (0-4)
         state_code: Two-letter state code
         extra_args: Additional arguments to pass to the stage script
+        env: Environment for the stage process (default: inherit)
+        pool: Worker pool to run the stage in; None runs it as a subprocess
         
     Returns:
         True if successful, False if failed
     """
-    stage_scripts = {
-        0: "run_stage0.py",
-        1: "run_stage1.py", 
-        2: "run_stage2.py",
-        3: "run_stage3_dots.py",
-        4: "run_stage4_comp.py"
-    }
-    
-    if stage_num not in stage_scripts:
-        print(f"❌ Invalid stage number: {stage_num}")
+    if stage_num not in STAGE_SCRIPTS:
+        log.error(f"❌ Invalid stage number: {stage_num}")
         return False
     
-    script_name = stage_scripts[stage_num]
-    script_path = os.path.join(os.path.dirname(__file__), script_name)
+    script_name = STAGE_SCRIPTS[stage_num]
+    script_path = os.path.join(SCRIPTS_DIR, script_name)
     
     if not os.path.exists(script_path):
-        print(f"❌ Stage script not found: {script_path}")
+        log.error(f"❌ Stage script not found: {script_path}")
         return False
     
     # Build command
@@ -65,22 +161,104 @@ def run_stage(stage_num: int, state_code: str, extra_args: list = None) -> bool:
     if extra_args:
         cmd.extend(extra_args)
     
-    print(f"\n🚀 Running Stage {stage_num}: {script_name}")
-    print(f"Command: {' '.join(cmd)}")
-    print("=" * 60)
+    log.info(f"\n🚀 Running Stage {stage_num}: {script_name}")
+    log.info(f"Command: {' '.join(cmd)}")
+    log.info("=" * 60)
     
     try:
-        result = subprocess.run(cmd, check=True, cwd=os.path.dirname(__file__))
-        print(f"✅ Stage {stage_num} completed successfully")
+        if pool is not None:
+            if not pool.submit(_run_stage_in_worker, stage_num, cmd[2:]).result():
+                log.error(f"❌ Stage {stage_num} failed")
+                return False
+        else:
+            subprocess.run(cmd, check=True, cwd=SCRIPTS_DIR, env=env)
+        log.info(f"✅ Stage {stage_num} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ Stage {stage_num} failed with exit code {e.returncode}")
+        log.error(f"❌ Stage {stage_num} failed with exit code {e.returncode}")
         return False
     except Exception as e:
-        print(f"❌ Stage {stage_num} failed with error: {e}")
+        log.error(f"❌ Stage {stage_num} failed with error: {e}")
         return False
 
 
+def parse_stages(spec: str) -> list:
+    """
+    Parse a --stages value such as "0,1,2", "1-3" or "0,2-4" into sorted stage numbers.
+    
+    Raises:
+        ValueError: If a token is malformed or names an unknown stage
+    """
+    stages = set()
+    for token in spec.split(','):
+        match = STAGE_TOKEN_RE.match(token.strip())
+        if not match:
+            raise ValueError(f"Invalid stage specification '{token.strip()}' (expected e.g. '0,2-4')")
+        start = int(match[1])
+        end = int(match[2] or match[1])
+        if start > end:
+            raise ValueError(f"Invalid stage range '{token.strip()}'")
+        stages.update(range(start, end + 1))
+    
+    unknown = sorted(stages - STAGE_SCRIPTS.keys())
+    if unknown:
+        raise ValueError(f"Unknown stage(s) {unknown}. Available stages: {sorted(STAGE_SCRIPTS)}")
+    return sorted(stages)
+
+
+def max_stage_concurrency(stages_to_run: list) -> int:
+    """Number of stages that can usefully run at once."""
+    return min(len(stages_to_run), os.cpu_count() or 1) or 1
+
+
+def run_stages_parallel(stages_to_run: list, state_code: str, stage_args: dict,
+                        env: dict = None, on_success=None, pool: ProcessPoolExecutor = None) -> int:
+    """
+    Run stages concurrently, starting each one once its dependencies succeed.
+    
+    Dependencies that are not in stages_to_run are assumed to be satisfied
+    (e.g. stage 0 skipped because the data already exists). Stages whose
+    dependencies fail are skipped. on_success(stage_num) is called before
+    any dependent of a successful stage is started.
+    
+    Returns:
+        Number of stages that completed successfully
+    """
+    pending = set(stages_to_run)
+    succeeded = set()
+    failed = set()
+    running = {}
+    
+    with ThreadPoolExecutor(max_workers=max_stage_concurrency(stages_to_run)) as executor:
+        while pending or running:
+            # Submit every stage whose dependencies are resolved
+            for stage_num in sorted(pending):
+                deps = [d for d in STAGE_DEPS.get(stage_num, []) if d in stages_to_run]
+                if any(d in failed for d in deps):
+                    log.warning(f"\n⚠️  Skipping Stage {stage_num}: depends on failed stage(s) {[d for d in deps if d in failed]}")
+                    pending.discard(stage_num)
+                    failed.add(stage_num)
+                elif all(d in succeeded for d in deps):
+                    pending.discard(stage_num)
+                    future = executor.submit(run_stage, stage_num, state_code, stage_args[stage_num], env, pool)
+                    running[future] = stage_num
+            
+            if not running:
+                break
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage_num = running.pop(future)
+                if future.result():
+                    if on_success:
+                        on_success(stage_num)
+                    succeeded.add(stage_num)
+                else:
+                    failed.add(stage_num)
+    
+    return len(succeeded)
+
+
 def main():
     """Main function that coordinates all stages."""
     # Set up argument parser
@@ -91,7 +269,7 @@ def main():
     
     parser.add_argument(
         "--stages",
-        help="Comma-separated list of stages to run (e.g., '0,1,2' or '1-3'). Default: all stages"
+        help="Comma-separated stages and ranges to run (e.g., '0,1,2', '1-3' or '0,2-4'). Default: all stages"
     )
     
     parser.add_argument(
@@ -107,6 +285,24 @@ def main():
         help="People per dot for stage 3 (default: 50)"
     )
     
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run stages one at a time in order instead of concurrently"
+    )
+    
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run every stage in a fresh Python interpreter instead of reusing worker processes"
+    )
+    
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Log progress messages and stream stage output unbuffered"
+    )
+    
     parser.add_argument(
         "--plan-year",
         type=int,
@@ -115,24 +311,27 @@ def main():
     )
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(message)s", stream=sys.stderr)
     
     # Validate state
     try:
-        state_info, state_paths = validate_state_setup(args.state)
-        print_state_info(state_info)
+        state_info, state_paths = validate_state_setup(args.state, acs_year=args.acs_year,
+                                                       census_year=args.census_year)
+        if args.verbose:
+            print_state_info(state_info)
     except Exception as e:
-        print(f"❌ State validation failed: {e}")
+        log.error(f"❌ State validation failed: {e}")
         sys.exit(1)
     
     # Determine which stages to run
     if args.stages:
-        if '-' in args.stages:
-            # Range notation (e.g., "1-3")
-            start, end = map(int, args.stages.split('-'))
-            stages_to_run = list(range(start, end + 1))
-        else:
-            # Comma-separated (e.g., "0,1,2")
-            stages_to_run = [int(s.strip()) for s in args.stages.split(',')]
+        # Lists, ranges or both (e.g., "0,1,2", "1-3", "0,2-4")
+        try:
+            stages_to_run = parse_stages(args.stages)
+        except ValueError as e:
+            log.error(f"❌ {e}")
+            sys.exit(1)
     else:
         # Default: all stages (0-4)
         stages_to_run = list(range(5))
@@ -140,79 +339,119 @@ def main():
     # Skip stage 0 if requested
     if args.skip_stage0 and 0 in stages_to_run:
         stages_to_run.remove(0)
-        print("⚠️  Skipping Stage 0 (data download) as requested")
+        log.warning("⚠️  Skipping Stage 0 (data download) as requested")
     
-    print(f"\n📋 Will run stages: {stages_to_run}")
+    log.info(f"\n📋 Will run stages: {stages_to_run}")
     
     # Prepare extra arguments for each stage
     extra_args = []
-    if args.acs_year != 2023:
+    if args.acs_year is not None:
         extra_args.extend(["--acs-year", str(args.acs_year)])
-    if args.census_year != 2020:
+    if args.census_year is not None:
         extra_args.extend(["--census-year", str(args.census_year)])
     
-    # Run each stage
-    total_stages = len(stages_to_run)
-    successful_stages = 0
-    
-    for i, stage_num in enumerate(stages_to_run, 1):
-        print(f"\n📊 Progress: Stage {stage_num} ({i}/{total_stages})")
-        
-        # Stage-specific arguments
-        stage_args = extra_args.copy()
+    # Stage-specific arguments
+    stage_args = {}
+    for stage_num in stages_to_run:
+        stage_args[stage_num] = extra_args.copy()
         
+        if stage_num == 1 and 3 in stages_to_run:  # Dots stage reads Stage 1's BG layer
+            stage_args[stage_num].append("--emit-bg")
+
         if stage_num == 3:  # Dots stage
-            stage_args.extend(["--dot-unit", str(args.dot_unit)])
+            stage_args[stage_num].extend(["--dot-unit", str(args.dot_unit)])
         
         if stage_num in [2, 4]:  # Plan stages
-            stage_args.extend(["--plan-year", str(args.plan_year)])
-        
-        success = run_stage(stage_num, args.state, stage_args)
+            stage_args[stage_num].extend(["--plan-year", str(args.plan_year)])
+    
+    # Hand the validated state setup to the stage processes so they skip re-validation
+    cache_path = os.path.join(tempfile.gettempdir(), f"politech_{state_info['abbr']}_{os.getpid()}.json")
+    write_state_cache(cache_path, state_info, state_paths)
+    stage_env = {**os.environ, STATE_CACHE_ENV: cache_path}
+    if args.verbose:
+        # Interleave stage output with ours as it happens
+        stage_env["PYTHONUNBUFFERED"] = "1"
+    
+    def refresh_state_cache(stage_num: int):
+        nonlocal state_info, state_paths
+        # Stage 0 can add new ACS/TIGER year directories, which changes auto-detection
+        if stage_num == 0:
+            # New files can land in existing acs_*/plan directories without
+            # changing the mtimes the detect cache is keyed on
+            clear_detect_cache()
+            state_info, state_paths = validate_state_setup(
+                args.state, acs_year=args.acs_year, census_year=args.census_year)
+            write_state_cache(cache_path, state_info, state_paths)
+    
+    # Run each stage
+    total_stages = len(stages_to_run)
+    successful_stages = 0
+    
+    pool = None
+    try:
+        if not args.isolate:
+            pool = create_stage_pool(1 if args.serial else max_stage_concurrency(stages_to_run), stage_env)
         
-        if success:
-            successful_stages += 1
+        if not args.serial:
+            successful_stages = run_stages_parallel(stages_to_run, args.state, stage_args,
+                                                    env=stage_env, on_success=refresh_state_cache, pool=pool)
         else:
-            print(f"\n❌ Pipeline failed at Stage {stage_num}")
-            print(f"✅ Completed {successful_stages}/{total_stages} stages successfully")
-            
-            # Ask if user wants to continue
-            try:
-                response = input("\nContinue with remaining stages? (y/N): ").lower()
-                if response != 'y':
-                    break
-            except KeyboardInterrupt:
-                print("\n\n🛑 Pipeline interrupted by user")
-                break
+            for i, stage_num in enumerate(stages_to_run, 1):
+                log.info(f"\n📊 Progress: Stage {stage_num} ({i}/{total_stages})")
+                
+                success = run_stage(stage_num, args.state, stage_args[stage_num], env=stage_env, pool=pool)
+                
+                if success:
+                    refresh_state_cache(stage_num)
+                    successful_stages += 1
+                else:
+                    log.error(f"\n❌ Pipeline failed at Stage {stage_num}")
+                    log.info(f"✅ Completed {successful_stages}/{total_stages} stages successfully")
+                    
+                    # Ask if user wants to continue
+                    try:
+                        response = input("\nContinue with remaining stages? (y/N): ").lower()
+                        if response != 'y':
+                            break
+                    except KeyboardInterrupt:
+                        log.warning("\n\n🛑 Pipeline interrupted by user")
+                        break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
     
     # Final summary
-    print("\n" + "=" * 60)
-    print("🏁 PIPELINE SUMMARY")
-    print("=" * 60)
-    print(f"State: {state_info['name']} ({args.state})")
-    print(f"Stages completed: {successful_stages}/{total_stages}")
+    log.info("\n" + "=" * 60)
+    log.info("🏁 PIPELINE SUMMARY")
+    log.info("=" * 60)
+    log.info(f"State: {state_info['name']} ({args.state})")
+    log.info(f"Stages completed: {successful_stages}/{total_stages}")
     
     if successful_stages == total_stages:
-        print("🎉 All stages completed successfully!")
-        print(f"\nOutput directory: {state_paths['output_dir']}")
-        print("\nGenerated files:")
+        log.info("🎉 All stages completed successfully!")
+        log.info(f"\nOutput directory: {state_paths['state_output_dir']}")
+        log.info("\nGenerated files:")
         
         # List key output files that should exist
-        key_files = [
-            f"{args.state.lower()}_bg_all_data_{args.acs_year}.geojson",
-            f"{args.state.lower()}_precinct_all_pop_{args.acs_year}.geojson",
-        ]
+        # (from the resolved paths: args.acs_year is None when auto-detected)
+        key_files = [state_paths["precinct_geojson"]]
         
         if 3 in stages_to_run:
-            key_files.append(f"{args.state.lower()}_dots_pop{str(args.acs_year)[-2:]}_unit{args.dot_unit}.geojson")
+            key_files.append(state_paths["bg_layer"])
+            key_files.append(state_paths["dots_geojson"].format(dot_unit=args.dot_unit))
         
-        for filename in key_files:
-            filepath = os.path.join(state_paths['output_dir'], filename)
+        for filepath in key_files:
+            filename = os.path.basename(filepath)
             if os.path.exists(filepath):
-                print(f"  ✅ {filename}")
+                log.info(f"  ✅ {filename}")
             else:
-                print(f"  ❌ {filename} (missing)")
+                log.warning(f"  ❌ {filename} (missing)")
     else:
-        print("⚠️  Some stages failed. Check the output above for details.")
+        log.warning("⚠️  Some stages failed. Check the output above for details.")
         sys.exit(1)
 
 
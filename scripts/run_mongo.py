@@ -15,6 +15,7 @@ Examples:
     python run_mongo.py AZ
     python run_mongo.py LA --mongo-uri "mongodb://localhost:27017"
     python run_mongo.py CA --database ars-mongo --dot-unit 40
+    python run_mongo.py TX --bulk-loader mongorestore
 
 Environment Variables:
     ARS_MONGO_URI: MongoDB connection string (default: mongodb://localhost:27017)
@@ -25,27 +26,62 @@ Requires:
   - Stage 1, 2, 3 outputs for the specified state
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import json
 import argparse
-from typing import Dict, List, Any
+import functools
+import importlib.util
+import shutil
+import subprocess
+import tempfile
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Any, Iterable, Iterator, Sequence, Tuple
 
-import geopandas as gpd
-from pymongo import MongoClient, GEOSPHERE
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
+# geopandas/fiona/shapely/pymongo are imported where they are used, so argument
+# parsing and the missing-files check stay fast
+if TYPE_CHECKING:
+    import geopandas as gpd
+    import numpy as np
+    from pymongo.write_concern import WriteConcern
 
 from common import (
     validate_state_setup,
     get_state_paths,
-    print_state_info
+    print_state_info,
+    find_assignment_shards
 )
 
+log = logging.getLogger(__name__)
+
+# Features per insert_many batch when streaming precincts/dots
+BATCH_SIZE = 5000
+
+# Operations per bulk_write batch when upserting plans/assignments
+UPSERT_BATCH_SIZE = 1000
+
+# Read buffer for streaming the plans/assignments JSON(L) files
+JSON_READ_BUFFER = 1 << 20
+
+
+def wire_compressors() -> str:
+    """Wire-protocol compressors to offer the server: zstd when available, else zlib."""
+    if importlib.util.find_spec("zstandard") is not None:
+        return "zstd,zlib"
+    return "zlib"
+
 
 def get_mongo_connection(mongo_uri: str, database: str = None):
     """Connect to MongoDB and return database instance."""
+    from pymongo import MongoClient
+    from pymongo.errors import ConnectionFailure
+    
     try:
-        client = MongoClient(mongo_uri, serverSelectionTimeoutMS=5000)
+        client = MongoClient(mongo_uri, serverSelectionTimeoutMS=5000, compressors=wire_compressors())
         # Test connection
         client.admin.command('ping')
         
@@ -57,102 +93,392 @@ def get_mongo_connection(mongo_uri: str, database: str = None):
             else:
                 database = "political_data"  # fallback default
         
-        print(f"✓ Connected to MongoDB at {mongo_uri}")
-        print(f"✓ Using database: {database}")
+        log.info(f"✓ Connected to MongoDB at {mongo_uri}")
+        log.info(f"✓ Using database: {database}")
         return client[database]
     except ConnectionFailure as e:
         raise ConnectionFailure(f"Failed to connect to MongoDB: {e}")
 
 
+@functools.lru_cache(maxsize=16)
+def _wgs84_transformer(crs_wkt: str):
+    """Return a lon/lat Transformer to EPSG:4326, or None if crs_wkt is already WGS84."""
+    from pyproj import CRS, Transformer
+    
+    crs = CRS.from_user_input(crs_wkt)
+    if crs.to_epsg() == 4326 or crs == CRS.from_user_input("OGC:CRS84"):
+        return None
+    return Transformer.from_crs(crs, 4326, always_xy=True)
+
+
+def to_wgs84_geometries(gdf: gpd.GeoDataFrame) -> np.ndarray:
+    """
+    Return gdf's geometries as an object array in EPSG:4326 lon/lat.
+    
+    Geometries already in WGS84 are returned as-is. Otherwise every vertex
+    is reprojected in a single batched pyproj call and written back with
+    shapely.set_coordinates, instead of building a reprojected GeoDataFrame.
+    """
+    import numpy as np
+    import shapely
+    
+    geoms = np.asarray(gdf.geometry.values, dtype=object)
+    if gdf.crs is None:
+        raise ValueError("Cannot convert geometries without a CRS to EPSG:4326")
+    
+    transformer = _wgs84_transformer(gdf.crs.to_wkt())
+    if transformer is None:
+        return geoms
+    
+    coords = shapely.get_coordinates(geoms)
+    if len(coords):
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        geoms = shapely.set_coordinates(geoms.copy(), np.column_stack([x, y]))
+    return geoms
+
+
+def property_records(gdf: gpd.GeoDataFrame) -> List[Dict[str, Any]]:
+    """
+    Return the non-geometry columns of gdf as one dict per row.
+    
+    Each column is converted to a Python list once (native ints/floats/str,
+    which BSON can encode) and the lists are zipped into dicts, avoiding
+    pandas' per-row boxing on wide precinct tables.
+    """
+    cols = [c for c in gdf.columns if c != gdf.geometry.name]
+    values = [gdf[c].tolist() for c in cols]
+    return [dict(zip(cols, row)) for row in zip(*values)] if cols else [{} for _ in range(len(gdf))]
+
+
 def geojson_to_mongodb_format(gdf: gpd.GeoDataFrame) -> List[Dict[str, Any]]:
     """
     Convert GeoDataFrame to MongoDB-ready format with GeoJSON geometries.
     
     MongoDB requires geometries in GeoJSON format for geospatial indexing.
     """
+    import shapely
+    from shapely.geometry import mapping
+    
     # Convert to WGS84 if not already
-    if gdf.crs is None or gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs("EPSG:4326")
+    geoms = to_wgs84_geometries(gdf)
+    
+    props = property_records(gdf)
+    
+    # Fast path for point layers (dots): read coordinates straight from the arrays
+    if len(geoms) and (shapely.get_type_id(geoms) == shapely.GeometryType.POINT).all() \
+            and not shapely.is_empty(geoms).any():
+        xs = shapely.get_x(geoms).tolist()
+        ys = shapely.get_y(geoms).tolist()
+        return [
+            {**record, 'geometry': {'type': 'Point', 'coordinates': [x, y]}}
+            for record, x, y in zip(props, xs, ys)
+        ]
+    
+    # Convert geometry to GeoJSON format; missing/empty geometries are masked in
+    # one batch call rather than tested row by row
+    has_geom = (~(shapely.is_missing(geoms) | shapely.is_empty(geoms))).tolist()
+    return [
+        {**record, 'geometry': mapping(geom) if ok else None}
+        for record, geom, ok in zip(props, geoms, has_geom)
+    ]
+
+
+def dots_to_mongodb_format(gdf: gpd.GeoDataFrame, dot_unit: int) -> List[Dict[str, Any]]:
+    """
+    Convert a batch of dots to MongoDB records, column by column.
     
-    records = []
-    for _, row in gdf.iterrows():
-        record = row.to_dict()
-        
-        # Convert geometry to GeoJSON format
-        if row.geometry is not None and not row.geometry.is_empty:
-            record['geometry'] = json.loads(gpd.GeoSeries([row.geometry]).to_json())['features'][0]['geometry']
-        else:
-            record['geometry'] = None
+    Dots are uniform (point, group, optional bg_geoid), so records are zipped
+    straight from the coordinate and attribute arrays with dot_unit filled in,
+    skipping the generic per-row property handling.
+    """
+    import shapely
+    
+    geoms = to_wgs84_geometries(gdf)
+    if not len(geoms):
+        return []
+    if (shapely.get_type_id(geoms) != shapely.GeometryType.POINT).any() or shapely.is_empty(geoms).any():
+        records = geojson_to_mongodb_format(gdf)
+        for record in records:
+            record['dot_unit'] = dot_unit
+        return records
+    
+    xs = shapely.get_x(geoms).tolist()
+    ys = shapely.get_y(geoms).tolist()
+    records = [
+        {'group': group, 'geometry': {'type': 'Point', 'coordinates': [x, y]}, 'dot_unit': dot_unit}
+        for group, x, y in zip(gdf['group'].tolist(), xs, ys)
+    ]
+    if 'bg_geoid' in gdf.columns:
+        for record, geoid in zip(records, gdf['bg_geoid'].tolist()):
+            record['bg_geoid'] = geoid
+    return records
+
+
+def iter_feature_batches(path: str, batch_size: int = BATCH_SIZE) -> Iterator[gpd.GeoDataFrame]:
+    """
+    Stream a vector file as GeoDataFrame batches.
+    
+    Features are read one at a time with fiona, so peak memory is bounded by
+    batch_size rather than by the size of the file.
+    """
+    import fiona
+    import geopandas as gpd
+    
+    with fiona.open(path) as src:
+        crs = src.crs_wkt or None
+        batch = []
+        for feature in src:
+            batch.append(feature)
+            if len(batch) >= batch_size:
+                yield gpd.GeoDataFrame.from_features(batch, crs=crs)
+                batch = []
+        if batch:
+            yield gpd.GeoDataFrame.from_features(batch, crs=crs)
+
+
+def cached_geopackage(path: str) -> str:
+    """
+    Return a GeoPackage copy of a GeoJSON file, (re)building it when missing or stale.
+    
+    The copy sits next to the source with a .gpkg extension and is streamed
+    feature by feature with fiona. Later reads decode binary rows from SQLite
+    instead of parsing GeoJSON text. Falls back to the original path if the
+    copy cannot be written.
+    """
+    import fiona
+    
+    gpkg_path = os.path.splitext(path)[0] + ".gpkg"
+    try:
+        if os.path.getmtime(gpkg_path) >= os.path.getmtime(path):
+            return gpkg_path
+    except OSError:
+        pass
+    
+    tmp_path = os.path.splitext(path)[0] + ".tmp.gpkg"
+    try:
+        with fiona.open(path) as src:
+            with fiona.open(tmp_path, 'w', driver='GPKG', schema=src.schema, crs_wkt=src.crs_wkt) as dst:
+                dst.writerecords(src)
+        os.replace(tmp_path, gpkg_path)
+    except Exception as e:
+        log.warning(f"⚠ Could not cache {path} as GeoPackage ({e}); reading GeoJSON")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return path
+    
+    log.info(f"  Cached GeoPackage copy: {gpkg_path}")
+    return gpkg_path
+
+
+def iter_converted_batches(path: str, workers: int = None,
+                           convert=geojson_to_mongodb_format) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Convert feature batches to MongoDB records across a process pool.
+    
+    convert turns one GeoDataFrame batch into records; it must be picklable
+    (a module-level function or a functools.partial of one).
+    
+    Batches are yielded in file order while later batches are still being
+    converted, so uploading overlaps with conversion. At most 2 * workers
+    batches are in flight to keep memory bounded.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for batch in iter_feature_batches(path):
+            yield convert(batch)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for batch in iter_feature_batches(path):
+            in_flight.append(pool.submit(convert, batch))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def mongorestore_batches(mongo_uri: str, collection, batches: Iterable[List[Dict[str, Any]]]) -> int:
+    """
+    Replace a collection by dumping record batches to a .bson file and loading it with mongorestore.
+    
+    Records are BSON-encoded as they are produced, and mongorestore streams
+    the file to the server in bulk. Returns the number of records loaded.
+    """
+    import bson
+    
+    fd, dump_path = tempfile.mkstemp(prefix=f"{collection.name}_", suffix=".bson")
+    count = 0
+    try:
+        with os.fdopen(fd, 'wb', buffering=JSON_READ_BUFFER) as f:
+            for records in batches:
+                f.writelines(bson.encode(record) for record in records)
+                count += len(records)
+                log.info(f"  ... {count:,} records encoded")
         
-        records.append(record)
+        if count:
+            subprocess.run([
+                "mongorestore", "--uri", mongo_uri,
+                "--db", collection.database.name, "--collection", collection.name,
+                "--drop", "--quiet", dump_path,
+            ], check=True)
+    finally:
+        os.remove(dump_path)
+    return count
+
+
+def load_batches(collection, batches: Iterable[List[Dict[str, Any]]], label: str,
+                 mongo_uri: str = None, write_concern: WriteConcern = None) -> int:
+    """
+    Replace the contents of a collection with the given record batches.
     
-    return records
+    With mongo_uri set the data is loaded through mongorestore, otherwise
+    existing documents are deleted and batches are sent with insert_many
+    (optionally under a different write concern). Returns the record count.
+    """
+    if mongo_uri:
+        log.info(f"[2] Converting and loading '{collection.name}' with mongorestore...")
+        return mongorestore_batches(mongo_uri, collection, batches)
+    
+    log.info(f"[2] Clearing collection '{collection.name}'...")
+    collection.delete_many({})
+    
+    log.info(f"[3] Converting and uploading in batches of {BATCH_SIZE:,}...")
+    target = collection.with_options(write_concern=write_concern) if write_concern else collection
+    uploaded = 0
+    for records in batches:
+        if records:
+            target.insert_many(records, ordered=False)
+            uploaded += len(records)
+            log.info(f"  ... {uploaded:,} {label} uploaded")
+    return uploaded
 
 
-def upload_precincts(db, state_abbr: str, precinct_file: str):
+def upload_precincts(db, state_abbr: str, precinct_file: str, workers: int = None, mongo_uri: str = None):
     """
     Upload precinct data to {state}_precincts collection.
-    Replaces existing data for the state.
+    Replaces existing data for the state. Pass mongo_uri to load through mongorestore.
     """
+    from pymongo import GEOSPHERE
+    
     collection_name = f"{state_abbr.lower()}_precincts"
     collection = db[collection_name]
     
-    print(f"\n[1] Loading precincts from: {precinct_file}")
-    precincts = gpd.read_file(precinct_file)
-    
-    print(f"[2] Converting {len(precincts)} precincts to MongoDB format...")
-    records = geojson_to_mongodb_format(precincts)
+    precinct_source = cached_geopackage(precinct_file)
+    log.info(f"\n[1] Streaming precincts from: {precinct_source}")
+    uploaded = load_batches(collection, iter_converted_batches(precinct_source, workers),
+                            "precincts", mongo_uri)
     
-    print(f"[3] Uploading to collection '{collection_name}'...")
-    # Drop existing data
-    collection.delete_many({})
-    
-    # Insert new data
-    if records:
-        collection.insert_many(records)
-        
+    if uploaded:
         # Create geospatial index on geometry field
         collection.create_index([("geometry", GEOSPHERE)])
-        print(f"✓ Uploaded {len(records)} precincts to '{collection_name}'")
+        log.info(f"✓ Uploaded {uploaded} precincts to '{collection_name}'")
     else:
-        print(f"⚠ No precinct records to upload")
+        log.warning(f"⚠ No precinct records to upload")
 
 
-def upload_dots(db, state_abbr: str, dots_file: str, dot_unit: int):
+def upload_dots(db, state_abbr: str, dots_file: str, dot_unit: int, workers: int = None,
+                mongo_uri: str = None):
     """
     Upload dot density data to {state}_dots collection.
     Overwrites existing data for the state (replaces all dots).
+    Pass mongo_uri to load through mongorestore.
     """
+    from pymongo import GEOSPHERE
+    from pymongo.write_concern import WriteConcern
+    
     collection_name = f"{state_abbr.lower()}_dots"
     collection = db[collection_name]
     
-    print(f"\n[1] Loading dots from: {dots_file}")
-    dots = gpd.read_file(dots_file)
-    
-    print(f"[2] Converting {len(dots)} dots to MongoDB format...")
-    records = geojson_to_mongodb_format(dots)
+    log.info(f"\n[1] Streaming dots from: {dots_file}")
+    convert = functools.partial(dots_to_mongodb_format, dot_unit=dot_unit)
+    # The collection is rebuilt from scratch on every run, so dot inserts
+    # skip the per-batch acknowledgement round-trip
+    uploaded = load_batches(collection, iter_converted_batches(dots_file, workers, convert),
+                            "dots", mongo_uri, write_concern=WriteConcern(w=0))
     
-    # Add dot_unit metadata to each record
-    for record in records:
-        record['dot_unit'] = dot_unit
-    
-    print(f"[3] Uploading to collection '{collection_name}' (overwriting)...")
-    # Drop all existing dots for this state
-    collection.delete_many({})
-    
-    # Insert new data
-    if records:
-        collection.insert_many(records)
-        
+    if uploaded:
         # Create geospatial index
         collection.create_index([("geometry", GEOSPHERE)])
         
         # Create index on group field for filtering
         collection.create_index("group")
         
-        print(f"✓ Uploaded {len(records)} dots (unit={dot_unit}) to '{collection_name}'")
+        log.info(f"✓ Uploaded {uploaded} dots (unit={dot_unit}) to '{collection_name}'")
     else:
-        print(f"⚠ No dot records to upload")
+        log.warning(f"⚠ No dot records to upload")
+
+
+def iter_json_records(path: str, state_abbr: str = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the objects of a top-level JSON array, optionally keeping one state.
+    
+    Parses incrementally with ijson (which uses its C yajl2 backend when
+    available), so memory stays flat regardless of file size. Numbers are
+    decoded as float rather than Decimal so the documents stay BSON-encodable.
+    """
+    import ijson
+    
+    state = state_abbr.upper() if state_abbr else None
+    with open(path, 'rb', buffering=JSON_READ_BUFFER) as f:
+        for obj in ijson.items(f, 'item', use_float=True):
+            if state is None or obj.get('state') == state:
+                yield obj
+
+
+def iter_jsonl_records(paths: Sequence[str]) -> Iterator[Dict[str, Any]]:
+    """Stream the objects of one or more JSON Lines files, one line at a time."""
+    for path in paths:
+        with open(path, 'rb', buffering=JSON_READ_BUFFER) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def bulk_upsert(collection, docs: Iterable[Dict[str, Any]], key_fields: Sequence[str]) -> Tuple[int, int, int]:
+    """
+    Upsert documents keyed on key_fields using unordered bulk_write batches.
+    
+    docs may be a lazy iterator; at most UPSERT_BATCH_SIZE operations are held
+    in memory at a time.
+    
+    Returns (doc_count, upserted_count, modified_count).
+    """
+    from pymongo import ReplaceOne
+    
+    doc_count = 0
+    upserted_count = 0
+    modified_count = 0
+    
+    def flush(ops):
+        nonlocal upserted_count, modified_count
+        result = collection.bulk_write(ops, ordered=False)
+        upserted_count += result.upserted_count
+        modified_count += result.modified_count
+    
+    ops = []
+    for doc in docs:
+        doc_count += 1
+        ops.append(ReplaceOne({k: doc[k] for k in key_fields}, doc, upsert=True))
+        if len(ops) >= UPSERT_BATCH_SIZE:
+            flush(ops)
+            ops = []
+    if ops:
+        flush(ops)
+    
+    return doc_count, upserted_count, modified_count
+
+
+def create_plan_indexes(collection):
+    """Create secondary query indexes on the 'plans' collection."""
+    collection.create_index("state")
+    collection.create_index("chamber")
+
+
+def create_assignment_indexes(collection):
+    """Create secondary query indexes on the 'assignments' collection."""
+    collection.create_index([("state", 1), ("plan_id", 1)])
+    collection.create_index("district_id")
 
 
 def upload_plans(db, plans_file: str, state_abbr: str = None):
@@ -163,98 +489,63 @@ def upload_plans(db, plans_file: str, state_abbr: str = None):
     """
     collection = db['plans']
     
-    print(f"\n[1] Loading plans from: {plans_file}")
-    with open(plans_file, 'r') as f:
-        all_plans = json.load(f)
-    
-    # Filter by state if specified
+    log.info(f"\n[1] Streaming plans from: {plans_file}")
     if state_abbr:
-        plans = [p for p in all_plans if p.get('state') == state_abbr.upper()]
-        print(f"[2] Found {len(plans)} plans for state {state_abbr.upper()}")
-    else:
-        plans = all_plans
-        print(f"[2] Found {len(plans)} total plans")
+        log.info(f"[2] Keeping plans for state {state_abbr.upper()}")
     
-    if not plans:
-        print(f"⚠ No plans to upload")
-        return
+    log.info(f"[3] Uploading to collection 'plans'...")
     
-    print(f"[3] Uploading to collection 'plans'...")
+    # Unique key index backs the upsert filter, so it must exist before writing
+    collection.create_index("plan_id", unique=True)
     
-    # Upsert plans (update if exists, insert if new)
-    uploaded_count = 0
-    updated_count = 0
+    # Upsert plans (update if exists, insert if new) as they are parsed
+    plan_count, uploaded_count, updated_count = bulk_upsert(
+        collection, iter_json_records(plans_file, state_abbr), ('plan_id',))
     
-    for plan in plans:
-        result = collection.replace_one(
-            {'plan_id': plan['plan_id']},
-            plan,
-            upsert=True
-        )
-        if result.upserted_id:
-            uploaded_count += 1
-        elif result.modified_count > 0:
-            updated_count += 1
+    if not plan_count:
+        log.warning(f"⚠ No plans to upload")
+        return
     
-    # Create index on plan_id and state
-    collection.create_index("plan_id", unique=True)
-    collection.create_index("state")
-    collection.create_index("chamber")
+    # Build query indexes once, after the data is in place
+    create_plan_indexes(collection)
     
-    print(f"✓ Plans: {uploaded_count} inserted, {updated_count} updated")
+    log.info(f"✓ Plans: {plan_count} processed, {uploaded_count} inserted, {updated_count} updated")
 
 
-def upload_assignments(db, assignments_file: str, state_abbr: str = None):
+def upload_assignments(db, assignment_shards: Sequence[str], state_abbr: str = None):
     """
     Upload assignments to 'assignments' collection.
-    Uses upsert based on {plan_id, precinct_id} to update existing assignments
-    and insert new ones. Preserves assignments for other states.
+    assignment_shards are the Stage 2 JSON Lines shards to read (see
+    find_assignment_shards). Uses upsert based on {plan_id, precinct_id} to
+    update existing assignments and insert new ones. Preserves assignments
+    for other states.
     """
     collection = db['assignments']
     
-    print(f"\n[1] Loading assignments from: {assignments_file}")
-    with open(assignments_file, 'r') as f:
-        all_assignments = json.load(f)
-    
-    # Filter by state if specified
+    log.info(f"\n[1] Streaming assignments from {len(assignment_shards)} shard(s):")
+    for shard in assignment_shards:
+        log.info(f"    {shard}")
     if state_abbr:
-        assignments = [a for a in all_assignments if a.get('state') == state_abbr.upper()]
-        print(f"[2] Found {len(assignments)} assignments for state {state_abbr.upper()}")
-    else:
-        assignments = all_assignments
-        print(f"[2] Found {len(assignments)} total assignments")
+        log.info(f"[2] Keeping assignments for state {state_abbr.upper()}")
     
-    if not assignments:
-        print(f"⚠ No assignments to upload")
-        return
+    log.info(f"[3] Upserting to collection 'assignments'...")
     
-    print(f"[3] Upserting to collection 'assignments'...")
+    # Unique key index backs the upsert filter, so it must exist before writing
+    collection.create_index([("plan_id", 1), ("precinct_id", 1)], unique=True)
     
     # Upsert assignments (update if exists, insert if new)
     # Use compound key {plan_id, precinct_id} for uniqueness
-    upserted_count = 0
-    modified_count = 0
+    assignment_count, upserted_count, modified_count = bulk_upsert(
+        collection, iter_jsonl_records(assignment_shards), ('plan_id', 'precinct_id'))
     
-    for assignment in assignments:
-        result = collection.replace_one(
-            {
-                'plan_id': assignment['plan_id'],
-                'precinct_id': assignment['precinct_id']
-            },
-            assignment,
-            upsert=True
-        )
-        if result.upserted_id:
-            upserted_count += 1
-        elif result.modified_count > 0:
-            modified_count += 1
-    
-    # Create compound indexes for efficient queries
-    collection.create_index([("state", 1), ("plan_id", 1)])
-    collection.create_index([("plan_id", 1), ("precinct_id", 1)], unique=True)
-    collection.create_index("district_id")
+    if not assignment_count:
+        log.warning(f"⚠ No assignments to upload")
+        return
     
-    print(f"✓ Assignments: {upserted_count} inserted, {modified_count} updated")
+    # Build query indexes once, after the data is in place
+    create_assignment_indexes(collection)
+    
+    log.info(f"✓ Assignments: {assignment_count} processed, {upserted_count} inserted, {modified_count} updated")
 
 
 def main():
@@ -301,6 +592,27 @@ Environment Variables:
         help="Dot unit used in Stage 3 (default: 50)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to convert precincts/dots to MongoDB format (default: CPU count)"
+    )
+    
+    parser.add_argument(
+        "--bulk-loader",
+        choices=["pymongo", "mongorestore"],
+        default="pymongo",
+        help="How to load precincts/dots: pymongo insert_many, or a BSON dump loaded with "
+             "mongorestore (falls back to pymongo if mongorestore is not on PATH)"
+    )
+    
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Log progress messages (default: warnings and errors only)"
+    )
+    
     parser.add_argument(
         "--skip-precincts",
         action="store_true",
@@ -326,30 +638,23 @@ Environment Variables:
     )
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(message)s", stream=sys.stderr)
     
     # Validate state and get configuration
     state_info, state_paths = validate_state_setup(args.state)
-    print_state_info(state_info)
+    if log.isEnabledFor(logging.INFO):
+        print_state_info(state_info)
     state_abbr = state_info["abbr"]
     
     # Get database name (from arg, env var, or None to extract from URI)
     database = args.database or os.getenv("ARS_MONGO_DB")
     
-    # Connect to MongoDB
-    print(f"\nConnecting to MongoDB...")
-    try:
-        db = get_mongo_connection(args.mongo_uri, database)
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        print("\nMake sure MongoDB is running and accessible.")
-        print("Install pymongo if needed: pip install pymongo")
-        sys.exit(1)
-    
     # Check required files
     precinct_file = state_paths["precinct_geojson"]
     dots_file = state_paths["dots_geojson"].format(dot_unit=args.dot_unit)
-    plans_file = "/Users/nikhiltejamalyala/Repositories/advproj/politech-processor/outputs/plans.json"
-    assignments_file = "/Users/nikhiltejamalyala/Repositories/advproj/politech-processor/outputs/assignments.json"
+    plans_file = state_paths["plans_json"]
+    assignment_shards = find_assignment_shards(state_abbr)
     
     missing_files = []
     if not args.skip_precincts and not os.path.exists(precinct_file):
@@ -358,54 +663,74 @@ Environment Variables:
         missing_files.append(f"Dots: {dots_file}")
     if not args.skip_plans and not os.path.exists(plans_file):
         missing_files.append(f"Plans: {plans_file}")
-    if not args.skip_assignments and not os.path.exists(assignments_file):
-        missing_files.append(f"Assignments: {assignments_file}")
+    if not args.skip_assignments and not assignment_shards:
+        missing_files.append(f"Assignments: no {state_abbr.upper()} shard in {state_paths['assignments_index']}")
     
     if missing_files:
-        print("\n✗ Missing required files:")
+        log.error("\n✗ Missing required files:")
         for mf in missing_files:
-            print(f"  - {mf}")
-        print("\nRun the appropriate stage scripts first:")
-        print(f"  python run_stage1.py {state_abbr}")
-        print(f"  python run_stage2.py {state_abbr}")
-        print(f"  python run_stage3_dots.py {state_abbr} --dot-unit {args.dot_unit}")
+            log.error(f"  - {mf}")
+        log.error("\nRun the appropriate stage scripts first:")
+        log.error(f"  python run_stage1.py {state_abbr}")
+        log.error(f"  python run_stage2.py {state_abbr}")
+        log.error(f"  python run_stage3_dots.py {state_abbr} --dot-unit {args.dot_unit}")
+        sys.exit(1)
+    
+    if args.skip_precincts and args.skip_dots and args.skip_plans and args.skip_assignments:
+        log.warning("⚠ Nothing to upload: every data type was skipped")
+        return
+    
+    # Connect to MongoDB
+    log.info(f"\nConnecting to MongoDB...")
+    try:
+        db = get_mongo_connection(args.mongo_uri, database)
+    except Exception as e:
+        log.error(f"✗ Error: {e}")
+        log.error("\nMake sure MongoDB is running and accessible.")
+        log.error("Install pymongo if needed: pip install pymongo")
         sys.exit(1)
     
+    # mongorestore is an external tool; use it only if it is installed
+    restore_uri = None
+    if args.bulk_loader == "mongorestore":
+        if shutil.which("mongorestore"):
+            restore_uri = args.mongo_uri
+        else:
+            log.warning("⚠ mongorestore not found on PATH; falling back to pymongo inserts")
+    
     # Upload data
-    print(f"\n{'='*60}")
-    print(f"Uploading data for {state_info['name']} ({state_abbr})")
-    print(f"URI: {args.mongo_uri}")
+    log.info(f"\n{'='*60}")
+    log.info(f"Uploading data for {state_info['name']} ({state_abbr})")
+    log.info(f"URI: {args.mongo_uri}")
     if database:
-        print(f"Database: {database}")
-    print(f"{'='*60}")
+        log.info(f"Database: {database}")
+    log.info(f"{'='*60}")
     
     try:
         if not args.skip_precincts:
-            upload_precincts(db, state_abbr, precinct_file)
+            upload_precincts(db, state_abbr, precinct_file, args.workers, restore_uri)
         
         if not args.skip_dots:
-            upload_dots(db, state_abbr, dots_file, args.dot_unit)
+            upload_dots(db, state_abbr, dots_file, args.dot_unit, args.workers, restore_uri)
         
         if not args.skip_plans:
             upload_plans(db, plans_file, state_abbr)
         
         if not args.skip_assignments:
-            upload_assignments(db, assignments_file, state_abbr)
+            upload_assignments(db, assignment_shards, state_abbr)
         
-        print(f"\n{'='*60}")
-        print(f"✓ Upload complete for {state_abbr}!")
-        print(f"{'='*60}")
+        log.info(f"\n{'='*60}")
+        log.info(f"✓ Upload complete for {state_abbr}!")
+        log.info(f"{'='*60}")
         
-        print(f"\nMongoDB Collections Created/Updated:")
-        print(f"  - {state_abbr.lower()}_precincts: Precinct geometries and demographics")
-        print(f"  - {state_abbr.lower()}_dots: Dot density visualization (unit={args.dot_unit})")
-        print(f"  - plans: Redistricting plans (shared across all states)")
-        print(f"  - assignments: Precinct-district assignments (shared across all states)")
+        log.info(f"\nMongoDB Collections Created/Updated:")
+        log.info(f"  - {state_abbr.lower()}_precincts: Precinct geometries and demographics")
+        log.info(f"  - {state_abbr.lower()}_dots: Dot density visualization (unit={args.dot_unit})")
+        log.info(f"  - plans: Redistricting plans (shared across all states)")
+        log.info(f"  - assignments: Precinct-district assignments (shared across all states)")
         
     except Exception as e:
-        print(f"\n✗ Error during upload: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception(f"\n✗ Error during upload: {e}")
         sys.exit(1)
 
 
@@ -31,11 +31,18 @@ Outputs:
 """
 
 import os
-import io
+import json
+import importlib.util
+import shutil
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-import geopandas as gpd
+from pyogrio import read_dataframe
 from dotenv import load_dotenv
 
 from common import (
@@ -50,16 +57,121 @@ DEFAULT_ACS_YEAR = 2023
 DEFAULT_CENSUS_YEAR = 2020
 DEFAULT_PLAN_YEAR = 2025  # TIGER vintage for CD/SLDL/SLDU downloads
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # bytes per streamed read when downloading zips
+ACS_FETCH_WORKERS = 16         # concurrent county requests to the Census API
+ACS_COUNTIES_PER_REQUEST = 25  # counties packed into one "in=" clause
+ETAG_FILE = ".etag"            # sidecar recording which remote zip an extract came from
+
+# ACS responses are large JSON arrays; decode them with orjson when it is installed
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+    json_loads = orjson.loads
+else:
+    json_loads = json.loads
+
+# One pooled session for every Census/TIGER request: keep-alive connections are
+# reused across downloads and county calls, and transient 429/5xx are retried
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["GET", "HEAD"]),
+))
+
+# Attribute columns Stage 0 actually uses from the TIGER layers
+BG_COLUMNS = ["STATEFP", "COUNTYFP"]
+TABBLOCK20_COLUMNS = ["GEOID20"]
+
+# Non-Hispanic race groups, in output column order
+RACE_KEYS = ("WHT", "BLK", "AIA", "ASN", "HPI", "OTH", "2OM")
+
 # ---------------------- Download helpers ----------------------
 
+def _remote_version(headers) -> str:
+    """Identify a remote file version from its ETag (or Last-Modified) header."""
+    return headers.get("ETag") or headers.get("Last-Modified") or ""
+
+
+def _extract_is_current(url: str, out_dir: str) -> bool:
+    """True if out_dir already holds a shapefile extracted from the current version of url."""
+    try:
+        with open(os.path.join(out_dir, ETAG_FILE)) as f:
+            cached_url, cached_version = f.read().split("\n", 1)
+    except (OSError, ValueError):
+        return False
+    if cached_url != url or not cached_version:
+        return False
+    if not any(f.lower().endswith(".shp") for f in os.listdir(out_dir)):
+        return False
+    try:
+        head = SESSION.head(url, allow_redirects=True, timeout=30)
+    except requests.RequestException:
+        return False
+    return head.ok and _remote_version(head.headers) == cached_version
+
+
+def _stream_extract(resp, out_dir: str):
+    """Extract zip members while the response is still downloading (needs stream-unzip)."""
+    from stream_unzip import stream_unzip
+
+    root = os.path.realpath(out_dir)
+    for name, _size, chunks in stream_unzip(resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)):
+        name = name.decode("utf-8", errors="replace")
+        dest = os.path.realpath(os.path.join(root, name))
+        if name.endswith("/") or os.path.commonpath([root, dest]) != root:
+            for _ in chunks:  # directory entry or unsafe path: drain and skip
+                pass
+            continue
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        with open(dest, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+
+def _download_then_extract(resp, out_dir: str):
+    """Stream the zip to a temporary file, then extract it."""
+    tmp = tempfile.NamedTemporaryFile(dir=out_dir, suffix=".zip", delete=False)
+    try:
+        with tmp:
+            # Copy socket -> file in large blocks without a per-chunk Python loop
+            resp.raw.decode_content = True
+            shutil.copyfileobj(resp.raw, tmp, DOWNLOAD_CHUNK_SIZE)
+
+        with open(tmp.name, "rb") as f:
+            if hasattr(os, "posix_fadvise"):
+                # Extraction reads the file front to back: ask for aggressive readahead
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with zipfile.ZipFile(f) as zf:
+                zf.extractall(out_dir)
+    finally:
+        os.unlink(tmp.name)
+
+
 def download_and_unzip(url: str, out_dir: str) -> str:
-    """Download a TIGER zip file and extract into out_dir."""
+    """
+    Download a TIGER zip file and extract into out_dir.
+    The zip is never held in memory: with stream-unzip installed, members are
+    extracted as the bytes arrive; otherwise it is streamed to a temporary file.
+    Skips the download when out_dir already holds this zip's current version
+    (tracked by ETag/Last-Modified in an .etag sidecar).
+    """
+    if _extract_is_current(url, out_dir):
+        print(f"Up to date, skipping download: {url}")
+        return out_dir
+
     print(f"Downloading {url}")
-    resp = requests.get(url, stream=True, timeout=120)
-    resp.raise_for_status()
+    with SESSION.get(url, stream=True, timeout=120) as resp:
+        resp.raise_for_status()
+        version = _remote_version(resp.headers)
+        if importlib.util.find_spec("stream_unzip") is not None:
+            _stream_extract(resp, out_dir)
+        else:
+            _download_then_extract(resp, out_dir)
 
-    with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
-        zf.extractall(out_dir)
+    if version:
+        with open(os.path.join(out_dir, ETAG_FILE), "w") as f:
+            f.write(f"{url}\n{version}")
 
     print(f"Extracted to {out_dir}")
     return out_dir
@@ -71,7 +183,7 @@ def url_exists(url: str) -> bool:
     HEAD sometimes fails on some hosts; fall back to a tiny GET.
     """
     try:
-        r = requests.head(url, allow_redirects=True, timeout=30)
+        r = SESSION.head(url, allow_redirects=True, timeout=30)
         if r.status_code == 200:
             return True
         if r.status_code in (403, 405):  # HEAD not allowed; fall back
@@ -79,7 +191,7 @@ def url_exists(url: str) -> bool:
         return False
     except Exception:
         try:
-            r = requests.get(url, stream=True, timeout=30)
+            r = SESSION.get(url, stream=True, timeout=30)
             ok = (r.status_code == 200)
             r.close()
             return ok
@@ -89,8 +201,17 @@ def url_exists(url: str) -> bool:
 
 # ---------------------- TIGER geometry (BG/blocks) ----------------------
 
-def get_tabblock20_shapefile(state_abbr: str, state_fips: str, census_year: int, tiger_dir: str) -> gpd.GeoDataFrame:
-    """Return GeoDataFrame for 2020 tabulation blocks (PL geometry base)."""
+def dbf_sidecar(shp_path: str) -> str:
+    """Return the .dbf attribute table next to a shapefile, or the .shp itself if there is none."""
+    dbf_path = os.path.splitext(shp_path)[0] + ".dbf"
+    return dbf_path if os.path.exists(dbf_path) else shp_path
+
+
+def get_tabblock20_shapefile(state_abbr: str, state_fips: str, census_year: int, tiger_dir: str) -> pd.DataFrame:
+    """
+    Download 2020 tabulation blocks (PL geometry base) and return their attributes.
+    Geometry is left on disk for later stages; Stage 0 only reports the count.
+    """
     target_dir = os.path.join(tiger_dir, f"{state_abbr}_tabblock20")
     os.makedirs(target_dir, exist_ok=True)
 
@@ -102,14 +223,18 @@ def get_tabblock20_shapefile(state_abbr: str, state_fips: str, census_year: int,
     shp = [f for f in os.listdir(target_dir) if f.lower().endswith(".shp")][0]
     shp_path = os.path.join(target_dir, shp)
 
-    print(f"Loading blocks from {shp_path}")
-    gdf = gpd.read_file(shp_path)
-    print("Blocks:", len(gdf))
-    return gdf
+    print(f"Loading block attributes from {shp_path}")
+    blocks = read_dataframe(dbf_sidecar(shp_path), columns=TABBLOCK20_COLUMNS, read_geometry=False)
+    print("Blocks:", len(blocks))
+    return blocks
 
 
-def get_bg_shapefile(state_abbr: str, state_fips: str, census_year: int, tiger_dir: str) -> gpd.GeoDataFrame:
-    """Return GeoDataFrame for 2020 block groups (BG geometry base)."""
+def get_bg_shapefile(state_abbr: str, state_fips: str, census_year: int, tiger_dir: str) -> pd.DataFrame:
+    """
+    Download 2020 block groups (BG geometry base) and return their attributes.
+    Stage 0 only needs STATEFP/COUNTYFP to drive the ACS requests, so polygons
+    are not decoded here; Stage 1 reads the geometry from the shapefile.
+    """
     target_dir = os.path.join(tiger_dir, f"{state_abbr}_bg")
     os.makedirs(target_dir, exist_ok=True)
 
@@ -121,22 +246,51 @@ def get_bg_shapefile(state_abbr: str, state_fips: str, census_year: int, tiger_d
     shp = [f for f in os.listdir(target_dir) if f.lower().endswith(".shp")][0]
     shp_path = os.path.join(target_dir, shp)
 
-    print(f"Loading block groups from {shp_path}")
-    gdf = gpd.read_file(shp_path)
-    print("Block groups:", len(gdf))
-    return gdf
+    print(f"Loading block group attributes from {shp_path}")
+    bg = read_dataframe(dbf_sidecar(shp_path), columns=BG_COLUMNS, read_geometry=False)
+    print("Block groups:", len(bg))
+    return bg
 
 
 # ---------------------- ACS pulling ----------------------
 
+def write_acs_csv(df: pd.DataFrame, path: str):
+    """
+    Write an ACS table to CSV, using pyarrow's C++ CSV writer when pyarrow is installed.
+    Either writer produces a file Stage 1 reads the same way with pd.read_csv.
+    """
+    if importlib.util.find_spec("pyarrow") is None:
+        df.to_csv(path, index=False)
+        return
+
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
+def acs_values_to_float(df: pd.DataFrame) -> np.ndarray:
+    """
+    Convert ACS string values to float64 in one NumPy cast.
+    Missing values come back as None, "" or "-" and become NaN; anything else
+    unparseable falls back to pandas' per-column coercion.
+    """
+    vals = df.to_numpy(dtype=object)
+    vals[(vals == None) | (vals == "") | (vals == "-")] = "nan"  # noqa: E711 (elementwise)
+    try:
+        return vals.astype(np.float64)
+    except (TypeError, ValueError):
+        return df.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+
+
 def fetch_acs_blockgroups_for_state(
-    bg_gdf: gpd.GeoDataFrame,
+    bg: pd.DataFrame,
     year: int,
     variables: list[str],
     census_api_key: str,
 ) -> pd.DataFrame:
     """
     Fetch ACS 5-year data at block-group level for this state.
+    bg only needs the STATEFP/COUNTYFP attribute columns (no geometry).
     We loop counties:
       for=block group:*&in=state:04 county:001
     """
@@ -144,37 +298,58 @@ def fetch_acs_blockgroups_for_state(
         raise RuntimeError("CENSUS_API_KEY is missing. Put it in your environment or .env file.")
 
     base_url = f"https://api.census.gov/data/{year}/acs/acs5"
-    counties = sorted(bg_gdf["COUNTYFP"].unique())
-    state_fips = bg_gdf["STATEFP"].iloc[0]
-
-    rows = []
-    var_str = ",".join(["GEO_ID"] + variables)
-
-    for c in counties:
-        params = {
-            "get": var_str,
-            "for": "block group:*",
-            "in": f"state:{state_fips} county:{c}",
-            "key": census_api_key,
-        }
-        print(f"  Fetching county {c} ...")
-        resp = requests.get(base_url, params=params, timeout=120)
+    counties = sorted(bg["COUNTYFP"].unique())
+    state_fips = bg["STATEFP"].iloc[0]
+
+    header = ["GEO_ID"] + variables
+    var_str = ",".join(header)
+
+    # Request parameters are built once; each request only overrides "in"
+    params_template = {
+        "get": var_str,
+        "for": "block group:*",
+        "key": census_api_key,
+    }
+    # Several counties per request ("county:001,003,...") to cut round-trips
+    county_batches = [
+        counties[i:i + ACS_COUNTIES_PER_REQUEST] for i in range(0, len(counties), ACS_COUNTIES_PER_REQUEST)
+    ]
+
+    def fetch(in_clause):
+        params = params_template.copy()
+        params["in"] = in_clause
+        resp = SESSION.get(base_url, params=params, timeout=120)
         resp.raise_for_status()
-        data = resp.json()
-        header = data[0]
-        for row in data[1:]:
-            rows.append(dict(zip(header, row)))
+        print(f"  Fetched {in_clause}")
+        data = json_loads(resp.content)
+        # Columnar frame straight from the JSON rows (first row is the header)
+        return pd.DataFrame(data[1:], columns=data[0])
 
-    df = pd.DataFrame(rows)
+    # Batches are independent requests: fetch them concurrently over pooled connections
+    def fetch_batch(batch):
+        try:
+            return fetch(f"state:{state_fips} county:{','.join(batch)}")
+        except requests.HTTPError as e:
+            if len(batch) == 1 or e.response is None or e.response.status_code != 400:
+                raise
+            # API rejected the county list: fall back to one request per county
+            return pd.concat([fetch(f"state:{state_fips} county:{c}") for c in batch], ignore_index=True)
+
+    print(f"  Fetching {len(counties)} counties in {len(county_batches)} request(s) "
+          f"({ACS_FETCH_WORKERS} at a time) ...")
+    with ThreadPoolExecutor(max_workers=ACS_FETCH_WORKERS) as ex:
+        county_dfs = list(ex.map(fetch_batch, county_batches))
+
+    df = pd.concat(county_dfs, ignore_index=True) if county_dfs else pd.DataFrame(columns=header)
     df["GEOID"] = df["GEO_ID"].str[-12:]  # BG GEOID (12 digits)
 
-    for v in variables:
-        df[v] = pd.to_numeric(df[v], errors="coerce")
+    # Single numeric conversion pass over all variable columns
+    df[variables] = acs_values_to_float(df[variables])
 
     return df
 
 
-def process_race_data(bg_gdf: gpd.GeoDataFrame, acs_year: int, census_api_key: str, acs_dir: str, state_abbr: str) -> str:
+def process_race_data(bg: pd.DataFrame, acs_year: int, census_api_key: str, acs_dir: str, state_abbr: str) -> str:
     race_vars = [
         "B03002_001E",  # total
         "B03002_003E",  # NH white
@@ -187,7 +362,7 @@ def process_race_data(bg_gdf: gpd.GeoDataFrame, acs_year: int, census_api_key: s
         "B03002_012E",  # Hispanic
     ]
     print("\n=== Fetching ACS race (B03002) ===")
-    df_race = fetch_acs_blockgroups_for_state(bg_gdf, acs_year, race_vars, census_api_key)
+    df_race = fetch_acs_blockgroups_for_state(bg, acs_year, race_vars, census_api_key)
 
     year_suffix = str(acs_year)[-2:]
 
@@ -202,33 +377,31 @@ def process_race_data(bg_gdf: gpd.GeoDataFrame, acs_year: int, census_api_key: s
         "B03002_009E": f"2OM_NHSP{year_suffix}",
         "B03002_012E": f"HSP_POP{year_suffix}",
     })
-
-    # POP-style fields
-    for k in ["WHT", "BLK", "AIA", "ASN", "HPI", "OTH", "2OM"]:
-        df_race[f"{k}_POP{year_suffix}"] = df_race[f"{k}_NHSP{year_suffix}"]
-
-    df_race[f"NHSP_POP{year_suffix}"] = (
-        df_race[f"WHT_POP{year_suffix}"] + df_race[f"BLK_POP{year_suffix}"] + df_race[f"AIA_POP{year_suffix}"] +
-        df_race[f"ASN_POP{year_suffix}"] + df_race[f"HPI_POP{year_suffix}"] + df_race[f"OTH_POP{year_suffix}"] +
-        df_race[f"2OM_POP{year_suffix}"]
-    )
-    df_race[f"TOT_POP{year_suffix}"] = df_race[f"HSP_POP{year_suffix}"] + df_race[f"NHSP_POP{year_suffix}"]
-
-    race_keep = [
-        "GEOID",
-        f"TOT_POP{year_suffix}", f"HSP_POP{year_suffix}", f"NHSP_POP{year_suffix}",
-        f"WHT_POP{year_suffix}", f"BLK_POP{year_suffix}", f"AIA_POP{year_suffix}", f"ASN_POP{year_suffix}",
-        f"HPI_POP{year_suffix}", f"OTH_POP{year_suffix}", f"2OM_POP{year_suffix}",
-    ]
+    # The API total is not written out (TOT_POP is re-derived below); drop it now
+    df_race.drop(columns=[f"TOT_POP{year_suffix}_RAW"], inplace=True)
+
+    # Column names, built once
+    nhsp_cols = [f"{k}_NHSP{year_suffix}" for k in RACE_KEYS]
+    pop_cols = [f"{k}_POP{year_suffix}" for k in RACE_KEYS]
+    tot_col, hsp_col, nhsp_pop_col = (f"TOT_POP{year_suffix}", f"HSP_POP{year_suffix}", f"NHSP_POP{year_suffix}")
+
+    # POP-style fields: sum the NH race columns, then rename them to *_POP (no copies).
+    # Both derived totals come from one contiguous float64 block in plain NumPy.
+    nhsp_pop = df_race[nhsp_cols].to_numpy(dtype=np.float64).sum(axis=1)
+    df_race[nhsp_pop_col] = nhsp_pop
+    df_race[tot_col] = df_race[hsp_col].to_numpy(dtype=np.float64) + nhsp_pop
+    df_race.rename(columns=dict(zip(nhsp_cols, pop_cols)), inplace=True)
+
+    race_keep = ["GEOID", tot_col, hsp_col, nhsp_pop_col] + pop_cols
     df_race_out = df_race[race_keep]
 
     race_csv_path = os.path.join(acs_dir, f"{state_abbr}_bg_race_{acs_year}.csv")
-    df_race_out.to_csv(race_csv_path, index=False)
+    write_acs_csv(df_race_out, race_csv_path)
     print(f"Saved ACS race BG file: {race_csv_path}")
     return race_csv_path
 
 
-def process_income_data(bg_gdf: gpd.GeoDataFrame, acs_year: int, census_api_key: str, acs_dir: str, state_abbr: str) -> str:
+def process_income_data(bg: pd.DataFrame, acs_year: int, census_api_key: str, acs_dir: str, state_abbr: str) -> str:
     income_vars = [
         "B19001_001E",
         "B19001_002E", "B19001_003E", "B19001_004E", "B19001_005E",
@@ -237,7 +410,7 @@ def process_income_data(bg_gdf: gpd.GeoDataFrame, acs_year: int, census_api_key:
         "B19001_014E", "B19001_015E", "B19001_016E", "B19001_017E",
     ]
     print("\n=== Fetching ACS income (B19001) ===")
-    df_inc = fetch_acs_blockgroups_for_state(bg_gdf, acs_year, income_vars, census_api_key)
+    df_inc = fetch_acs_blockgroups_for_state(bg, acs_year, income_vars, census_api_key)
 
     year_suffix = str(acs_year)[-2:]
 
@@ -265,7 +438,7 @@ def process_income_data(bg_gdf: gpd.GeoDataFrame, acs_year: int, census_api_key:
     df_inc_out = df_inc[inc_keep]
 
     inc_csv_path = os.path.join(acs_dir, f"{state_abbr}_bg_income_{acs_year}.csv")
-    df_inc_out.to_csv(inc_csv_path, index=False)
+    write_acs_csv(df_inc_out, inc_csv_path)
     print(f"Saved ACS income BG file: {inc_csv_path}")
     return inc_csv_path
 
@@ -294,12 +467,19 @@ def download_plans_for_state(project_inputs_dir: str, state_abbr: str, state_fip
     print(f"\n=== Downloading TIGER{plan_year} plans (official boundaries) ===")
 
     # ---- CD: needs a cd### tag; probe a few candidates ----
+    # Candidates are newest-first; probe them all at once and take the newest that exists
     cd_candidates = ["cd119", "cd118", "cd117", "cd116", "cd115", "cd114", "cd113"]
+    cd_urls = [
+        f"https://www2.census.gov/geo/tiger/TIGER{plan_year}/CD/tl_{plan_year}_{state_fips}_{tag}.zip"
+        for tag in cd_candidates
+    ]
+    with ThreadPoolExecutor(max_workers=len(cd_urls)) as ex:
+        cd_exists = list(ex.map(url_exists, cd_urls))
+
     cd_found = None
-    for tag in cd_candidates:
+    for tag, exists in zip(cd_candidates, cd_exists):
         zip_name = f"tl_{plan_year}_{state_fips}_{tag}.zip"
-        url = f"https://www2.census.gov/geo/tiger/TIGER{plan_year}/CD/{zip_name}"
-        if url_exists(url):
+        if exists:
             cd_found = tag
             cd_out_dir = os.path.join(plans_base, f"{state_abbr}_cong_adopted_{plan_year}_{tag}")
             os.makedirs(cd_out_dir, exist_ok=True)
@@ -336,7 +516,7 @@ def download_plans_for_state(project_inputs_dir: str, state_abbr: str, state_fip
 
 # ---------------------- main ----------------------
 
-def main():
+def main(argv=None):
     parser = setup_argument_parser(
         description="Download TIGER shapefiles, ACS data, and optional TIGER plans for any US state.",
         stage_name="Stage 0"
@@ -344,7 +524,7 @@ def main():
     # Extend your existing parser with plan knobs
     parser.add_argument("--plan-year", type=int, default=DEFAULT_PLAN_YEAR, help="TIGER vintage for plans (CD/SLDL/SLDU).")
     parser.add_argument("--skip-plans", action="store_true", help="Skip downloading TIGER plans.")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     acs_year = args.acs_year if args.acs_year else DEFAULT_ACS_YEAR
     census_year = args.census_year if args.census_year else DEFAULT_CENSUS_YEAR
@@ -375,20 +555,24 @@ def main():
     print(f"\n=== Preparing inputs for {state_info['name']} ===")
     print(f"Using ACS year: {acs_year}, Census year: {census_year}, Plan (TIGER) year: {plan_year}\n")
 
-    # 1) Get BG & TABBLOCK shapefiles
+    # 1) BG shapefile first: its counties drive the ACS requests
     bg = get_bg_shapefile(state_abbr, state_fips, census_year, state_paths["tiger_dir"])
-    _ = get_tabblock20_shapefile(state_abbr, state_fips, census_year, state_paths["tiger_dir"])
-
     print("BG unique STATEFP:", bg["STATEFP"].unique())
 
-    # 2) Process ACS race + income
-    race_csv_path = process_race_data(bg, acs_year, census_api_key, state_paths["acs_dir"], state_abbr)
-    inc_csv_path = process_income_data(bg, acs_year, census_api_key, state_paths["acs_dir"], state_abbr)
+    # Tabblock + plan downloads don't depend on ACS; run them alongside it
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        tab_fut = ex.submit(get_tabblock20_shapefile, state_abbr, state_fips, census_year, state_paths["tiger_dir"])
+        # 3) Optional: plans
+        plan_fut = None
+        if not args.skip_plans:
+            plan_fut = ex.submit(download_plans_for_state, project_inputs_dir, state_abbr, state_fips, plan_year)
+
+        # 2) Process ACS race + income
+        race_csv_path = process_race_data(bg, acs_year, census_api_key, state_paths["acs_dir"], state_abbr)
+        inc_csv_path = process_income_data(bg, acs_year, census_api_key, state_paths["acs_dir"], state_abbr)
 
-    # 3) Optional: plans
-    plans_result = None
-    if not args.skip_plans:
-        plans_result = download_plans_for_state(project_inputs_dir, state_abbr, state_fips, plan_year)
+        tab_fut.result()
+        plans_result = plan_fut.result() if plan_fut else None
 
     # Summary
     print("\nDone. You now have:")
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Stage 1: Build precinct-level demographics from block-group ACS + CVAP using maup.
+Stage 1: Build precinct-level demographics from block-group ACS + CVAP.
 
 This script aggregates demographic data from Census block groups to election precincts
 for any US state using area-weighted interpolation.
@@ -12,9 +12,10 @@ Examples:
     python run_stage1.py AZ
     python run_stage1.py CA --acs-year 2022
     python run_stage1.py TX --acs-year 2023
+    python run_stage1.py AZ --emit-bg   # also write the BG layer needed by Stage 3
 
 Outputs:
-  outputs/<state>/<state>_bg_all_data_<year>.geojson
+  outputs/<state>/<state>_bg_all_data_<year>.fgb  (only with --emit-bg)
   outputs/<state>/<state>_precinct_all_pop_<year>.geojson
   outputs/<state>/<state>_population_comparison_<year>.csv
   outputs/<state>/<state>_cvap_comparison_<year>.csv
@@ -22,9 +23,16 @@ Outputs:
 """
 
 import os
+import importlib.util
+import numpy as np
 import pandas as pd
 import geopandas as gpd
-import maup
+import shapely
+from scipy import sparse
+
+# pyogrio batches GDAL reads/writes instead of going feature-by-feature through Fiona
+gpd.options.io_engine = "pyogrio"
+
 from common import (
     setup_argument_parser,
     validate_state_setup,
@@ -39,6 +47,23 @@ from common import (
 OUTPUT_CRS = "EPSG:4326"
 WORK_CRS = "EPSG:5070"   # NAD83 / Conus Albers (good for area/weights)
 
+# pyarrow (optional) speeds up CSV parsing and lets pyogrio hand back Arrow batches
+# (the per-state GEOID CSVs stay on the C engine, see read_bg_csv)
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+CSV_ENGINE = "pyarrow" if HAS_PYARROW else "c"
+
+# Column base names; the ACS year suffix is appended (e.g. 'HSP_POP' -> 'HSP_POP23').
+# The Hispanic column comes first, the non-Hispanic groups it is summed against follow.
+RACE_BASES = ("HSP_POP", "WHT_POP", "BLK_POP", "AIA_POP", "ASN_POP", "HPI_POP", "OTH_POP", "2OM_POP")
+CVAP_BASES = ("HSP_CVAP", "WHT_CVAP", "BLK_CVAP", "AIA_CVAP", "ASN_CVAP", "HPI_CVAP", "2OM_CVAP")
+INCOME_BASES = (
+    "LESS_10K", "10K_15K", "15K_20K", "20K_25K", "25K_30K", "30K_35K", "35K_40K", "40K_45K",
+    "45K_50K", "50K_60K", "60K_75K", "75K_100K", "100_125K", "125_150K", "150_200K", "200K_MOR",
+)
+
+# CVAP LNNUMBER codes used below (see load_cvap_blockgroups)
+CVAP_LNNUMBERS = [1, 3, 4, 5, 6, 7, 13, 8, 9, 10, 11, 12]
+
 
 def get_column_name(base_name: str, year: int) -> str:
     """Generate column name with year suffix (e.g., 'HSP_POP' -> 'HSP_POP23')"""
@@ -66,42 +91,74 @@ def make_bg_geoid(df: gpd.GeoDataFrame) -> pd.Series:
     ]
     for cols in candidates:
         if all(c in df.columns for c in cols):
-            state = df[cols[0]].astype(str).str.zfill(2)
-            county = df[cols[1]].astype(str).str.zfill(3)
-            tract = df[cols[2]].astype(str).str.zfill(6)
-            bg = df[cols[3]].astype(str).str.zfill(1)
-            return state + county + tract + bg
+            # Pad and concatenate whole NumPy string arrays instead of per-row .str calls
+            parts = [
+                np.char.zfill(df[col].to_numpy().astype(str), width)
+                for col, width in zip(cols, (2, 3, 6, 1))
+            ]
+            geoid = parts[0]
+            for part in parts[1:]:
+                geoid = np.char.add(geoid, part)
+            return pd.Series(geoid, index=df.index, dtype=object)
 
     raise RuntimeError(
         "Could not construct BG GEOID – check column names in the TIGER BG shapefile."
     )
 
 
+def last_chars(values: pd.Series, n: int) -> np.ndarray:
+    """
+    Return the last n characters of each string as a fixed-width NumPy array.
+
+    Equal-length strings are sliced as a 2-D character view in one vectorized
+    copy; ragged input falls back to pandas .str slicing.
+    """
+    arr = values.to_numpy(dtype=str)
+    width = arr.dtype.itemsize // 4  # NumPy "U" strings are UCS-4
+    if width >= n and (np.char.str_len(arr) == width).all():
+        chars = arr.view("U1").reshape(len(arr), width)[:, width - n:]
+        return np.ascontiguousarray(chars).view(f"U{n}").ravel()
+    return values.str[-n:].to_numpy(dtype=str)
+
+
 def load_bg_geometry(bg_shapefile: str) -> gpd.GeoDataFrame:
     """Load and prepare block group geometry."""
     print(f"Loading TIGER BG shapefile: {bg_shapefile}")
-    bg = gpd.read_file(bg_shapefile)
+    bg = gpd.read_file(bg_shapefile, engine="pyogrio", use_arrow=HAS_PYARROW)
     bg["GEOID"] = make_bg_geoid(bg)
     bg = bg.to_crs(WORK_CRS)
     print(f"Loaded {len(bg)} block groups")
     return bg
 
 
+def read_bg_csv(path: str) -> pd.DataFrame:
+    """
+    Read a Stage 0 block-group CSV with GEOID kept as a 12-character string.
+
+    Uses the C engine: the pyarrow engine infers GEOID as int64 before
+    applying dtype, which drops the leading zero of states with FIPS < 10.
+    """
+    df = pd.read_csv(path, dtype={"GEOID": str}, engine="c")
+    geoid_lengths = df["GEOID"].str.len()
+    if not geoid_lengths.eq(12).all():
+        bad = df.loc[geoid_lengths.ne(12), "GEOID"].iloc[0]
+        raise RuntimeError(f"{path}: GEOID '{bad}' is not a 12-character block group GEOID")
+    return df
+
+
 def load_acs_race(acs_race_csv: str) -> pd.DataFrame:
     """Load ACS race data."""
     print(f"Loading ACS race BG CSV: {acs_race_csv}")
-    df = pd.read_csv(acs_race_csv, dtype={"GEOID": str})
-    return df
+    return read_bg_csv(acs_race_csv)
 
 
 def load_acs_income(acs_income_csv: str) -> pd.DataFrame:
     """Load ACS income data."""
     print(f"Loading ACS income BG CSV: {acs_income_csv}")
-    df = pd.read_csv(acs_income_csv, dtype={"GEOID": str})
-    return df
+    return read_bg_csv(acs_income_csv)
 
 
-def load_cvap_blockgroups(cvap_csv: str, acs_year: int) -> pd.DataFrame:
+def load_cvap_blockgroups(cvap_csv: str, acs_year: int, state_fips: str) -> pd.DataFrame:
     """
     Read national BlockGr.csv and build CVAP columns at BG level for this state.
 
@@ -116,61 +173,145 @@ def load_cvap_blockgroups(cvap_csv: str, acs_year: int) -> pd.DataFrame:
       13 = Hispanic or Latino
     """
     print(f"Loading CVAP BlockGr CSV: {cvap_csv}")
-    cvap = pd.read_csv(cvap_csv, dtype={"geoid": str}, encoding="latin1")
-    cvap["STATEFP"] = cvap["geoid"].str[9:11]
-    cvap["GEOID"] = cvap["geoid"].str[-12:]
-
-    # Pivot so we have one row per GEOID with columns = LNNUMBER
-    pivot = cvap.pivot_table(
-        index="GEOID",
-        columns="lnnumber",
-        values="cvap_est",
-        aggfunc="first",
-    ).fillna(0)
-
-    out = pd.DataFrame(index=pivot.index)
-    out[get_column_name("TOT_CVAP", acs_year)] = pivot.get(1, 0)
-    out[get_column_name("HSP_CVAP", acs_year)] = pivot.get(13, 0)
-    out[get_column_name("WHT_CVAP", acs_year)] = pivot.get(7, 0)
-    out[get_column_name("BLK_CVAP", acs_year)] = pivot.get(5, 0)
-    out[get_column_name("AIA_CVAP", acs_year)] = pivot.get(3, 0)
-    out[get_column_name("ASN_CVAP", acs_year)] = pivot.get(4, 0)
-    out[get_column_name("HPI_CVAP", acs_year)] = pivot.get(6, 0)
-
-    multi_cols = [c for c in [8, 9, 10, 11, 12] if c in pivot.columns]
-    if multi_cols:
-        out[get_column_name("2OM_CVAP", acs_year)] = pivot[multi_cols].sum(axis=1)
-    else:
-        out[get_column_name("2OM_CVAP", acs_year)] = 0
+    cvap = pd.read_csv(
+        cvap_csv,
+        usecols=["geoid", "lnnumber", "cvap_est"],
+        dtype={"geoid": str},
+        encoding="latin1",
+        engine=CSV_ENGINE,
+    )
+
+    # geoid is "1500000US" + 12-digit BG GEOID; slice it once and keep only this
+    # state's rows (GEOID starts with the state FIPS) before pivoting the national file
+    geoids = last_chars(cvap["geoid"], 12)
+    in_state = geoids.astype("U2") == state_fips
+    cvap = cvap.loc[in_state].assign(GEOID=geoids[in_state])
+
+    # One row per GEOID with columns = LNNUMBER; reindex guarantees every code exists
+    pivot = (
+        cvap.groupby(["GEOID", "lnnumber"])["cvap_est"]
+        .first()
+        .unstack(fill_value=0)
+        .reindex(columns=CVAP_LNNUMBERS, fill_value=0)
+        .fillna(0)
+    )
+
+    out = pd.DataFrame({
+        get_column_name("TOT_CVAP", acs_year): pivot[1],
+        get_column_name("HSP_CVAP", acs_year): pivot[13],
+        get_column_name("WHT_CVAP", acs_year): pivot[7],
+        get_column_name("BLK_CVAP", acs_year): pivot[5],
+        get_column_name("AIA_CVAP", acs_year): pivot[3],
+        get_column_name("ASN_CVAP", acs_year): pivot[4],
+        get_column_name("HPI_CVAP", acs_year): pivot[6],
+        get_column_name("2OM_CVAP", acs_year): pivot[[8, 9, 10, 11, 12]].sum(axis=1),
+    }, index=pivot.index)
 
     out = out.reset_index()  # bring GEOID back as column
     return out
 
 
-def aggregate_bg_to_precincts(bg: gpd.GeoDataFrame,
-                              precincts: gpd.GeoDataFrame,
-                              columns: list[str],
-                              label: str):
+def centroid_tree(gdf: gpd.GeoDataFrame) -> shapely.STRtree:
+    """STRtree over a layer's centroids, reusable across assign_bulk/assign_positions calls."""
+    return shapely.STRtree(np.asarray(gdf.geometry.centroid.values))
+
+
+def assign_by_overlap(source_geoms: np.ndarray, target_geoms: np.ndarray) -> np.ndarray:
     """
-    Use maup.assign to aggregate BG columns -> precincts.
-    Returns (precincts_with_values, comparison_df).
+    Position of the target with the largest intersection area for each source
+    (maup.assign's rule), or -1 where nothing overlaps.
+
+    One STRtree query yields every intersecting (source, target) pair; their
+    overlap areas are computed in one batch and the largest per source is
+    picked with a lexsort instead of per-geometry DataFrame bookkeeping.
     """
-    print(f"\n=== Aggregating {label} from BG to precincts ===")
+    result = np.full(len(source_geoms), -1, dtype=np.int64)
+    if len(source_geoms) == 0 or len(target_geoms) == 0:
+        return result
 
-    bg = bg.to_crs(WORK_CRS)
-    precincts = precincts.to_crs(WORK_CRS)
+    src, tgt = shapely.STRtree(target_geoms).query(source_geoms, predicate="intersects")
+    overlap = shapely.area(shapely.intersection(source_geoms[src], target_geoms[tgt]))
+    keep = overlap > 0  # boundary-only contact is not an assignment
+    src, tgt, overlap = src[keep], tgt[keep], overlap[keep]
+
+    # Sort by source, largest overlap first; each source's first pair wins
+    order = np.lexsort((-overlap, src))
+    src, tgt = src[order], tgt[order]
+    first = np.unique(src, return_index=True)[1]
+    result[src[first]] = tgt[first]
+    return result
 
-    assignment = maup.assign(bg, precincts)
 
-    # Sum BG columns by assigned precinct index
-    agg = bg[columns].groupby(assignment).sum()
+def assign_positions(source: gpd.GeoDataFrame, target: gpd.GeoDataFrame,
+                     source_tree: shapely.STRtree = None) -> np.ndarray:
+    """
+    Positional form of assign_bulk: the target row position for each source
+    row, or -1 where no target contains or overlaps it.
+    """
+    # Index the centroids and query with the polygons: each polygon is prepared
+    # once and then tested against all of its candidate centroids
+    polygons = np.asarray(target.geometry.values)
+    shapely.prepare(polygons)
+    tree = source_tree if source_tree is not None else centroid_tree(source)
+    tgt_idx, src_idx = tree.query(polygons, predicate="contains")
+
+    # First (lowest-index) target wins for centroids on a shared boundary
+    matched, first = np.unique(src_idx, return_index=True)
+    positions = np.full(len(source), -1, dtype=np.int64)
+    positions[matched] = tgt_idx[first]
+
+    missing = np.flatnonzero(positions < 0)
+    if missing.size:
+        positions[missing] = assign_by_overlap(np.asarray(source.geometry.values)[missing], polygons)
+
+    return positions
 
-    for col in columns:
-        precincts[col] = agg.get(col, 0)
 
-    # Comparison: BG totals vs precinct totals
-    source_totals = bg[columns].sum()
-    target_totals = precincts[columns].sum()
+def assign_bulk(source: gpd.GeoDataFrame, target: gpd.GeoDataFrame,
+                source_tree: shapely.STRtree = None) -> pd.Series:
+    """
+    Assign each source geometry to the target polygon containing its centroid.
+
+    One vectorized STRtree query replaces maup.assign's per-geometry lookups.
+    Sources whose centroid lands outside every target (gaps, slivers) go to the
+    target they overlap most (assign_by_overlap). The result keeps maup's
+    Series layout: index = source index, value = target index (NaN if none).
+
+    source_tree: centroid_tree(source), when the same sources are assigned to
+    several targets (e.g. one precinct layer against every plan).
+    """
+    positions = assign_positions(source, target, source_tree)
+    found = positions >= 0
+    values = np.full(len(source), np.nan)
+    values[found] = target.index.to_numpy()[positions[found]]
+
+    assignment = pd.Series(values, index=source.index)
+    return assignment.astype(target.index.dtype, errors="ignore")
+
+
+def assignment_matrix(assignment: pd.Series, precincts: gpd.GeoDataFrame) -> sparse.csc_matrix:
+    """
+    Build the (n_precincts x n_bg) 0/1 matrix mapping each BG to its precinct.
+
+    Multiplying it with a BG value matrix sums every column per precinct in one
+    sparse matmul. Each BG column holds at most one entry, so the matrix is
+    built directly in CSC form (no COO sort/conversion), and the CSC product
+    streams the BG rows once, adding each into its precinct's output row.
+    Unassigned BGs (NaN) get no entry, like groupby's dropna.
+    """
+    rows = precincts.index.get_indexer(assignment)
+    keep = rows >= 0
+    indptr = np.zeros(len(assignment) + 1, dtype=np.int64)
+    np.cumsum(keep, out=indptr[1:])
+    return sparse.csc_matrix(
+        (np.ones(int(indptr[-1]), dtype=np.int32), rows[keep], indptr),
+        shape=(len(precincts), len(assignment)),
+    )
+
+
+def comparison_frame(source_totals: pd.Series, target_totals: pd.Series, label: str) -> pd.DataFrame:
+    """Print and return BG vs precinct totals for one group of columns."""
+    print(f"\n=== {label} ===")
     differences = target_totals - source_totals
     pct_diff = (differences / source_totals.replace(0, pd.NA)) * 100
 
@@ -183,18 +324,62 @@ def aggregate_bg_to_precincts(bg: gpd.GeoDataFrame,
 
     print(comparison)
     print(f"Total difference across all {label} columns: {differences.sum()}")
+    return comparison
 
-    return precincts, comparison
 
+def aggregate_all(bg: gpd.GeoDataFrame,
+                  precincts: gpd.GeoDataFrame,
+                  column_groups: dict[str, list[str]]):
+    """
+    Aggregate every column group from BG -> precincts with a single assignment
+    and a single sparse matmul over the concatenated columns.
 
-def main():
-    """Main function that processes command line arguments and runs the stage."""
+    column_groups maps a label (used in the printed comparison) to its columns.
+    Returns (precincts_with_values, {label: comparison_df}).
+    """
+    print("\n=== Aggregating BG demographics to precincts ===")
+    # Both layers were projected to WORK_CRS once at load time
+    if not (bg.crs == precincts.crs == WORK_CRS):
+        raise RuntimeError(
+            f"BG and precinct layers must both be in {WORK_CRS} "
+            f"(got {bg.crs} and {precincts.crs})"
+        )
+    assignment = assign_bulk(bg, precincts)
+
+    all_cols = [c for columns in column_groups.values() for c in columns]
+    # Counts are stored as int32 to halve the memory streamed through the matmul;
+    # a precinct sum is bounded by the state total, far below the int32 limit
+    values = bg[all_cols].to_numpy(dtype=np.int32)
+    agg = assignment_matrix(assignment, precincts) @ values
+    precincts[all_cols] = agg
+
+    source_totals = pd.Series(values.sum(axis=0, dtype=np.int64), index=all_cols)
+    target_totals = pd.Series(agg.sum(axis=0, dtype=np.int64), index=all_cols)
+    comparisons = {
+        label: comparison_frame(source_totals[columns], target_totals[columns], label)
+        for label, columns in column_groups.items()
+    }
+    return precincts, comparisons
+
+
+def main(argv=None) -> gpd.GeoDataFrame:
+    """
+    Main function that processes command line arguments and runs the stage.
+
+    Returns the slim precinct layer in WORK_CRS so an in-process caller can hand
+    it straight to Stage 2 instead of re-reading the GeoJSON.
+    """
     # Parse command line arguments
     parser = setup_argument_parser(
         description="Aggregate demographic data from block groups to precincts for any US state.",
         stage_name="Stage 1"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--emit-bg",
+        action="store_true",
+        help="Also write the BG all-data layer (required input for Stage 3 dot maps)"
+    )
+    args = parser.parse_args(argv)
 
     # Validate state and get configuration
     state_info, state_paths = validate_state_setup(args.state, acs_year=args.acs_year, census_year=args.census_year)
@@ -203,6 +388,8 @@ def main():
     # Get the detected/specified years
     acs_year = state_paths["acs_year"]
     census_year = state_paths["census_year"]
+    year_suffix = str(acs_year)[-2:]  # Column suffix, e.g. 'HSP_POP' -> 'HSP_POP23'
+    medn_inc_col = f"MEDN_INC{year_suffix}"
     
     print(f"\n=== Processing {state_info['name']} demographics ===")
     print(f"Using ACS year: {acs_year}, Census year: {census_year}\n")
@@ -219,96 +406,83 @@ def main():
     
     acs_race = load_acs_race(acs_race_csv)
     acs_income = load_acs_income(acs_income_csv)
-    cvap_bg = load_cvap_blockgroups(state_paths["cvap_blockgr_csv"], acs_year)
+    cvap_bg = load_cvap_blockgroups(state_paths["cvap_blockgr_csv"], acs_year, state_paths["state_fips"])
+
+    # 3. Merge ACS + CVAP as plain tables, then attach BG geometry once so the
+    #    geometry column is not copied by every merge
+    bg_attrs = pd.DataFrame(bg_geo.drop(columns=bg_geo.geometry.name))
 
-    # 3. Merge ACS + CVAP onto BG geometry
-    print("Merging ACS race onto BG geometry...")
-    bg = bg_geo.merge(acs_race, on="GEOID", how="left", validate="1:1")
+    print("Merging ACS race onto BGs...")
+    bg_attrs = bg_attrs.merge(acs_race, on="GEOID", how="left", validate="1:1")
 
-    print("Merging ACS income onto BG geometry...")
-    bg = bg.merge(acs_income, on="GEOID", how="left", validate="1:1")
+    print("Merging ACS income onto BGs...")
+    bg_attrs = bg_attrs.merge(acs_income, on="GEOID", how="left", validate="1:1")
 
-    print("Merging CVAP onto BG geometry...")
-    bg = bg.merge(cvap_bg, on="GEOID", how="left", validate="1:1")
+    print("Merging CVAP onto BGs...")
+    bg_attrs = bg_attrs.merge(cvap_bg, on="GEOID", how="left", validate="1:1")
+
+    # Left merges keep bg_geo's row order, so geometry lines up positionally
+    bg = gpd.GeoDataFrame(bg_attrs, geometry=bg_geo.geometry.values, crs=bg_geo.crs)
+    del bg_attrs, bg_geo
 
     # 4. Derive totals on BG side
-    race_cols = [
-        get_column_name("HSP_POP", acs_year), get_column_name("WHT_POP", acs_year), 
-        get_column_name("BLK_POP", acs_year), get_column_name("AIA_POP", acs_year), 
-        get_column_name("ASN_POP", acs_year), get_column_name("HPI_POP", acs_year),
-        get_column_name("OTH_POP", acs_year), get_column_name("2OM_POP", acs_year),
-    ]
-    
-    bg[get_column_name("NHSP_POP", acs_year)] = (
-        bg[get_column_name("WHT_POP", acs_year)] + bg[get_column_name("BLK_POP", acs_year)] + 
-        bg[get_column_name("AIA_POP", acs_year)] + bg[get_column_name("ASN_POP", acs_year)] + 
-        bg[get_column_name("HPI_POP", acs_year)] + bg[get_column_name("OTH_POP", acs_year)] +
-        bg[get_column_name("2OM_POP", acs_year)]
-    )
-    bg[get_column_name("TOT_POP", acs_year)] = bg[get_column_name("HSP_POP", acs_year)] + bg[get_column_name("NHSP_POP", acs_year)]
-    race_cols_all = race_cols + [get_column_name("NHSP_POP", acs_year), get_column_name("TOT_POP", acs_year)]
-
-    cvap_cols = [
-        get_column_name("HSP_CVAP", acs_year), get_column_name("WHT_CVAP", acs_year), 
-        get_column_name("BLK_CVAP", acs_year), get_column_name("AIA_CVAP", acs_year), 
-        get_column_name("ASN_CVAP", acs_year), get_column_name("HPI_CVAP", acs_year),
-        get_column_name("2OM_CVAP", acs_year),
-    ]
-    
-    bg[get_column_name("NHSP_CVAP", acs_year)] = (
-        bg[get_column_name("WHT_CVAP", acs_year)] + bg[get_column_name("BLK_CVAP", acs_year)] + 
-        bg[get_column_name("AIA_CVAP", acs_year)] + bg[get_column_name("ASN_CVAP", acs_year)] + 
-        bg[get_column_name("HPI_CVAP", acs_year)] + bg[get_column_name("2OM_CVAP", acs_year)]
-    )
-    bg[get_column_name("TOT_CVAP", acs_year)] = bg[get_column_name("HSP_CVAP", acs_year)] + bg[get_column_name("NHSP_CVAP", acs_year)]
-    cvap_cols_all = cvap_cols + [get_column_name("NHSP_CVAP", acs_year), get_column_name("TOT_CVAP", acs_year)]
-
-    income_cols = [
-        get_column_name("LESS_10K", acs_year), get_column_name("10K_15K", acs_year), 
-        get_column_name("15K_20K", acs_year), get_column_name("20K_25K", acs_year),
-        get_column_name("25K_30K", acs_year), get_column_name("30K_35K", acs_year), 
-        get_column_name("35K_40K", acs_year), get_column_name("40K_45K", acs_year),
-        get_column_name("45K_50K", acs_year), get_column_name("50K_60K", acs_year), 
-        get_column_name("60K_75K", acs_year), get_column_name("75K_100K", acs_year),
-        get_column_name("100_125K", acs_year), get_column_name("125_150K", acs_year), 
-        get_column_name("150_200K", acs_year), get_column_name("200K_MOR", acs_year),
-    ]
-    
-    bg[get_column_name("TOT_HOUS", acs_year)] = bg[income_cols].sum(axis=1)
-    income_cols_all = income_cols + [get_column_name("TOT_HOUS", acs_year)]
+    race_cols = [f"{base}{year_suffix}" for base in RACE_BASES]
+    nhsp_pop_col, tot_pop_col = f"NHSP_POP{year_suffix}", f"TOT_POP{year_suffix}"
+
+    # Row sums run as one NumPy reduction; NaN (BG missing from ACS) propagates
+    # like the column-by-column "+" did and is zero-filled below
+    nhsp_pop = bg[race_cols[1:]].to_numpy(dtype=np.float64).sum(axis=1)
+    bg[nhsp_pop_col] = nhsp_pop
+    bg[tot_pop_col] = bg[race_cols[0]].to_numpy(dtype=np.float64) + nhsp_pop
+    race_cols_all = race_cols + [nhsp_pop_col, tot_pop_col]
+
+    cvap_cols = [f"{base}{year_suffix}" for base in CVAP_BASES]
+    nhsp_cvap_col, tot_cvap_col = f"NHSP_CVAP{year_suffix}", f"TOT_CVAP{year_suffix}"
+
+    nhsp_cvap = bg[cvap_cols[1:]].to_numpy(dtype=np.float64).sum(axis=1)
+    bg[nhsp_cvap_col] = nhsp_cvap
+    bg[tot_cvap_col] = bg[cvap_cols[0]].to_numpy(dtype=np.float64) + nhsp_cvap
+    cvap_cols_all = cvap_cols + [nhsp_cvap_col, tot_cvap_col]
+
+    income_cols = [f"{base}{year_suffix}" for base in INCOME_BASES]
+    tot_hous_col = f"TOT_HOUS{year_suffix}"
+
+    # nansum matches DataFrame.sum's skipna behaviour for BGs missing from ACS
+    bg[tot_hous_col] = np.nansum(bg[income_cols].to_numpy(dtype=np.float64), axis=1)
+    income_cols_all = income_cols + [tot_hous_col]
 
     numeric_cols = race_cols_all + cvap_cols_all + income_cols_all
     for col in numeric_cols:
         if col in bg.columns:
-            bg[col] = bg[col].fillna(0).astype("Int64")
+            bg[col] = bg[col].fillna(0).astype("int32")
 
-    # 5. Save BG all-data GeoJSON for reuse (dotmaps etc.)
-    print(f"\nSaving BG all-data GeoJSON: {state_paths['bg_geojson']}")
-    bg_out = bg.to_crs(OUTPUT_CRS)
-    bg_out.to_file(state_paths["bg_geojson"], driver="GeoJSON")
+    # 5. Save BG all-data layer for reuse (dotmaps etc.). It is only read back by
+    # Stage 3, which samples in WORK_CRS, so store it as binary FlatGeobuf in WORK_CRS.
+    if args.emit_bg:
+        print(f"\nSaving BG all-data FlatGeobuf: {state_paths['bg_layer']}")
+        bg.to_file(state_paths["bg_layer"], driver="FlatGeobuf")
 
     # 6. Load precincts
     precinct_shp = find_precinct_shapefile(state_paths["precincts_dir"])
     print(f"\nLoading precinct shapefile: {precinct_shp}")
-    precincts = gpd.read_file(precinct_shp).to_crs(WORK_CRS)
+    precincts = gpd.read_file(precinct_shp, engine="pyogrio", use_arrow=HAS_PYARROW).to_crs(WORK_CRS)
     print(f"Loaded {len(precincts)} precincts")
 
-    # 7. Aggregate race / CVAP / income from BG -> precincts
-    precincts, pop_comp = aggregate_bg_to_precincts(
-        bg, precincts, race_cols_all, label="population by race"
-    )
-    precincts, cvap_comp = aggregate_bg_to_precincts(
-        bg, precincts, cvap_cols_all, label="CVAP by race"
-    )
-    precincts, income_comp = aggregate_bg_to_precincts(
-        bg, precincts, income_cols_all, label="household income"
-    )
+    # 7. Aggregate race / CVAP / income from BG -> precincts in one pass
+    precincts, comparisons = aggregate_all(bg, precincts, {
+        "population by race": race_cols_all,
+        "CVAP by race": cvap_cols_all,
+        "household income": income_cols_all,
+    })
+    pop_comp = comparisons["population by race"]
+    cvap_comp = comparisons["CVAP by race"]
+    income_comp = comparisons["household income"]
 
     # Placeholder median income (can be computed properly later)
-    precincts[get_column_name("MEDN_INC", acs_year)] = 0
+    precincts[medn_inc_col] = 0
 
     # Make sure numeric columns are integer-like on precincts
-    for col in numeric_cols + [get_column_name("MEDN_INC", acs_year)]:
+    for col in numeric_cols + [medn_inc_col]:
         if col in precincts.columns:
             precincts[col] = precincts[col].fillna(0).round().astype("Int64")
 
@@ -339,14 +513,13 @@ def main():
     ]
 
     # Demographic fields: any column ending with year suffix
-    year_suffix = str(acs_year)[-2:]  # Get last 2 digits
     demo_cols = [
         c
         for c in precincts.columns
         if c.endswith(f"POP{year_suffix}") or c.endswith(f"CVAP{year_suffix}")
     ]
 
-    other_cols = [get_column_name("MEDN_INC", acs_year), "geometry"]
+    other_cols = [medn_inc_col, "geometry"]
 
     # Now build keep list, but only include columns that actually exist
     raw_keep_cols = (
@@ -366,7 +539,13 @@ def main():
     precincts_out.to_file(state_paths["precinct_geojson"], driver="GeoJSON")
     print(f"✅ Saved precinct GeoJSON: {state_paths['precinct_geojson']}")
     print(f"Columns in final precinct layer: {list(precincts_out.columns)}")
+
+    # Binary sibling for Stage 2 (kept in WORK_CRS, so it is read back without reprojection)
+    if HAS_PYARROW:
+        precincts_slim.to_parquet(state_paths["precinct_parquet"], compression="zstd")
+        print(f"✅ Saved precinct GeoParquet: {state_paths['precinct_parquet']}")
     print(f"\nNext: Run stage 2 with -> python run_stage2.py {args.state}")
+    return precincts_slim
 
 
 if __name__ == "__main__":
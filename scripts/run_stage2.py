@@ -19,38 +19,121 @@ Inputs:
   - inputs/plans/<state>/<state>_sl_adopted_<year>/
 
 Outputs:
-  - outputs/<state>/<state>_plans_<year>.json
-  - outputs/<state>/<state>_assignments_<year>.json
+  - outputs/plans.json (all states)
+  - outputs/assignments/<STATE>_<year>.jsonl (+ outputs/assignments/index.json)
 """
 
 import os
 import json
+import functools
+import importlib.util
 import geopandas as gpd
-import maup
+import numpy as np
 import pandas as pd
+
+# pyogrio batches GDAL reads instead of going feature-by-feature through Fiona
+gpd.options.io_engine = "pyogrio"
+
 from common import (
     setup_argument_parser,
     validate_state_setup,
     get_state_paths,
     print_state_info,
-    find_plan_shapefiles
+    find_plan_shapefiles,
+    is_up_to_date,
+    assignment_shard_name,
+    read_assignment_index
 )
+from run_stage1 import assign_positions, centroid_tree
 
 # ============ CONSTANTS ============
 
 WORK_CRS = "EPSG:5070"
 OUTPUT_CRS = "EPSG:4326"
 
+# pyogrio returns Arrow batches when pyarrow (optional) is installed
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Assignment shards hold hundreds of thousands of records; encode/decode JSON
+# with orjson when it is installed
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+else:
+    orjson = None
+
+
+def read_json(path: str):
+    """Load a JSON file (orjson when available)."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def write_json(path: str, data, indent: bool = False):
+    """Write a JSON file (orjson when available); indent only small, human-read files."""
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2 if indent else None)
+
+
+def write_jsonl(path: str, records) -> int:
+    """Write one JSON object per line, replacing path atomically. Returns the record count."""
+    tmp_path = f"{path}.tmp"
+    count = 0
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            for record in records:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+                count += 1
+    else:
+        with open(tmp_path, "w") as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")))
+                f.write("\n")
+                count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+def to_work_crs(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Reproject to WORK_CRS, skipping the pyproj transform when already there."""
+    return gdf if gdf.crs == WORK_CRS else gdf.to_crs(WORK_CRS)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_layer_cached(path: str, mtime_ns: int) -> gpd.GeoDataFrame:
+    return to_work_crs(gpd.read_file(path, engine="pyogrio", use_arrow=HAS_PYARROW))
+
+
+def read_layer(path: str) -> gpd.GeoDataFrame:
+    """
+    Read a vector layer in WORK_CRS, memoized by path and modification time so
+    chambers sharing a shapefile (and repeat runs in one worker) read it once.
+
+    Returns a shallow copy; callers may add columns freely.
+    """
+    return _read_layer_cached(path, os.stat(path).st_mtime_ns).copy(deep=False)
+
 
-def load_precincts(precinct_geojson: str):
-    """Load precincts from Stage 1 output."""
+def load_precincts(precinct_geojson: str, precinct_parquet: str = None):
+    """Load precincts from Stage 1 output, preferring its GeoParquet copy when current."""
     if not os.path.exists(precinct_geojson):
         raise FileNotFoundError(
             f"Precinct GeoJSON not found: {precinct_geojson}\n"
             "Run Stage 1 first."
         )
-    print(f"Loading precincts: {precinct_geojson}")
-    gdf = gpd.read_file(precinct_geojson).to_crs(WORK_CRS)
+    if HAS_PYARROW and precinct_parquet and is_up_to_date(precinct_parquet, precinct_geojson):
+        print(f"Loading precincts: {precinct_parquet}")
+        gdf = to_work_crs(gpd.read_parquet(precinct_parquet))
+    else:
+        print(f"Loading precincts: {precinct_geojson}")
+        gdf = to_work_crs(gpd.read_file(precinct_geojson, engine="pyogrio", use_arrow=HAS_PYARROW))
 
     if "UNIQUE_ID" not in gdf.columns:
         raise RuntimeError("Expected 'UNIQUE_ID' column in precincts layer.")
@@ -72,7 +155,7 @@ def load_plan(shp_path: str, chamber_code: str, state_info: dict, plan_year: int
         )
 
     print(f"\nLoading {chamber_code} plan shapefile: {shp_path}")
-    gdf = gpd.read_file(shp_path).to_crs(WORK_CRS)
+    gdf = read_layer(shp_path)
 
     # Map TIGER/RDH column names to standardized DISTRICT column
     # TIGER congressional: CD119FP (for 119th Congress)
@@ -111,6 +194,9 @@ def load_plan(shp_path: str, chamber_code: str, state_info: dict, plan_year: int
             f"Available columns: {list(gdf.columns)}"
         )
 
+    # Assignment only needs the district code and geometry; drop the TIGER attributes
+    gdf = gdf[["DISTRICT", gdf.geometry.name]]
+
     n_districts = int(gdf["DISTRICT"].nunique())
     print(f"{chamber_code} plan has {n_districts} districts")
 
@@ -134,55 +220,55 @@ def load_plan(shp_path: str, chamber_code: str, state_info: dict, plan_year: int
 
 def build_assignments_for_plan(precincts: gpd.GeoDataFrame,
                                districts: gpd.GeoDataFrame,
-                               plan_meta: dict):
+                               plan_meta: dict,
+                               precinct_tree=None):
     """
-    Use maup.assign to assign each precinct to exactly one district in this plan.
-    Returns (assignments_list, n_unassigned).
+    Assign each precinct to exactly one district in this plan (see assign_positions).
+    precinct_tree: centroid_tree(precincts), shared by every plan.
+    Returns (assignments_df, n_unassigned).
     """
     chamber = plan_meta["chamber"]
     plan_id = plan_meta["plan_id"]
 
     print(f"\nAssigning precincts to {chamber} plan {plan_id} ...")
 
-    # maup.assign returns a Series: index = precinct index, value = district index (in districts gdf)
-    assignment = maup.assign(precincts, districts)
-
-    # Map to DISTRICT code
-    district_codes = assignment.map(districts["DISTRICT"])
+    # District row position per precinct (-1 = unassigned); everything below
+    # works on flat NumPy arrays aligned by position
+    district_pos = assign_positions(precincts, districts, source_tree=precinct_tree)
 
     # Count unassigned
-    unassigned_mask = district_codes.isna()
-    n_unassigned = int(unassigned_mask.sum())
+    assigned = district_pos >= 0
+    n_unassigned = int(len(assigned) - assigned.sum())
     if n_unassigned > 0:
         print(f"⚠ {n_unassigned} precincts could not be assigned to a {chamber} district")
 
-    assignments = []
-    for idx, precinct_row in precincts.iterrows():
-        dist_code = district_codes.loc[idx]
-        if dist_code is None or (isinstance(dist_code, float) and pd.isna(dist_code)):
-            continue  # skip unassigned
-
-        # Handle non-numeric district codes (e.g., 'ZZZ' for areas without defined districts)
-        try:
-            district_id = int(dist_code)
-        except (ValueError, TypeError):
-            # Use -1 for special codes like 'ZZZ' (districts not defined)
-            # This preserves the precinct in the data while marking it as special
-            district_id = -1
-
-        assignments.append({
-            "state": plan_meta["state"],
-            "plan_id": plan_id,
-            "precinct_id": precinct_row["UNIQUE_ID"],
-            "district_id": district_id,
-        })
+    # Convert each district's code once, then fancy-index by position. Unassigned
+    # precincts are skipped; non-numeric district codes (e.g. 'ZZZ' for areas
+    # without defined districts) become -1 so the precinct stays in the data
+    numeric = pd.to_numeric(districts["DISTRICT"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    id_by_district = np.where(np.isnan(numeric), -1, numeric).astype(np.int64)
+    district_ids = id_by_district[district_pos[assigned]]
+
+    # state / plan_id repeat on every row: store them as single-category columns
+    codes = np.zeros(len(district_ids), dtype=np.int8)
+    assignments = pd.DataFrame({
+        "state": pd.Categorical.from_codes(codes, categories=[plan_meta["state"]]),
+        "plan_id": pd.Categorical.from_codes(codes, categories=[plan_id]),
+        "precinct_id": precincts["UNIQUE_ID"].to_numpy()[assigned],
+        "district_id": district_ids,
+    })
 
     print(f"Built {len(assignments)} assignments for plan {plan_id}")
     return assignments, n_unassigned
 
 
-def main():
-    """Main function that processes command line arguments and runs the stage."""
+def main(argv=None, precincts: gpd.GeoDataFrame = None):
+    """
+    Main function that processes command line arguments and runs the stage.
+
+    precincts: Stage 1's precinct layer (WORK_CRS) when run in the same process;
+    the Stage 1 GeoJSON is only read when it is not given.
+    """
     # Parse command line arguments
     parser = setup_argument_parser(
         description="Process redistricting plans and create precinct assignments for any US state.",
@@ -197,14 +283,20 @@ def main():
         help="Plan year for redistricting plans (default: auto-detect from available plans)"
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate state and get configuration
     state_info, state_paths = validate_state_setup(args.state, acs_year=args.acs_year, census_year=args.census_year)
     print_state_info(state_info)
 
-    # 1. Load precincts from Stage 1 output
-    precincts = load_precincts(state_paths["precinct_geojson"])
+    # 1. Load precincts from Stage 1 output (unless handed over in memory)
+    if precincts is None:
+        precincts = load_precincts(state_paths["precinct_geojson"], state_paths["precinct_parquet"])
+    else:
+        if "UNIQUE_ID" not in precincts.columns:
+            raise RuntimeError("Expected 'UNIQUE_ID' column in precincts layer.")
+        precincts = precincts.to_crs(WORK_CRS)
+        print(f"Using {len(precincts)} precincts from Stage 1")
 
     # 2. Find and load plans (auto-detects year if not specified)
     try:
@@ -224,8 +316,11 @@ def main():
         print(f"\nDownload plans from: https://redistrictingdatahub.org/")
         return
 
+    # Precinct centroids and their spatial index are the same for every plan
+    precinct_tree = centroid_tree(precincts)
+
     all_plans = []
-    all_assignments = []
+    assignment_frames = []
     
     # Chamber code mapping for display/metadata
     chamber_codes = {
@@ -252,9 +347,9 @@ def main():
         
         try:
             plan_gdf, plan_meta = load_plan(plan_files[chamber_key], chamber_code, state_info, plan_year)
-            assignments, unassigned = build_assignments_for_plan(precincts, plan_gdf, plan_meta)
+            assignments, unassigned = build_assignments_for_plan(precincts, plan_gdf, plan_meta, precinct_tree)
             all_plans.append(plan_meta)
-            all_assignments.extend(assignments)
+            assignment_frames.append(assignments)
             print(f"{chamber_name} plan: {len(assignments)} assignments, {unassigned} unassigned")
         except Exception as e:
             print(f"⚠ Warning: Failed to process {chamber_name} plan: {e}")
@@ -263,44 +358,43 @@ def main():
         print("❌ No plans were successfully processed.")
         return
 
+    all_assignments = pd.concat(assignment_frames, ignore_index=True)
     print(f"\nTotal assignments created: {len(all_assignments)}")
 
-    # 3. Save JSON outputs to centralized files (support appending)
+    # 3. Save plans to the centralized JSON file (small: a few plans per state)
+    state_abbr = state_info["abbr"].upper()
     plans_json = state_paths["plans_json"]
-    assignments_json = state_paths["assignments_json"]
-    
-    # Load existing data or start with empty lists
-    existing_plans = []
-    existing_assignments = []
     
-    if os.path.exists(plans_json):
-        with open(plans_json, "r") as f:
-            existing_plans = json.load(f)
+    existing_plans = read_json(plans_json) if os.path.exists(plans_json) else []
     
-    if os.path.exists(assignments_json):
-        with open(assignments_json, "r") as f:
-            existing_assignments = json.load(f)
-    
-    # Remove old entries for this state/year combination
+    # Replace old entries for this state/year combination
     existing_plans = [p for p in existing_plans 
-                      if not (p.get("state") == state_info["abbr"].upper() and p.get("year") == plan_year)]
-    existing_assignments = [a for a in existing_assignments 
-                           if not (a.get("state") == state_info["abbr"].upper() and a.get("year") == plan_year)]
-    
-    # Append new data
+                      if not (p.get("state") == state_abbr and p.get("year") == plan_year)]
     existing_plans.extend(all_plans)
-    existing_assignments.extend(all_assignments)
     
-    # Save updated data
-    with open(plans_json, "w") as f:
-        json.dump(existing_plans, f, indent=2)
+    write_json(plans_json, existing_plans, indent=True)
     print(f"\n✅ Saved plans to centralized JSON: {plans_json}")
     print(f"   Total plans in file: {len(existing_plans)}")
 
-    with open(assignments_json, "w") as f:
-        json.dump(existing_assignments, f, indent=2)
-    print(f"✅ Saved assignments to centralized JSON: {assignments_json}")
-    print(f"   Total assignments in file: {len(existing_assignments)}")
+    # 4. Save assignments to this state/year's shard; other shards are untouched
+    assignments_dir = state_paths["assignments_dir"]
+    os.makedirs(assignments_dir, exist_ok=True)
+    shard_name = assignment_shard_name(state_abbr, plan_year)
+    shard_path = os.path.join(assignments_dir, shard_name)
+    record_count = write_jsonl(shard_path, all_assignments.to_dict("records"))
+    
+    index = read_assignment_index()
+    index[os.path.splitext(shard_name)[0]] = {
+        "state": state_abbr,
+        "year": plan_year,
+        "file": shard_name,
+        "records": record_count
+    }
+    index_tmp = f"{state_paths['assignments_index']}.tmp"
+    write_json(index_tmp, index, indent=True)
+    os.replace(index_tmp, state_paths["assignments_index"])
+    print(f"✅ Saved {record_count} assignments to shard: {shard_path}")
+    print(f"   Shards in index: {len(index)}")
     print(f"\nNext: Run stage 3 with -> python run_stage3_dots.py {args.state}")
 
 
@@ -12,9 +12,10 @@ Examples:
     python run_stage3_dots.py AZ
     python run_stage3_dots.py CA --dot-unit 25 --acs-year 2022
     python run_stage3_dots.py TX --dot-unit 100 --seed 42
+    python run_stage3_dots.py NY --workers 4
 
 Inputs (from Stage 1):
-  - outputs/<state>/<state>_bg_all_data_<year>.geojson
+  - outputs/<state>/<state>_bg_all_data_<year>.fgb
 
 Outputs:
   - outputs/<state>/<state>_dots_pop<yy>_unit<X>.geojson
@@ -22,13 +23,16 @@ Outputs:
 """
 
 import os
-import random
 import json
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List
 
 import geopandas as gpd
 import numpy as np
-from shapely.geometry import Point
+import shapely
+from pyogrio import read_info
 from common import (
     setup_argument_parser,
     validate_state_setup,
@@ -53,6 +57,26 @@ GROUP_COLS_TEMPLATE = {
 
 TOTAL_POP_COL_TEMPLATE = "TOT_POP{year_suffix}"   # used for presence check
 
+# pyarrow (optional) enables the GeoParquet copy of the dots for Stage 4
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Dot features are encoded with orjson when it is installed
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+else:
+    orjson = None
+
+# Write buffer for the streamed dots GeoJSON
+GEOJSON_WRITE_BUFFER = 1 << 20
+
+# Rejection-sampling rounds before a dot falls back to a point on the surface
+MAX_REJECTION_ROUNDS = 2000
+# Upper bound on candidates drawn per dot per round (sized by bbox/area ratio)
+MAX_CANDIDATES_PER_ROUND = 32
+# Block groups per sampling task. Fixed (not derived from --workers) so a given
+# seed yields the same dots however many processes run the tasks.
+SAMPLE_CHUNK_BGS = 2000
+
 # High-contrast dot colors
 DOT_COLORS = {
     "white":       "#d9d9d9",
@@ -66,123 +90,226 @@ DOT_COLORS = {
 }
 
 
-def random_point_in_polygon(poly, rng: random.Random) -> Point:
-    """Sample a random point inside a polygon using rejection sampling."""
-    minx, miny, maxx, maxy = poly.bounds
-    if maxx <= minx or maxy <= miny:
-        return poly.representative_point()
-    for _ in range(2000):
-        x = rng.uniform(minx, maxx)
-        y = rng.uniform(miny, maxy)
-        p = Point(x, y)
-        if poly.contains(p):
-            return p
-    # Fallback if geometry is weird
-    return poly.representative_point()
+def sample_dots(geoms, dots: np.ndarray, rng: np.random.Generator, area_geoms=None):
+    """
+    Place dots[g, i] random points inside block group i for every group g.
 
+    Block groups are split into polygon parts once. Each dot picks a part with
+    probability proportional to its area, then is rejection-sampled inside the
+    part's bounding box. Points come out in the CRS of geoms; area_geoms (the
+    same geometries in an equal-area CRS) supply the part areas when geoms are
+    in geographic coordinates. Every draw and containment test is a whole-array
+    NumPy/shapely call over the dots still unplaced, so there is no per-dot
+    Python work.
 
-def area_weighted_sample_point(geom, rng: random.Random) -> Point:
+    Returns (points, bg_index, group_index), ordered by block group, then group.
     """
-    Sample a point from a (Multi)Polygon with probability proportional
-    to area of each component.
+    n_groups, n_bg = dots.shape
+
+    # Non-empty polygon parts, grouped by owning block group
+    parts, owner = shapely.get_parts(geoms, return_index=True)
+    keep = ~shapely.is_empty(parts)
+    parts, owner = parts[keep], owner[keep]
+    shapely.prepare(parts)
+    areas = shapely.area(parts)
+    bounds = shapely.bounds(parts)
+    weights = areas if area_geoms is None else shapely.area(shapely.get_parts(area_geoms)[keep])
+
+    n_parts = np.bincount(owner, minlength=n_bg)
+    first_part = np.searchsorted(owner, np.arange(n_bg))
+    last_part = first_part + n_parts - 1
+    cum_area = np.cumsum(weights)
+    area_before = np.concatenate(([0.0], cum_area))[first_part]
+    bg_area = np.bincount(owner, weights=weights, minlength=n_bg)
+
+    # One entry per dot; (bg, group) pairs in output order. BGs without parts get none.
+    per_pair = (dots * (n_parts > 0)).T.ravel()
+    bg_idx, group_idx = np.divmod(np.repeat(np.arange(per_pair.size), per_pair), n_groups)
+
+    # Area-weighted part choice: a uniform draw along the BG's cumulative part area
+    target = area_before[bg_idx] + rng.random(len(bg_idx)) * bg_area[bg_idx]
+    part_idx = np.clip(np.searchsorted(cum_area, target, side="right"),
+                       first_part[bg_idx], last_part[bg_idx])
+
+    minx, miny, maxx, maxy = bounds[part_idx].T
+    width, height = maxx - minx, maxy - miny
+    x = np.empty(len(part_idx))
+    y = np.empty(len(part_idx))
+    placed = np.zeros(len(part_idx), dtype=bool)
+
+    # A candidate lands with probability part area / bbox area; draw about that
+    # many candidates per pending dot each round so sparse parts need few rounds
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tries = np.ceil(width * height / areas[part_idx])
+    tries = np.clip(np.nan_to_num(tries, nan=1.0), 1, MAX_CANDIDATES_PER_ROUND).astype(np.int64)
+
+    pending = np.flatnonzero((width > 0) & (height > 0))
+    for _ in range(MAX_REJECTION_ROUNDS):
+        if pending.size == 0:
+            break
+        cand = np.repeat(pending, tries[pending])
+        cx = minx[cand] + rng.random(cand.size) * width[cand]
+        cy = miny[cand] + rng.random(cand.size) * height[cand]
+        hit = np.flatnonzero(shapely.contains_xy(parts[part_idx[cand]], cx, cy))
+
+        # Keep each dot's first landed candidate (cand is sorted by dot)
+        accepted, first = np.unique(cand[hit], return_index=True)
+        x[accepted], y[accepted] = cx[hit[first]], cy[hit[first]]
+        placed[accepted] = True
+        pending = pending[~placed[pending]]
+
+    points = shapely.points(x, y)
+    # Degenerate parts (and dots that never landed) fall back to a point on the surface
+    if not placed.all():
+        points[~placed] = shapely.point_on_surface(parts[part_idx[~placed]])
+
+    return points, bg_idx, group_idx
+
+
+def _sample_chunk(task):
+    """Worker entry point: sample_dots over one block-group chunk with its own generator."""
+    geoms, dots, rng, area_geoms = task
+    return sample_dots(geoms, dots, rng, area_geoms)
+
+
+def sample_dots_parallel(geoms, dots: np.ndarray, rng: np.random.Generator,
+                         area_geoms=None, workers: int = None):
     """
-    if geom.is_empty:
-        return Point()
-
-    geom_type = geom.geom_type
-    if geom_type == "Polygon":
-        return random_point_in_polygon(geom, rng)
-
-    if geom_type == "MultiPolygon":
-        geoms = list(geom.geoms)
-        areas = np.array([g.area for g in geoms], dtype="float64")
-        if areas.sum() <= 0:
-            return random_point_in_polygon(geoms[0], rng)
-        probs = areas / areas.sum()
-        choice = np.random.default_rng().choice(len(geoms), p=probs)
-        return random_point_in_polygon(geoms[choice], rng)
-
-    # Fallback: representative point
-    return geom.representative_point()
+    sample_dots over fixed-size block-group chunks, spread across worker processes.
 
+    Each chunk draws from its own child generator spawned from rng, so output
+    depends only on the seed. Returns the same (points, bg_index, group_index)
+    as sample_dots.
+    """
+    n_bg = dots.shape[1]
+    starts = list(range(0, n_bg, SAMPLE_CHUNK_BGS))
+    if len(starts) <= 1:
+        return sample_dots(geoms, dots, rng, area_geoms)
+
+    tasks = [
+        (geoms[s:s + SAMPLE_CHUNK_BGS], dots[:, s:s + SAMPLE_CHUNK_BGS], child,
+         None if area_geoms is None else area_geoms[s:s + SAMPLE_CHUNK_BGS])
+        for s, child in zip(starts, rng.spawn(len(starts)))
+    ]
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        results = [_sample_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(_sample_chunk, tasks))
+
+    points = np.concatenate([r[0] for r in results])
+    bg_idx = np.concatenate([r[1] + s for r, s in zip(results, starts)])
+    group_idx = np.concatenate([r[2] for r in results])
+    return points, bg_idx, group_idx
+
+
+def write_dots_geojson(path: str, points, properties: Dict[str, np.ndarray]):
+    """
+    Stream point features to a GeoJSON FeatureCollection.
 
-def compute_dots_for_groups(bg, dot_unit: int, groups: Dict[str, str], seed: int):
+    Coordinates come out of one shapely.get_coordinates call and each feature
+    is encoded directly (orjson when available) instead of passing through OGR
+    one feature at a time. properties maps column name -> per-point array.
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        def dumps(obj):
+            return json.dumps(obj, separators=(",", ":")).encode()
+
+    names = list(properties)
+    columns = [np.asarray(properties[name]).tolist() for name in names]
+    coords = shapely.get_coordinates(points).tolist()
+
+    with open(path, "wb", buffering=GEOJSON_WRITE_BUFFER) as f:
+        f.write(b'{"type":"FeatureCollection","features":[\n')
+        for i, (xy, *values) in enumerate(zip(coords, *columns)):
+            if i:
+                f.write(b",\n")
+            f.write(dumps({
+                "type": "Feature",
+                "properties": dict(zip(names, values)),
+                "geometry": {"type": "Point", "coordinates": xy},
+            }))
+        f.write(b"\n]}\n")
+
+
+def compute_dots_for_groups(bg, dot_unit: int, groups: Dict[str, str], total_pop_col: str,
+                            rng: np.random.Generator):
     """
     For each group, compute how many dots per block group.
 
+    The total and group populations are read as one float32 matrix and all
+    groups are rounded at once as a (groups x block groups) matrix.
+
     Returns:
-      dots_by_group: dict[group] -> np.ndarray[int]
-      counts_by_group: dict[group] -> np.ndarray[float]
+      group_names: list[str] of groups present in the BG layer (row order)
+      dots: np.ndarray[int32] of shape (len(group_names), len(bg))
+      counts: np.ndarray[float32] of the same shape
+      tot_pop: np.ndarray[float32] of shape (len(bg),)
     """
-    dots_by_group = {}
-    counts_by_group = {}
-
-    rng = np.random.default_rng(seed)
-
+    group_names = []
     for group, col in groups.items():
         if col not in bg.columns:
             print(f"Warning: column {col} not in BG; skipping group '{group}'")
             continue
+        group_names.append(group)
 
-        counts = bg[col].fillna(0).astype(float).values
-        counts_by_group[group] = counts
-
-        # expected dots = people / dot_unit
-        expected = counts / float(dot_unit)
+    pop = np.ascontiguousarray(
+        bg[[total_pop_col, *(groups[g] for g in group_names)]].fillna(0).to_numpy(dtype=np.float32).T
+    )
+    tot_pop, counts = pop[0], pop[1:]
 
-        # Random rounding: floor + Bernoulli(frac)
-        base = np.floor(expected).astype(int)
-        frac = expected - base
-        add_one = (rng.random(len(frac)) < frac).astype(int)
-        dots = base + add_one
+    # expected dots = people / dot_unit
+    expected = counts / np.float32(dot_unit)
 
-        dots_by_group[group] = dots
+    # Random rounding: floor + Bernoulli(frac)
+    base = np.floor(expected)
+    dots = (base + (rng.random(counts.shape, dtype=np.float32) < expected - base)).astype(np.int32)
 
-    return dots_by_group, counts_by_group
+    return group_names, dots, counts, tot_pop
 
 
-def ensure_presence(dots_by_group: Dict[str, np.ndarray],
-                    counts_by_group: Dict[str, np.ndarray],
+def ensure_presence(dots: np.ndarray,
+                    counts: np.ndarray,
                     tot_pop: np.ndarray,
-                    seed: int):
+                    rng: np.random.Generator):
     """
     Ensure that any block group with total population > 0 has at least 1 dot total.
     If a BG has zero dots but tot_pop > 0, give 1 dot to the majority group.
+
+    dots and counts are (groups x block groups); dots is updated in place.
     """
-    groups = list(dots_by_group.keys())
-    if not groups:
-        return dots_by_group
+    if dots.shape[0] == 0:
+        return dots
 
     # total dots per BG
-    total_dots = np.zeros_like(tot_pop, dtype=int)
-    for g in groups:
-        total_dots += dots_by_group[g]
+    total_dots = dots.sum(axis=0)
 
     # BGs with people but no dots
     zero_idxs = np.where((tot_pop > 0) & (total_dots == 0))[0]
     if len(zero_idxs) == 0:
-        return dots_by_group
+        return dots
 
     print(f"Presence: {len(zero_idxs)} block groups had population but 0 dots; assigning 1 dot each to majority group.")
 
-    rng = np.random.default_rng(seed)
+    # pick group with max count in each BG; a random score on the tied maxima
+    # breaks ties uniformly
+    zero_counts = counts[:, zero_idxs]
+    col_max = zero_counts.max(axis=0)
+    winner = ((zero_counts == col_max) * rng.random(zero_counts.shape)).argmax(axis=0)
 
-    for i in zero_idxs:
-        # pick group with max count in this BG (ties broken randomly)
-        cvals = np.array([counts_by_group[g][i] for g in groups], dtype="float64")
-        mx = cvals.max()
-        if mx <= 0:
-            # no group actually has people → skip, no dot
-            continue
-        top_idxs = np.where(cvals == mx)[0]
-        choice = rng.choice(top_idxs)
-        g_sel = groups[choice]
-        dots_by_group[g_sel][i] += 1
+    # no group actually has people → skip, no dot
+    has_people = col_max > 0
+    dots[winner[has_people], zero_idxs[has_people]] += 1
 
-    return dots_by_group
+    return dots
 
 
-def main():
+def main(argv=None):
     """Main function that processes command line arguments and runs the stage."""
     # Parse command line arguments
     parser = setup_argument_parser(
@@ -204,7 +331,14 @@ def main():
         help="Random seed for reproducible dot placement (default: 42)"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to sample dot locations (default: CPU count)"
+    )
+    
+    args = parser.parse_args(argv)
 
     # Validate state and get configuration
     state_info, state_paths = validate_state_setup(args.state)
@@ -222,82 +356,72 @@ def main():
     total_pop_col = TOTAL_POP_COL_TEMPLATE.format(year_suffix=year_suffix)
 
     # Check input file
-    bg_input = state_paths["bg_geojson"]
+    bg_input = state_paths["bg_layer"]
     if not os.path.exists(bg_input):
         raise FileNotFoundError(
-            f"BG input GeoJSON not found: {bg_input}\n"
-            "Run Stage 1 to generate it first."
+            f"BG input layer not found: {bg_input}\n"
+            "Run Stage 1 with --emit-bg to generate it first."
         )
 
     print(f"[1] Loading BG data: {bg_input}")
-    bg = gpd.read_file(bg_input)
+    # Only GEOID and the population columns are used; skip the CVAP/income fields
+    fields = set(read_info(bg_input)["fields"])
+    wanted = [c for c in ["GEOID", total_pop_col, *group_cols.values()] if c in fields]
+    bg = gpd.read_file(bg_input, engine="pyogrio", columns=wanted)
 
-    # Work in projected CRS for better area-based sampling
-    bg = bg.to_crs("EPSG:5070")
+    # Part areas come from the equal-area CRS; dots are then sampled directly in
+    # EPSG:4326, so only the BG polygons (not every dot) are reprojected
+    area_geoms = np.asarray(bg.geometry.to_crs("EPSG:5070").values)
+    bg = bg.to_crs(4326)
 
     if total_pop_col not in bg.columns:
         raise RuntimeError(f"Expected '{total_pop_col}' in BG layer.")
 
-    tot_pop = bg[total_pop_col].fillna(0).astype(float).values
-
     # 2. Compute dots per group
     print(f"[2] Computing dots per group (DOT_UNIT = {args.dot_unit})...")
-    dots_by_group, counts_by_group = compute_dots_for_groups(bg, args.dot_unit, group_cols, args.seed)
+    # One generator, seeded once, drives rounding, presence tie-breaks and placement
+    rng = np.random.default_rng(args.seed)
+    group_names, dot_counts, counts, tot_pop = compute_dots_for_groups(
+        bg, args.dot_unit, group_cols, total_pop_col, rng)
 
     # 3. Presence: ensure at least 1 dot for non-empty BGs
-    dots_by_group = ensure_presence(dots_by_group, counts_by_group, tot_pop, args.seed)
+    dot_counts = ensure_presence(dot_counts, counts, tot_pop, rng)
 
     # 4. Emit point features
     print("[3] Sampling dot locations...")
-    rng = random.Random(args.seed)
-    feats = []
-    geoid_col = "GEOID" if "GEOID" in bg.columns else None
+    points, bg_idx, group_idx = sample_dots_parallel(np.asarray(bg.geometry.values), dot_counts, rng,
+                                                     area_geoms, args.workers)
 
-    for i, row in bg.iterrows():
-        geom = row.geometry
-        if geom is None or geom.is_empty:
-            continue
+    print(f"  -> total dots: {len(points):,}")
 
-        for group, col in group_cols.items():
-            if group not in dots_by_group:
-                continue
-            n = int(dots_by_group[group][i])
-            if n <= 0:
-                continue
-
-            for _ in range(n):
-                p = area_weighted_sample_point(geom, rng)
-                feat = {
-                    "group": group,
-                    "geometry": p,
-                }
-                if geoid_col:
-                    feat["bg_geoid"] = row[geoid_col]
-                feats.append(feat)
-
-    print(f"  -> total dots: {len(feats):,}")
-
-    if not feats:
+    if len(points) == 0:
         print("No dots generated; check demographic fields and DOT_UNIT.")
         return
 
-    dots = gpd.GeoDataFrame(feats, geometry="geometry", crs=bg.crs)
+    data = {"group": np.asarray(group_names, dtype=object)[group_idx]}
+    if "GEOID" in bg.columns:
+        data["bg_geoid"] = bg["GEOID"].to_numpy()[bg_idx]
+    dots = gpd.GeoDataFrame(data, geometry=points, crs=bg.crs)
 
     # 5. Save combined + per-group GeoJSONs
     print("[4] Writing GeoJSONs...")
-    dots_web = dots.to_crs(4326)
-
     # Generate output paths
     dots_combined = state_paths["dots_geojson"].format(dot_unit=args.dot_unit)
-    dots_web.to_file(dots_combined, driver="GeoJSON")
+    write_dots_geojson(dots_combined, dots.geometry.values, data)
     print(f"  -> combined dots: {dots_combined}")
 
+    # Binary sibling for Stage 4, in the sampling CRS (EPSG:4326)
+    if HAS_PYARROW:
+        dots_parquet = state_paths["dots_parquet"].format(dot_unit=args.dot_unit)
+        dots.to_parquet(dots_parquet, compression="zstd")
+        print(f"  -> combined dots (GeoParquet): {dots_parquet}")
+
     # per-group
     # prefix = os.path.splitext(os.path.basename(dots_combined))[0]
     # out_dir = os.path.dirname(dots_combined)
 
     # for g in group_cols.keys():
-    #     subset = dots_web.query("group == @g")
+    #     subset = dots.query("group == @g")
     #     if subset.empty:
     #         continue
     #     path = os.path.join(out_dir, f"{prefix}_{g}.geojson")
@@ -3,7 +3,6 @@
 Stage 4: Compare plans and dots visualization with district statistics.
 
 This script creates side-by-side visualizations showing:
-  • Block groups (light dashed outlines)
   • Precinct boundaries (darker solid outlines)
   • Race dot map (from Stage 3)
   • Congressional plan outlines
@@ -18,44 +17,101 @@ Examples:
     python run_stage4_comp.py CA --dot-unit 25 --cong-plan "ca_cong_2022"
     python run_stage4_comp.py TX --acs-year 2022 --leg-plan "tx_leg_2021"
     python run_stage4_comp.py LA --show-stats
+    python run_stage4_comp.py LA --show-stats --no-plot
 
 Inputs:
   - outputs/<state>/<state>_precinct_all_pop_<year>.geojson (from Stage 2)
   - outputs/<state>/<state>_dots_pop<yy>_unit<X>.geojson (from Stage 3)
-  - inputs/tiger_2020/<state>_bg/tl_2020_<fips>_bg.shp (TIGER block groups)
   - inputs/plans/<state>/<cong_plan>/<plan_file>.shp
   - inputs/plans/<state>/<leg_plan>/<plan_file>.shp
-  - outputs/assignments.json (from Stage 2)
+  - outputs/plans.json, outputs/assignments/<STATE>_<year>.jsonl (from Stage 2)
 
 Outputs:
   - Interactive matplotlib visualization
   - District statistics tables (if --show-stats enabled)
 """
 
+from __future__ import annotations
+
 import sys
 sys.setrecursionlimit(10000)  # allow deep geometries
 
 import os
+import re
 import json
-import pandas as pd
-import matplotlib.pyplot as plt
-import geopandas as gpd
-from typing import Optional, Dict, List
+import hashlib
+import importlib.util
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Dict, List
 
-# Force Fiona backend for all reads to avoid geometry issues
-gpd.options.io_engine = "fiona"
+# numpy/pandas/geopandas/shapely/matplotlib are imported where they are used,
+# so --help and the missing-inputs checks stay fast
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import geopandas as gpd
+    from pyproj import Transformer
 
 from common import (
     setup_argument_parser,
     validate_state_setup,
     get_state_paths,
-    print_state_info
+    print_state_info,
+    is_up_to_date,
+    find_assignment_shards
 )
 
 # ===================== CONSTANTS =====================
 
-WORK_CRS = "EPSG:5070"   # for alignment
 PLOT_CRS = "EPSG:3857"   # web-mercator for nicer plots
+FIGSIZE = (14, 12)       # inches, for every map window
+RASTER_BASE_SCALE = 2    # --raster-base resolution, in multiples of figure.dpi
+
+# Threads for concurrent layer loads (pyogrio releases the GIL inside GDAL)
+LOAD_WORKERS = 8
+
+# pyogrio returns Arrow batches when pyarrow (optional) is installed
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Above this many dots the layer is aggregated to pixels with datashader
+# (optional) instead of drawn as one marker per dot
+HAS_DATASHADER = importlib.util.find_spec("datashader") is not None
+DATASHADER_MIN_DOTS = 500_000
+
+# District identifier columns in plan shapefiles (RDH and TIGER), in lookup order
+DISTRICT_COLS = ('DISTRICT', 'CD119FP', 'CD118FP', 'CD117FP', 'CD116FP', 'SLDLST', 'SLDUST')
+
+# Precinct demographic columns summed per district ({yy} = ACS year suffix)
+DEMO_COLS_TEMPLATE = {
+    'TOT_POP{yy}': 'total_pop',
+    'WHT_POP{yy}': 'white_pop',
+    'BLK_POP{yy}': 'black_pop',
+    'HSP_POP{yy}': 'hispanic_pop',
+    'ASN_POP{yy}': 'asian_pop',
+    'AIA_POP{yy}': 'native_pop',
+    'HPI_POP{yy}': 'nhpi_pop',
+    'OTH_POP{yy}': 'other_pop',
+    '2OM_POP{yy}': 'two_or_more_pop',
+    'WHT_CVAP{yy}': 'white_cvap',
+    'BLK_CVAP{yy}': 'black_cvap',
+    'HSP_CVAP{yy}': 'hispanic_cvap',
+    'ASN_CVAP{yy}': 'asian_cvap',
+}
+HOUSEHOLDS_COL_TEMPLATE = 'TOT_HOUS{yy}'
+
+# Election result columns look like G24PREDHAR (general, year, office, party/candidate)
+ELECTION_COL_RE = re.compile(r'^G.*(?:20|22|24)')
+DEM_COL_RE = re.compile(r'DHAR|(?i:DEM)')
+REP_COL_RE = re.compile(r'TRU|(?i:REP)')
+
+# Column dtypes for Stage 2 assignment records
+ASSIGNMENT_DTYPES = {
+    "state": "category",
+    "plan_id": "category",
+    "precinct_id": "string",
+    "district_id": "int32",
+}
 
 # High-contrast dot colors (must match Stage 3)
 DOT_COLORS = {
@@ -71,28 +127,67 @@ DOT_COLORS = {
 
 # ===================== HELPERS =====================
 
-def load_layer_simple(path: str, name: str) -> gpd.GeoDataFrame:
-    """Load a geographic layer with error handling."""
+@lru_cache(maxsize=1)
+def dot_rgba() -> np.ndarray:
+    """DOT_COLORS as a float32 RGBA table, rows in DOT_COLORS order."""
+    import numpy as np
+    from matplotlib.colors import to_rgba_array
+
+    return to_rgba_array(list(DOT_COLORS.values())).astype(np.float32)
+
+
+def read_layer(path: str, columns: Optional[List[str]] = None,
+               bbox: Optional[tuple] = None) -> gpd.GeoDataFrame:
+    """
+    Read a layer with pyogrio, using Arrow transport when pyarrow is installed.
+
+    columns: attribute columns to keep (None = all); names missing from the
+    layer are ignored. bbox: (minx, miny, maxx, maxy) in the layer's CRS;
+    GDAL skips features that do not intersect it. Falls back to a plain
+    pyogrio read if GDAL is too old for Arrow (< 3.6).
+    """
+    import geopandas as gpd
+    from pyogrio import read_info
+
+    if columns is not None:
+        fields = set(read_info(path)["fields"])
+        columns = [c for c in columns if c in fields]
+    if HAS_PYARROW:
+        try:
+            return gpd.read_file(path, engine="pyogrio", use_arrow=True, columns=columns, bbox=bbox)
+        except RuntimeError:
+            pass
+    return gpd.read_file(path, engine="pyogrio", columns=columns, bbox=bbox)
+
+
+def layer_bbox(path: str, bounds, bounds_crs) -> Optional[tuple]:
+    """bounds (in bounds_crs) transformed to the CRS of the layer at path, for a bbox read."""
+    from pyogrio import read_info
+    from pyproj import Transformer
+
+    layer_crs = read_info(path)["crs"]
+    if bounds is None or bounds_crs is None or layer_crs is None:
+        return None
+    transformer = Transformer.from_crs(bounds_crs, layer_crs, always_xy=True)
+    return tuple(transformer.transform_bounds(*bounds))
+
+
+def load_layer_simple(path: str, name: str, columns: Optional[List[str]] = None,
+                      bbox: Optional[tuple] = None) -> gpd.GeoDataFrame:
+    """Load a geographic layer with error handling (see read_layer for columns/bbox)."""
     if not os.path.exists(path):
         raise FileNotFoundError(f"{name} not found at {path}")
     print(f"Loading {name}: {path}")
-    gdf = gpd.read_file(path)
+    gdf = read_layer(path, columns, bbox)
+    gdf.attrs["source_path"] = path  # keys prep_for_plot's cache
+    if bbox is not None:
+        gdf.attrs["bbox"] = bbox
     if gdf.crs is None:
         print(f"⚠ {name} has no CRS; assuming EPSG:4326")
         gdf.crs = "EPSG:4326"
     
     # Map TIGER column names to standard DISTRICT column for plan shapefiles
-    district_col_map = {
-        'DISTRICT': 'DISTRICT',  # Already standardized
-        'CD119FP': 'DISTRICT',   # TIGER congressional
-        'CD118FP': 'DISTRICT',
-        'CD117FP': 'DISTRICT',
-        'CD116FP': 'DISTRICT',
-        'SLDLST': 'DISTRICT',    # TIGER state legislative lower
-        'SLDUST': 'DISTRICT',    # TIGER state legislative upper
-    }
-    
-    for tiger_col in district_col_map:
+    for tiger_col in DISTRICT_COLS:
         if tiger_col in gdf.columns and tiger_col != 'DISTRICT':
             gdf['DISTRICT'] = gdf[tiger_col]
             break
@@ -100,11 +195,191 @@ def load_layer_simple(path: str, name: str) -> gpd.GeoDataFrame:
     return gdf
 
 
-def prep_for_plot(gdf: Optional[gpd.GeoDataFrame]) -> Optional[gpd.GeoDataFrame]:
-    """Reproject GeoDataFrame to plotting CRS."""
+def load_layers(tasks: List[tuple]) -> Dict[str, object]:
+    """
+    Run (name, loader) tasks on a thread pool and return {name: result}.
+
+    Results are collected in task order, so the first failing loader's error
+    is the one raised.
+    """
+    if not tasks:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(tasks))) as executor:
+        futures = [(name, executor.submit(loader)) for name, loader in tasks]
+        return {name: future.result() for name, future in futures}
+
+
+def demo_columns(acs_year: int) -> Dict[str, str]:
+    """Precinct demographic column -> district stats column, for one ACS year."""
+    year_suffix = str(acs_year)[-2:]
+    return {k.format(yy=year_suffix): v for k, v in DEMO_COLS_TEMPLATE.items()}
+
+
+def is_election_col(col: str) -> bool:
+    """Whether col is an election result column (see ELECTION_COL_RE)."""
+    return ELECTION_COL_RE.match(col) is not None
+
+
+def precinct_columns(path: str, acs_year: int, with_stats: bool) -> List[str]:
+    """
+    Attribute columns Stage 4 needs from the precinct layer: none for drawing
+    alone; UNIQUE_ID, the demographic/household columns and election results
+    for --show-stats.
+    """
+    from pyogrio import read_info
+
+    if not with_stats:
+        return []
+    households_col = HOUSEHOLDS_COL_TEMPLATE.format(yy=str(acs_year)[-2:])
+    election_cols = [c for c in read_info(path)["fields"] if is_election_col(c)]
+    return ['UNIQUE_ID', *demo_columns(acs_year), households_col, *election_cols]
+
+
+def downcast_counts(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Narrow numeric count columns in place to the smallest int/float dtype that
+    holds them (int64 -> int32, float64 -> float32); other columns are skipped.
+    """
+    import pandas as pd
+
+    for col in columns:
+        if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+            kind = 'integer' if pd.api.types.is_integer_dtype(df[col]) else 'float'
+            df[col] = pd.to_numeric(df[col], downcast=kind)
+    return df
+
+
+def load_plan_layer(path: str, name: str, bbox: Optional[tuple] = None) -> gpd.GeoDataFrame:
+    """Load a plan shapefile keeping only its district identifier and geometry."""
+    return load_layer_simple(path, name, columns=list(DISTRICT_COLS), bbox=bbox)
+
+
+def _cache_prefix(cache_dir: str, src_path: str) -> str:
+    """Shared file name prefix of every cache entry for src_path (basename + path digest)."""
+    path_digest = hashlib.md5(os.path.abspath(src_path).encode()).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{os.path.basename(src_path)}.{path_digest}.")
+
+
+def _cache_path(cache_dir: str, src_path: str, columns, bbox=None) -> str:
+    """GeoParquet cache file for src_path's layer (with these columns, read within bbox) in PLOT_CRS."""
+    key = "|".join([str(os.path.getmtime(src_path)), ",".join(map(str, columns)), str(bbox), PLOT_CRS])
+    digest = hashlib.md5(key.encode()).hexdigest()
+    return f"{_cache_prefix(cache_dir, src_path)}{digest}.parquet"
+
+
+def _prune_cache(cache_dir: str, src_path: str, keep: str):
+    """Delete src_path's cache entries other than keep (older mtimes, other columns/bbox)."""
+    prefix = os.path.basename(_cache_prefix(cache_dir, src_path))
+    with os.scandir(cache_dir) as entries:
+        stale = [e.path for e in entries
+                 if e.name.startswith(prefix) and e.name.endswith(".parquet") and e.path != keep]
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=None)
+def plot_transformer(src_crs) -> Transformer:
+    """Transformer from src_crs to PLOT_CRS, built once per source CRS."""
+    from pyproj import Transformer
+
+    return Transformer.from_crs(src_crs, PLOT_CRS, always_xy=True)
+
+
+def to_plot_crs(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Reproject gdf to PLOT_CRS: every vertex goes through the cached
+    transformer in one array call (shapely.transform), not per geometry.
+    """
+    import numpy as np
+    import geopandas as gpd
+    import shapely
+
+    transformer = plot_transformer(gdf.crs)
+
+    def project(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(coords[:, 0], coords[:, 1]))
+
+    projected = shapely.transform(np.asarray(gdf.geometry.values), project)
+    return gdf.set_geometry(gpd.GeoSeries(projected, index=gdf.index, crs=PLOT_CRS, name=gdf.geometry.name))
+
+
+def prep_for_plot(gdf: Optional[gpd.GeoDataFrame], src_path: Optional[str] = None,
+                  cache_dir: Optional[str] = None) -> Optional[gpd.GeoDataFrame]:
+    """
+    Reproject GeoDataFrame to plotting CRS, in one hop from its own CRS.
+
+    With cache_dir (and pyarrow installed) the result is cached as GeoParquet,
+    keyed by the source path (src_path, else the one load_layer_simple
+    recorded), its mtime, the loaded columns and read bbox, so repeat runs
+    skip the reprojection. Writing an entry removes the source's older ones.
+    """
+    import geopandas as gpd
+
+    if gdf is None:
+        return None
+    src_path = src_path or gdf.attrs.get("source_path")
+    if not (HAS_PYARROW and src_path and cache_dir and os.path.exists(src_path)):
+        return to_plot_crs(gdf)
+
+    cache = _cache_path(cache_dir, src_path, gdf.columns, gdf.attrs.get("bbox"))
+    if os.path.exists(cache):
+        return gpd.read_parquet(cache)
+    gdf_plot = to_plot_crs(gdf)
+    os.makedirs(cache_dir, exist_ok=True)
+    gdf_plot.to_parquet(cache, compression="zstd")
+    # One entry per source: a new mtime/column set replaces the old file
+    _prune_cache(cache_dir, src_path, cache)
+    return gdf_plot
+
+
+def within_bounds(gdf: Optional[gpd.GeoDataFrame], bounds) -> Optional[gpd.GeoDataFrame]:
+    """Rows of gdf whose geometry intersects the bounds box (spatial index query)."""
+    import numpy as np
+    import shapely
+
+    if gdf is None:
+        return None
+    hits = gdf.sindex.query(shapely.box(*bounds), predicate="intersects")
+    return gdf.iloc[np.sort(hits)]
+
+
+def simplify_for_plot(gdf: Optional[gpd.GeoDataFrame], tolerance: float) -> Optional[gpd.GeoDataFrame]:
+    """Douglas-Peucker simplify a plotting copy; detail below tolerance is sub-pixel."""
+    import numpy as np
+    import geopandas as gpd
+    import shapely
+
+    if gdf is None:
+        return None
+    simplified = shapely.simplify(np.asarray(gdf.geometry.values), tolerance, preserve_topology=False)
+    return gdf.set_geometry(gpd.GeoSeries(simplified, index=gdf.index, crs=gdf.crs, name=gdf.geometry.name))
+
+
+def boundary_segments(gdf: Optional[gpd.GeoDataFrame]) -> Optional[List[np.ndarray]]:
+    """
+    Vertex arrays of every boundary line in gdf, for a LineCollection.
+
+    Extracted once with vectorized shapely calls so each figure only wraps the
+    same segments in a new collection.
+    """
+    import numpy as np
+    import shapely
+
     if gdf is None:
         return None
-    return gdf.to_crs(WORK_CRS).to_crs(PLOT_CRS)
+    lines = shapely.get_parts(shapely.boundary(np.asarray(gdf.geometry.values)))
+    coords, line_idx = shapely.get_coordinates(lines, return_index=True)
+    return np.split(coords, np.flatnonzero(np.diff(line_idx)) + 1) if len(coords) else []
+
+
+def add_boundaries(ax, segments: List[np.ndarray], **style):
+    """Draw precomputed boundary segments as a single LineCollection."""
+    from matplotlib.collections import LineCollection
+
+    ax.add_collection(LineCollection(segments, **style))
 
 
 def add_district_labels(ax, districts_gdf, label_col="DISTRICT"):
@@ -112,14 +387,16 @@ def add_district_labels(ax, districts_gdf, label_col="DISTRICT"):
     if label_col not in districts_gdf.columns:
         print(f"⚠ District label column '{label_col}' not found")
         return
-    for _, row in districts_gdf.iterrows():
-        if row.geometry is None or row.geometry.is_empty:
-            continue
-        centroid = row.geometry.representative_point()
+    # Label anchors for all districts in one vectorized call
+    geoms = districts_gdf.geometry
+    has_geom = (geoms.notna() & ~geoms.is_empty).to_numpy()
+    points = geoms[has_geom].representative_point()
+    labels = districts_gdf[label_col].astype(str).to_numpy()[has_geom]
+    for x, y, label in zip(points.x.to_numpy(), points.y.to_numpy(), labels):
         txt = ax.text(
-            centroid.x,
-            centroid.y,
-            str(row[label_col]),
+            x,
+            y,
+            label,
             fontsize=8,
             ha="center",
             va="center",
@@ -132,8 +409,19 @@ def add_district_labels(ax, districts_gdf, label_col="DISTRICT"):
 
 def load_dots(state_paths: dict, dot_unit: int, acs_year: int) -> Optional[gpd.GeoDataFrame]:
     """Load dot density data from Stage 3 output."""
-    # Try combined file first
+    import numpy as np
+    import pandas as pd
+    import geopandas as gpd
+
+    # Try combined file first (its GeoParquet copy from Stage 3 when current)
     dots_combined = state_paths["dots_geojson"].format(dot_unit=dot_unit)
+    dots_parquet = state_paths["dots_parquet"].format(dot_unit=dot_unit)
+    
+    if importlib.util.find_spec("pyarrow") is not None and is_up_to_date(dots_parquet, dots_combined):
+        print(f"Loading dot layer (combined): {dots_parquet}")
+        dots = gpd.read_parquet(dots_parquet)
+        dots.attrs["source_path"] = dots_parquet
+        return dots
     
     if os.path.exists(dots_combined):
         print(f"Loading dot layer (combined): {dots_combined}")
@@ -159,65 +447,211 @@ def load_dots(state_paths: dict, dot_unit: int, acs_year: int) -> Optional[gpd.G
         "two_or_more": os.path.join(state_out_dir, f"{state_abbr}_dots_pop{year_suffix}_unit{dot_unit}_two_or_more.geojson"),
     }
 
-    pieces = []
-    crs = None
+    group_paths = {}
     for group, path in dot_group_files.items():
         if not os.path.exists(path):
             print(f"⚠ Per-group dots file missing for {group}: {path}")
             continue
-        g = load_layer_simple(path, f"dots for {group}")
-        g["group"] = group
-        pieces.append(g)
-        if crs is None:
-            crs = g.crs
+        group_paths[group] = path
 
-    if not pieces:
+    if not group_paths:
         print("⚠ No dots files found.")
         return None
 
-    dots = gpd.GeoDataFrame(pd.concat(pieces, ignore_index=True), crs=crs)
+    if HAS_PYARROW:
+        try:
+            return read_dot_groups_arrow(group_paths)
+        except RuntimeError:
+            pass  # GDAL too old for Arrow reads (< 3.6)
+
+    geometries = []
+    crs = None
+    for group, path in group_paths.items():
+        g = load_layer_simple(path, f"dots for {group}", columns=[])
+        geometries.append(np.asarray(g.geometry.values))
+        if crs is None:
+            crs = g.crs
+
+    # Geometry arrays and per-dot group codes are concatenated with NumPy and
+    # wrapped once, with a categorical group column
+    group_codes = np.repeat(np.arange(len(geometries)), [len(geoms) for geoms in geometries])
+    group = pd.Categorical.from_codes(group_codes, categories=list(group_paths))
+    dots = gpd.GeoDataFrame({"group": group}, geometry=np.concatenate(geometries), crs=crs)
     return dots
 
 
+def read_dot_groups_arrow(group_paths: Dict[str, str]) -> gpd.GeoDataFrame:
+    """
+    Read per-group dot files as Arrow tables and build one GeoDataFrame.
+
+    Only geometry is read from each file; an int8 'group' code column is
+    appended and the tables are concatenated (chunks, no copy) before a single
+    conversion, with 'group' as a categorical.
+    """
+    import numpy as np
+    import pandas as pd
+    import geopandas as gpd
+    import shapely
+    import pyarrow as pa
+    from pyogrio.raw import read_arrow
+
+    tables = []
+    crs = None
+    for code, (group, path) in enumerate(group_paths.items()):
+        print(f"Loading dots for {group}: {path}")
+        meta, table = read_arrow(path, columns=[])
+        geom_col = meta["geometry_name"] or "wkb_geometry"
+        table = table.select([geom_col]).rename_columns(["geometry"])
+        tables.append(table.append_column("group", pa.array(np.full(table.num_rows, code, dtype=np.int8))))
+        if crs is None:
+            crs = meta["crs"]
+
+    combined = pa.concat_tables(tables)
+    geometry = shapely.from_wkb(combined.column("geometry").to_numpy())
+    group_codes = combined.column("group").to_numpy()
+    return gpd.GeoDataFrame(
+        {"group": pd.Categorical.from_codes(group_codes, categories=list(group_paths))},
+        geometry=geometry,
+        crs=crs or "EPSG:4326",
+    )
+
+
+def render_base_raster(draw_base, bounds) -> np.ndarray:
+    """
+    Render the base layers once, offscreen, to an RGBA array covering bounds.
+
+    Drawn at RASTER_BASE_SCALE x the screen dpi so every map window can show it
+    with imshow instead of re-rendering the precinct lines and dots. The
+    canvas has the bounds' aspect ratio (fitted inside FIGSIZE), so the image
+    is geographically true when shown at equal aspect.
+    """
+    import numpy as np
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    minx, miny, maxx, maxy = bounds
+    inches_per_unit = min(FIGSIZE[0] / (maxx - minx), FIGSIZE[1] / (maxy - miny))
+    figsize = ((maxx - minx) * inches_per_unit, (maxy - miny) * inches_per_unit)
+    fig = Figure(figsize=figsize, dpi=plt.rcParams["figure.dpi"] * RASTER_BASE_SCALE)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 1])
+    draw_base(ax)
+    ax.set_xlim(minx, maxx)
+    ax.set_ylim(miny, maxy)
+    ax.set_aspect("equal")
+    ax.set_axis_off()
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
 def plot_dots(ax, dots_plot: Optional[gpd.GeoDataFrame]):
-    """Plot dot density points with group-specific colors."""
+    """
+    Plot dot density points with group-specific colors.
+
+    The points are rasterized (district lines and labels stay vector), which
+    keeps saved PDFs/SVGs small.
+    """
+    import pandas as pd
+
     if dots_plot is None or dots_plot.empty:
         return
 
+    xs = dots_plot.geometry.x.to_numpy()
+    ys = dots_plot.geometry.y.to_numpy()
+
     if "group" not in dots_plot.columns:
-        dots_plot.plot(
-            ax=ax,
-            markersize=2,
-            color="#444444",
-            alpha=0.6,
-            linewidth=0,
-            zorder=5,
-        )
+        ax.scatter(xs, ys, s=2, c="#444444", alpha=0.6, linewidths=0, zorder=5, rasterized=True)
         return
 
-    for group, color in DOT_COLORS.items():
-        subset = dots_plot[dots_plot["group"] == group]
-        if subset.empty:
-            continue
-        subset.plot(
-            ax=ax,
-            markersize=2,
-            color=color,
-            alpha=0.8,
-            linewidth=0,
-            zorder=5,
-        )
+    # One scatter with a color per dot instead of one artist per group: RGBA
+    # rows picked by group code, so matplotlib never parses per-dot color
+    # strings; groups without a color (code -1) are skipped
+    codes = pd.Categorical(dots_plot["group"], categories=list(DOT_COLORS)).codes
+    known = codes >= 0
+    if HAS_DATASHADER and known.sum() > DATASHADER_MIN_DOTS:
+        shade_dots(ax, xs[known], ys[known], codes[known])
+        return
+    ax.scatter(
+        xs[known],
+        ys[known],
+        s=2,
+        c=dot_rgba()[codes[known]],
+        alpha=0.8,
+        linewidths=0,
+        zorder=5,
+        rasterized=True,
+    )
+
+
+def shade_dots(ax, xs: np.ndarray, ys: np.ndarray, codes: np.ndarray):
+    """
+    Draw the dots as a datashader image: per-pixel counts by group, blended
+    with DOT_COLORS, on a canvas matching the axes' size in pixels.
+    """
+    import numpy as np
+    import pandas as pd
+
+    import datashader as ds
+    import datashader.transfer_functions as tf
+
+    points = pd.DataFrame({
+        "x": xs,
+        "y": ys,
+        "group": pd.Categorical.from_codes(codes, categories=list(DOT_COLORS)),
+    })
+    x_range = (float(xs.min()), float(xs.max()))
+    y_range = (float(ys.min()), float(ys.max()))
+    bbox = ax.get_window_extent()
+    canvas = ds.Canvas(
+        plot_width=max(int(bbox.width), 1),
+        plot_height=max(int(bbox.height), 1),
+        x_range=x_range,
+        y_range=y_range,
+    )
+    agg = canvas.points(points, "x", "y", ds.count_cat("group"))
+    img = tf.shade(agg, color_key=DOT_COLORS)
+    # Packed uint32 RGBA -> (rows, cols, 4) bytes; row 0 is the minimum y
+    rgba = img.data.view(np.uint8).reshape(img.shape + (4,))
+    ax.imshow(
+        rgba,
+        extent=(*x_range, *y_range),
+        origin="lower",
+        interpolation="nearest",
+        aspect="auto",
+        alpha=0.8,
+        zorder=5,
+    )
+
+
+def scan_plan_dirs(plans_dir: str) -> List[tuple]:
+    """(lowercased name, name) for each plan directory, from a single scandir pass."""
+    if not os.path.isdir(plans_dir):
+        return []
+    with os.scandir(plans_dir) as entries:
+        return [(e.name.lower(), e.name) for e in entries if e.is_dir()]
+
+
+def detect_plan_file(plans_dir: str, plan_entries: List[tuple], match, plan_type: str) -> Optional[str]:
+    """Shapefile of the first scanned plan directory whose lowercased name satisfies match."""
+    for name_lower, name in plan_entries:
+        if match(name_lower):
+            path = find_plan_file(plans_dir, name, plan_type)
+            if path:
+                return path
+    return None
 
 
 def find_plan_file(plans_dir: str, plan_name: str, plan_type: str) -> Optional[str]:
     """Find the shapefile for a redistricting plan."""
     plan_dir = os.path.join(plans_dir, plan_name)
-    if not os.path.exists(plan_dir):
+    if not os.path.isdir(plan_dir):
         print(f"⚠ {plan_type} plan directory not found: {plan_dir}")
         return None
         
     # Look for .shp files in the plan directory
-    shp_files = [f for f in os.listdir(plan_dir) if f.endswith('.shp')]
+    with os.scandir(plan_dir) as entries:
+        shp_files = [e.name for e in entries if e.name.endswith('.shp')]
     
     if not shp_files:
         print(f"⚠ No .shp files found in {plan_type} plan directory: {plan_dir}")
@@ -238,118 +672,134 @@ def find_plan_file(plans_dir: str, plan_name: str, plan_type: str) -> Optional[s
     return os.path.join(plan_dir, shp_files[0])
 
 
+def load_assignments(assignment_shards: List[str]) -> Optional[pd.DataFrame]:
+    """
+    Load Stage 2 assignment shards into one DataFrame (categorical state/plan_id).
+
+    Each shard is parsed once with pandas.read_json; with pyarrow installed a
+    Parquet snapshot is kept next to it and reused while it is newer than the
+    shard.
+    """
+    import pandas as pd
+
+    frames = []
+    for shard in assignment_shards:
+        snapshot = os.path.splitext(shard)[0] + ".parquet"
+        if HAS_PYARROW and is_up_to_date(snapshot, shard):
+            frames.append(pd.read_parquet(snapshot))
+            continue
+        df = pd.read_json(shard, orient="records", lines=True, dtype=ASSIGNMENT_DTYPES)
+        if HAS_PYARROW:
+            df.to_parquet(snapshot, index=False)
+        frames.append(df)
+
+    if not frames:
+        return None
+    return pd.concat(frames, ignore_index=True)
+
+
 def compute_district_stats(
     precincts: gpd.GeoDataFrame,
-    assignments_file: str,
+    assignments: Optional[pd.DataFrame],
     plan_id: str,
     state_abbr: str,
     acs_year: int
 ) -> Optional[pd.DataFrame]:
     """
-    Compute district-level statistics from precinct data and assignments.
+    Compute district-level statistics from precinct data and assignments
+    (see load_assignments).
     
     Returns DataFrame with columns: district_id, total_pop, median_income, 
     cvap_total, white_pop, black_pop, hispanic_pop, asian_pop, etc.
     """
-    # Load assignments
-    if not os.path.exists(assignments_file):
-        print(f"⚠ Assignments file not found: {assignments_file}")
+    import numpy as np
+    import pandas as pd
+    from scipy import sparse
+
+    if assignments is None:
+        print(f"⚠ No assignment shards found for {state_abbr.upper()}")
         return None
     
-    with open(assignments_file, 'r') as f:
-        all_assignments = json.load(f)
-    
     # Filter for this plan
-    plan_assignments = [
-        a for a in all_assignments 
-        if a.get('plan_id') == plan_id and a.get('state') == state_abbr.upper()
-    ]
+    plan_mask = (assignments['plan_id'] == plan_id) & (assignments['state'] == state_abbr.upper())
+    assignments_df = assignments.loc[plan_mask, ['precinct_id', 'district_id']]
     
-    if not plan_assignments:
+    if assignments_df.empty:
         print(f"⚠ No assignments found for plan {plan_id}")
         return None
     
-    # Create assignments DataFrame
-    assignments_df = pd.DataFrame(plan_assignments)
-    
-    # Merge precincts with assignments
-    precincts_with_district = precincts.merge(
-        assignments_df[['precinct_id', 'district_id']],
-        left_on='UNIQUE_ID',
-        right_on='precinct_id',
+    # Merge precinct attributes with assignments; geometry is never aggregated,
+    # so work on a plain DataFrame without it
+    precinct_attrs = pd.DataFrame(precincts.drop(columns=precincts.geometry.name))
+    # Both ID columns are coded against one shared category set, so the join
+    # hashes int32 codes instead of ID strings
+    precinct_uids = precinct_attrs['UNIQUE_ID'].astype(str)
+    assignment_uids = assignments_df['precinct_id'].astype(str)
+    uid_categories = pd.Index(pd.concat([precinct_uids, assignment_uids], ignore_index=True).unique())
+    precinct_attrs['_uid'] = pd.Categorical(precinct_uids, categories=uid_categories).codes.astype(np.int32)
+    district_by_uid = pd.DataFrame({
+        '_uid': pd.Categorical(assignment_uids, categories=uid_categories).codes.astype(np.int32),
+        'district_id': assignments_df['district_id'].to_numpy(),
+    })
+    precincts_with_district = precinct_attrs.merge(
+        district_by_uid,
+        on='_uid',
         how='inner'
-    )
+    ).drop(columns='_uid')
     
     if precincts_with_district.empty:
         print(f"⚠ No matching precincts found for plan {plan_id}")
         return None
     
-    # Get year suffix for column names
-    year_suffix = str(acs_year)[-2:]
-    
     # Define demographic columns to aggregate
-    demo_cols = {
-        f'TOT_POP{year_suffix}': 'total_pop',
-        f'WHT_POP{year_suffix}': 'white_pop',
-        f'BLK_POP{year_suffix}': 'black_pop',
-        f'HSP_POP{year_suffix}': 'hispanic_pop',
-        f'ASN_POP{year_suffix}': 'asian_pop',
-        f'AIA_POP{year_suffix}': 'native_pop',
-        f'HPI_POP{year_suffix}': 'nhpi_pop',
-        f'OTH_POP{year_suffix}': 'other_pop',
-        f'2OM_POP{year_suffix}': 'two_or_more_pop',
-        f'WHT_CVAP{year_suffix}': 'white_cvap',
-        f'BLK_CVAP{year_suffix}': 'black_cvap',
-        f'HSP_CVAP{year_suffix}': 'hispanic_cvap',
-        f'ASN_CVAP{year_suffix}': 'asian_cvap',
-    }
+    demo_cols = demo_columns(acs_year)
     
     # Filter to only columns that exist
     available_cols = {k: v for k, v in demo_cols.items() if k in precincts_with_district.columns}
     
-    # Group by district and sum
-    agg_dict = {col: 'sum' for col in available_cols.keys()}
-    
-    # Add total households if available
-    households_col = f'TOT_HOUS{year_suffix}'
+    # Columns summed per district: demographics, households, election results
+    households_col = HOUSEHOLDS_COL_TEMPLATE.format(yy=str(acs_year)[-2:])
+    election_cols = [
+        col for col in precincts_with_district.columns
+        if is_election_col(col) and pd.api.types.is_numeric_dtype(precincts_with_district[col])
+    ]
+    sum_cols = list(available_cols)
     if households_col in precincts_with_district.columns:
-        agg_dict[households_col] = 'sum'
+        sum_cols.append(households_col)
+    sum_cols += election_cols
     
-    district_stats = precincts_with_district.groupby('district_id').agg(agg_dict).reset_index()
+    # Sum every column in one pass: dense (sorted) district codes and a sparse
+    # (districts x precincts) 0/1 matrix multiplied with the value matrix
+    # (inputs may be int32/float32, see downcast_counts; sums stay float64)
+    codes, district_ids = pd.factorize(precincts_with_district['district_id'], sort=True)
+    values = np.nan_to_num(precincts_with_district[sum_cols].to_numpy(dtype=np.float64))
+    indicator = sparse.csr_matrix(
+        (np.ones(len(codes)), (codes, np.arange(len(codes)))),
+        shape=(len(district_ids), len(codes)),
+    )
+    district_stats = pd.DataFrame(indicator @ values, columns=sum_cols)
+    district_stats.insert(0, 'district_id', district_ids)
     
     # Rename columns
-    for old_col, new_col in available_cols.items():
-        if old_col in district_stats.columns:
-            district_stats.rename(columns={old_col: new_col}, inplace=True)
-    
-    # Rename households column
-    if households_col in district_stats.columns:
-        district_stats.rename(columns={households_col: 'total_households'}, inplace=True)
-    
-    # Add election results if available
-    election_cols = [col for col in precincts_with_district.columns if col.startswith('G') and any(yr in col for yr in ['20', '22', '24'])]
-    if election_cols:
-        election_agg = precincts_with_district.groupby('district_id')[election_cols].sum().reset_index()
-        district_stats = district_stats.merge(election_agg, on='district_id', how='left')
+    district_stats.rename(columns={**available_cols, households_col: 'total_households'}, inplace=True)
     
     # Calculate total CVAP
     cvap_cols = [col for col in district_stats.columns if col.endswith('_cvap')]
     if cvap_cols:
         district_stats['cvap_total'] = district_stats[cvap_cols].sum(axis=1)
     
-    # Sort by district_id
-    district_stats = district_stats.sort_values('district_id')
-    
     return district_stats
 
 
 def print_district_stats(stats: pd.DataFrame, plan_name: str):
     """Print district statistics in a formatted table."""
+    import numpy as np
+
     if stats is None or stats.empty:
         return
     
     # Check for election results
-    election_cols = [col for col in stats.columns if col.startswith('G') and any(yr in col for yr in ['20', '22', '24'])]
+    election_cols = [col for col in stats.columns if is_election_col(col)]
     has_elections = len(election_cols) > 0
     
     print(f"\n{'='*140 if has_elections else '='*120}")
@@ -359,52 +809,60 @@ def print_district_stats(stats: pd.DataFrame, plan_name: str):
     # Print header
     if has_elections:
         # Find party columns (match actual patterns like G24PREDHAR, G24PRERTRU)
-        dem_cols = [col for col in election_cols if 'DHAR' in col or 'DEM' in col.upper()]
-        rep_cols = [col for col in election_cols if 'RTRU' in col or 'REP' in col.upper() or 'TRU' in col]
+        dem_cols = [col for col in election_cols if DEM_COL_RE.search(col)]
+        rep_cols = [col for col in election_cols if REP_COL_RE.search(col)]
         print(f"{'District':<10} {'Total Pop':>12} {'Households':>12} {'CVAP':>12} {'White %':>9} {'Black %':>9} {'Hisp %':>9} {'Asian %':>9} {'Dem Votes':>12} {'Rep Votes':>12}")
     else:
         print(f"{'District':<10} {'Total Pop':>12} {'Households':>12} {'CVAP':>12} {'White %':>9} {'Black %':>9} {'Hispanic %':>10} {'Asian %':>10}")
     print(f"{'-'*140 if has_elections else '-'*120}")
     
+    # Per-district columns as NumPy arrays (missing columns read as zeros)
+    n = len(stats)
+
+    def column(name: str) -> np.ndarray:
+        return stats[name].to_numpy(dtype=np.float64) if name in stats.columns else np.zeros(n)
+
+    districts = ["ZZZ" if d == -1 else str(d) for d in stats['district_id'].tolist()]
+    total_pop = column('total_pop').astype(np.int64)
+    total_households = column('total_households').astype(np.int64)
+    cvap = column('cvap_total').astype(np.int64)
+
+    # Percentages of total population (0 where a district has no population)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = {
+            name: np.where(total_pop > 0, column(name) / total_pop * 100, 0.0)
+            for name in ('white_pop', 'black_pop', 'hispanic_pop', 'asian_pop')
+        }
+
+    if has_elections:
+        dem_votes = stats[dem_cols].sum(axis=1).to_numpy().astype(np.int64)
+        rep_votes = stats[rep_cols].sum(axis=1).to_numpy().astype(np.int64)
+
     # Print each district
-    for _, row in stats.iterrows():
-        district = row['district_id']
-        if district == -1:
-            district = "ZZZ"
-        
-        total_pop = int(row.get('total_pop', 0))
-        total_households = int(row.get('total_households', 0))
-        cvap = int(row.get('cvap_total', 0))
-        
-        # Calculate percentages
-        white_pct = (row.get('white_pop', 0) / total_pop * 100) if total_pop > 0 else 0
-        black_pct = (row.get('black_pop', 0) / total_pop * 100) if total_pop > 0 else 0
-        hispanic_pct = (row.get('hispanic_pop', 0) / total_pop * 100) if total_pop > 0 else 0
-        asian_pct = (row.get('asian_pop', 0) / total_pop * 100) if total_pop > 0 else 0
-        
+    for i, district in enumerate(districts):
+        white_pct, black_pct = pct['white_pop'][i], pct['black_pop'][i]
+        hispanic_pct, asian_pct = pct['hispanic_pop'][i], pct['asian_pop'][i]
         if has_elections:
-            dem_votes = int(sum(row.get(col, 0) for col in dem_cols))
-            rep_votes = int(sum(row.get(col, 0) for col in rep_cols))
-            print(f"{str(district):<10} {total_pop:>12,} {total_households:>12,} {cvap:>12,} {white_pct:>8.1f}% {black_pct:>8.1f}% {hispanic_pct:>8.1f}% {asian_pct:>8.1f}% {dem_votes:>12,} {rep_votes:>12,}")
+            print(f"{district:<10} {total_pop[i]:>12,} {total_households[i]:>12,} {cvap[i]:>12,} {white_pct:>8.1f}% {black_pct:>8.1f}% {hispanic_pct:>8.1f}% {asian_pct:>8.1f}% {dem_votes[i]:>12,} {rep_votes[i]:>12,}")
         else:
-            print(f"{str(district):<10} {total_pop:>12,} {total_households:>12,} {cvap:>12,} {white_pct:>8.1f}% {black_pct:>8.1f}% {hispanic_pct:>9.1f}% {asian_pct:>9.1f}%")
+            print(f"{district:<10} {total_pop[i]:>12,} {total_households[i]:>12,} {cvap[i]:>12,} {white_pct:>8.1f}% {black_pct:>8.1f}% {hispanic_pct:>9.1f}% {asian_pct:>9.1f}%")
     
     # Print totals
     print(f"{'-'*140 if has_elections else '-'*120}")
     total_pop_all = int(stats['total_pop'].sum())
-    total_cvap_all = int(stats.get('cvap_total', pd.Series([0])).sum())
-    total_households_all = int(stats.get('total_households', pd.Series([0])).sum())
+    total_cvap_all = int(cvap.sum())
+    total_households_all = int(total_households.sum())
     
     if has_elections:
-        total_dem = int(sum(stats[col].sum() for col in dem_cols))
-        total_rep = int(sum(stats[col].sum() for col in rep_cols))
+        total_dem = int(dem_votes.sum())
+        total_rep = int(rep_votes.sum())
         print(f"{'TOTAL':<10} {total_pop_all:>12,} {total_households_all:>12,} {total_cvap_all:>12,} {'':>9} {'':>9} {'':>9} {'':>9} {total_dem:>12,} {total_rep:>12,}")
     else:
         print(f"{'TOTAL':<10} {total_pop_all:>12,} {total_households_all:>12,} {total_cvap_all:>12,}")
     print(f"{'='*140 if has_elections else '='*120}\n")
 
 
-def main():
+def main(argv=None):
     """Main function that processes command line arguments and runs the stage."""
     # Parse command line arguments
     parser = setup_argument_parser(
@@ -443,107 +901,118 @@ def main():
         help="Display district-level statistics (population, income, CVAP)"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--no-plot",
+        action="store_true",
+        help="Skip the map windows (use with --show-stats for stats only)"
+    )
+
+    parser.add_argument(
+        "--raster-base",
+        action="store_true",
+        help="Render precincts and dots once as an image shared by every map window "
+             "(faster with several plans; the base pixelates when zoomed)"
+    )
+
+    args = parser.parse_args(argv)
+    if args.no_plot and not args.show_stats:
+        print("⚠ --no-plot without --show-stats: nothing to do")
+        return
 
     # Validate state and get configuration
     state_info, state_paths = validate_state_setup(args.state)
     print_state_info(state_info)
 
-    # 1. Load block groups (TIGER shapefile)
-    bg_tiger_path = state_paths["tiger_bg_shp"]
-    if not os.path.exists(bg_tiger_path):
-        raise FileNotFoundError(f"TIGER block groups not found: {bg_tiger_path}")
-    bg = load_layer_simple(bg_tiger_path, "BG TIGER layer")
+    from pyogrio import read_info
 
-    # 2. Load precincts (from Stage 2)
+    # 1. Precincts (from Stage 2)
     precinct_path = state_paths["precinct_geojson"]
     if not os.path.exists(precinct_path):
         raise FileNotFoundError(
             f"Precinct data not found: {precinct_path}\n"
             "Run Stage 2 to generate it first."
         )
-    precincts = load_layer_simple(precinct_path, "Precinct layer")
-
-    # 3. Load dots (from Stage 3)
-    dots = load_dots(state_paths, args.dot_unit, state_paths["acs_year"])
-    if dots is not None and "group" in dots.columns:
-        print("\nDot counts by group:")
-        print(dots["group"].value_counts())
+    # Drawing needs only geometry; --show-stats adds the aggregated columns
+    precinct_cols = precinct_columns(precinct_path, state_paths["acs_year"], args.show_stats)
+    # The precincts tile the state: plan files (which may be national) are
+    # read only within their extent
+    precinct_info = read_info(precinct_path, force_total_bounds=True)
+    state_bounds, state_crs = precinct_info["total_bounds"], precinct_info["crs"]
 
-    # 4. Load redistricting plans
+    # 2. Redistricting plans
     plans_dir = state_paths["plans_dir"]
+    # One directory scan serves every chamber's auto-detection
+    plan_entries = scan_plan_dirs(plans_dir)
     
     # Auto-detect or use specified congressional plan
-    cong = None
     if args.cong_plan:
         cong_path = find_plan_file(plans_dir, args.cong_plan, "Congressional")
-        if cong_path:
-            cong = load_layer_simple(cong_path, "Congressional plan")
     else:
-        # Auto-detect congressional plans
-        if os.path.exists(plans_dir):
-            for item in os.listdir(plans_dir):
-                if 'cong' in item.lower() and 'adopted' in item.lower():
-                    cong_path = find_plan_file(plans_dir, item, "Congressional")
-                    if cong_path:
-                        cong = load_layer_simple(cong_path, "Congressional plan")
-                        break
+        cong_path = detect_plan_file(
+            plans_dir, plan_entries, lambda low: 'cong' in low and 'adopted' in low, "Congressional")
 
     # Auto-detect or use specified legislative plans (can have multiple chambers)
-    leg_plans = {}
-    
-    # Check for SLDL (State Legislative Lower)
-    if hasattr(args, 'sldl_plan') and args.sldl_plan:
-        sldl_path = find_plan_file(plans_dir, args.sldl_plan, "State Legislative Lower")
-        if sldl_path:
-            leg_plans['sldl'] = load_layer_simple(sldl_path, "State Legislative Lower plan")
-    else:
-        # Auto-detect SLDL
-        if os.path.exists(plans_dir):
-            for item in os.listdir(plans_dir):
-                if 'sldl' in item.lower() and 'adopted' in item.lower():
-                    sldl_path = find_plan_file(plans_dir, item, "State Legislative Lower")
-                    if sldl_path:
-                        leg_plans['sldl'] = load_layer_simple(sldl_path, "State Legislative Lower plan")
-                        break
-    
-    # Check for SLDU (State Legislative Upper)
-    if hasattr(args, 'sldu_plan') and args.sldu_plan:
-        sldu_path = find_plan_file(plans_dir, args.sldu_plan, "State Legislative Upper")
-        if sldu_path:
-            leg_plans['sldu'] = load_layer_simple(sldu_path, "State Legislative Upper plan")
-    else:
-        # Auto-detect SLDU
-        if os.path.exists(plans_dir):
-            for item in os.listdir(plans_dir):
-                if 'sldu' in item.lower() and 'adopted' in item.lower():
-                    sldu_path = find_plan_file(plans_dir, item, "State Legislative Upper")
-                    if sldu_path:
-                        leg_plans['sldu'] = load_layer_simple(sldu_path, "State Legislative Upper plan")
-                        break
+    leg_paths = {}
+    leg_chambers = (
+        ('sldl', args.sldl_plan, "State Legislative Lower"),
+        ('sldu', args.sldu_plan, "State Legislative Upper"),
+    )
+    for chamber, plan_name, plan_type in leg_chambers:
+        if plan_name:
+            leg_path = find_plan_file(plans_dir, plan_name, plan_type)
+        else:
+            leg_path = detect_plan_file(
+                plans_dir, plan_entries, lambda low: chamber in low and 'adopted' in low, plan_type)
+        if leg_path:
+            leg_paths[chamber] = (leg_path, plan_type)
     
     # Fallback: check for generic 'sl' (unicameral legislature)
-    if not leg_plans and os.path.exists(plans_dir):
-        for item in os.listdir(plans_dir):
-            if item.lower().startswith(state_info['abbr'] + '_sl_') and 'sldl' not in item.lower() and 'sldu' not in item.lower():
-                sl_path = find_plan_file(plans_dir, item, "State Legislative")
-                if sl_path:
-                    leg_plans['sl'] = load_layer_simple(sl_path, "State Legislative plan")
-                    break
+    if not leg_paths:
+        sl_prefix = state_info['abbr'] + '_sl_'
+        sl_path = detect_plan_file(
+            plans_dir, plan_entries,
+            lambda low: low.startswith(sl_prefix) and 'sldl' not in low and 'sldu' not in low,
+            "State Legislative")
+        if sl_path:
+            leg_paths['sl'] = (sl_path, "State Legislative")
+
+    # 3. Load every layer (and the Stage 3 dots) concurrently
+    # (dots are only drawn, so --no-plot skips them)
+    load_tasks = [
+        ('precincts', lambda: load_layer_simple(precinct_path, "Precinct layer", columns=precinct_cols)),
+    ]
+    if not args.no_plot:
+        load_tasks += [
+            ('dots', lambda: load_dots(state_paths, args.dot_unit, state_paths["acs_year"])),
+        ]
+    if cong_path:
+        load_tasks.append(('cong', lambda: load_plan_layer(
+            cong_path, "Congressional plan", bbox=layer_bbox(cong_path, state_bounds, state_crs))))
+    for chamber, (leg_path, plan_type) in leg_paths.items():
+        load_tasks.append(
+            (chamber, lambda leg_path=leg_path, plan_type=plan_type: load_plan_layer(
+                leg_path, f"{plan_type} plan", bbox=layer_bbox(leg_path, state_bounds, state_crs))))
+    layers = load_layers(load_tasks)
+
+    precincts = layers['precincts']
+    dots = layers.get('dots')
+    cong = layers.get('cong')
+    leg_plans = {chamber: layers[chamber] for chamber in leg_paths}
+
+    if dots is not None and "group" in dots.columns:
+        print("\nDot counts by group:")
+        print(dots["group"].value_counts())
 
     if cong is None and not leg_plans:
         print("⚠ No redistricting plans found. Visualization will only show demographics.")
 
-    # 4a. Compute and display district statistics if requested
+    # 4. Compute and display district statistics if requested
     if args.show_stats:
-        assignments_file = os.path.join(
-            os.path.dirname(state_paths["state_output_dir"]),
-            "assignments.json"
-        )
-        plans_file = os.path.join(
-            os.path.dirname(state_paths["state_output_dir"]),
-            "plans.json"
-        )
+        # Counts are read as int64/float64; half-width copies are what every
+        # plan's merge and value matrix then scan
+        downcast_counts(precincts, precinct_cols)
+        assignments = load_assignments(find_assignment_shards(state_info['abbr']))
+        plans_file = state_paths["plans_json"]
         
         # Load plans metadata to get plan IDs
         plan_metadata = {}
@@ -561,7 +1030,7 @@ def main():
         if cong is not None and 'cong' in plan_metadata:
             stats = compute_district_stats(
                 precincts,
-                assignments_file,
+                assignments,
                 plan_metadata['cong']['plan_id'],
                 state_info['abbr'],
                 state_paths['acs_year']
@@ -574,7 +1043,7 @@ def main():
             if chamber in plan_metadata:
                 stats = compute_district_stats(
                     precincts,
-                    assignments_file,
+                    assignments,
                     plan_metadata[chamber]['plan_id'],
                     state_info['abbr'],
                     state_paths['acs_year']
@@ -582,44 +1051,91 @@ def main():
                 if stats is not None:
                     print_district_stats(stats, plan_metadata[chamber]['name'])
 
-    # 5. Reproject for plotting
-    bg_plot = prep_for_plot(bg)
-    precincts_plot = prep_for_plot(precincts)
-    cong_plot = prep_for_plot(cong)
-    leg_plots = {chamber: prep_for_plot(plan) for chamber, plan in leg_plans.items()}
-    dots_plot = prep_for_plot(dots)
+    if args.no_plot:
+        print("\n✅ Stage 4 completed! (--no-plot: no visualization)")
+        return
+
+    import matplotlib.pyplot as plt
+
+    # Paths are drawn through Agg; let it simplify and chunk the long ones
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    plt.rcParams['agg.path.chunksize'] = 20000
+
+    # 5. Reproject for plotting (cached under outputs/<state>/.cache/ between runs)
+    cache_dir = state_paths["plot_cache_dir"]
+    precincts_plot = prep_for_plot(precincts, cache_dir=cache_dir)
+    cong_plot = prep_for_plot(cong, cache_dir=cache_dir)
+    leg_plots = {chamber: prep_for_plot(plan, cache_dir=cache_dir) for chamber, plan in leg_plans.items()}
+    dots_plot = prep_for_plot(dots, cache_dir=cache_dir)
+
+    # The precincts tile the state, so their bounds are the map extent
+    plot_bounds = precincts_plot.total_bounds
+
+    # The plan read bbox was a transformed (looser) box; drop districts
+    # entirely outside the drawn extent
+    cong_plot = within_bounds(cong_plot, plot_bounds)
+    leg_plots = {chamber: within_bounds(plan, plot_bounds) for chamber, plan in leg_plots.items()}
+
+    # Simplify the drawn layers to half a screen pixel at full extent; the
+    # unsimplified layers above are what the stats use
+    minx, miny, maxx, maxy = plot_bounds
+    tolerance = (maxx - minx) / (FIGSIZE[0] * plt.rcParams["figure.dpi"] * 2)
+    precincts_plot = simplify_for_plot(precincts_plot, tolerance)
+    cong_plot = simplify_for_plot(cong_plot, tolerance)
+    leg_plots = {chamber: simplify_for_plot(plan, tolerance) for chamber, plan in leg_plots.items()}
+
+    # Boundary vertices, extracted once and shared by every figure
+    precinct_segments = boundary_segments(precincts_plot)
+    cong_segments = boundary_segments(cong_plot)
+    leg_segments = {chamber: boundary_segments(plan) for chamber, plan in leg_plots.items()}
 
     # 6. Create separate figure windows for each map type
     # This provides the best zoom/pan experience
     
     def draw_base(ax):
-        """Draw the base layers (block groups, precincts, dots)."""
-        # Block group boundaries – hidden
-        # (no plot)
+        """Draw the base layers (precincts, dots)."""
         # Precinct boundaries – thinner, dark brown, solid
-        precincts_plot.boundary.plot(
-            ax=ax,
-            linewidth=1.25,
-            edgecolor="#5C4033",  # dark brown
+        add_boundaries(
+            ax,
+            precinct_segments,
+            linewidths=1.25,
+            colors="#5C4033",  # dark brown
             alpha=0.85,
             zorder=2,
+            rasterized=True,
         )
         # Dots
         plot_dots(ax, dots_plot)
 
+    # With --raster-base the base is drawn once and every window shows the image
+    base_raster = None
+    if args.raster_base and (cong_plot is not None or len(leg_plots) > 0):
+        base_raster = render_base_raster(draw_base, plot_bounds)
+
+    def add_base(ax):
+        """Draw the base layers, or place the shared raster of them."""
+        if base_raster is None:
+            draw_base(ax)
+            return
+        minx, miny, maxx, maxy = plot_bounds
+        ax.imshow(base_raster, extent=(minx, maxx, miny, maxy), aspect="equal",
+                  interpolation="antialiased", zorder=1)
+
     # Draw congressional plan in separate window
     if cong_plot is not None:
-        fig_cong = plt.figure(figsize=(14, 12))
+        fig_cong = plt.figure(figsize=FIGSIZE)
         ax_cong = fig_cong.add_subplot(111)
         ax_cong.set_title(
             f"{state_info['name']}: Congressional Districts",
             fontsize=14,
         )
-        draw_base(ax_cong)
-        cong_plot.boundary.plot(
-            ax=ax_cong,
-            linewidth=2.0,
-            edgecolor="red",
+        add_base(ax_cong)
+        add_boundaries(
+            ax_cong,
+            cong_segments,
+            linewidths=2.0,
+            colors="red",
             alpha=0.95,
             zorder=4,
         )
@@ -640,9 +1156,10 @@ def main():
         ax_cong.legend(handles=legend_elements, loc='lower right', fontsize=8, framealpha=0.95, bbox_to_anchor=(1.0, -0.15))
         
         # Set extent
-        minx, miny, maxx, maxy = bg_plot.total_bounds
+        minx, miny, maxx, maxy = plot_bounds
         ax_cong.set_xlim(minx, maxx)
         ax_cong.set_ylim(miny, maxy)
+        ax_cong.set_aspect("equal")  # projected CRS: keep map proportions
         fig_cong.tight_layout()
 
     # Draw legislative plans in separate windows
@@ -654,18 +1171,19 @@ def main():
     
     for chamber, leg_plot in leg_plots.items():
         if leg_plot is not None:
-            fig_leg = plt.figure(figsize=(14, 12))
+            fig_leg = plt.figure(figsize=FIGSIZE)
             ax_leg = fig_leg.add_subplot(111)
             chamber_name = chamber_names.get(chamber, chamber.upper())
             ax_leg.set_title(
                 f"{state_info['name']}: {chamber_name}",
                 fontsize=14,
             )
-            draw_base(ax_leg)
-            leg_plot.boundary.plot(
-                ax=ax_leg,
-                linewidth=2.0,
-                edgecolor="blue",
+            add_base(ax_leg)
+            add_boundaries(
+                ax_leg,
+                leg_segments[chamber],
+                linewidths=2.0,
+                colors="blue",
                 alpha=0.95,
                 zorder=4,
             )
@@ -686,20 +1204,21 @@ def main():
             ax_leg.legend(handles=legend_elements, loc='lower right', fontsize=8, framealpha=0.95, bbox_to_anchor=(1.0, -0.15))
             
             # Set extent
-            minx, miny, maxx, maxy = bg_plot.total_bounds
+            minx, miny, maxx, maxy = plot_bounds
             ax_leg.set_xlim(minx, maxx)
             ax_leg.set_ylim(miny, maxy)
+            ax_leg.set_aspect("equal")  # projected CRS: keep map proportions
             fig_leg.tight_layout()
 
     # If no plans, just show demographics in one window
     if cong is None and not leg_plans:
-        fig_demo = plt.figure(figsize=(14, 12))
+        fig_demo = plt.figure(figsize=FIGSIZE)
         ax_demo = fig_demo.add_subplot(111)
         ax_demo.set_title(
             f"{state_info['name']}: Demographics",
             fontsize=14,
         )
-        draw_base(ax_demo)
+        add_base(ax_demo)
         ax_demo.set_axis_off()
         
         # Add legend
@@ -715,9 +1234,10 @@ def main():
         ax_demo.legend(handles=legend_elements, loc='lower right', fontsize=8, framealpha=0.95, bbox_to_anchor=(1.0, -0.15))
         
         # Set extent
-        minx, miny, maxx, maxy = bg_plot.total_bounds
+        minx, miny, maxx, maxy = plot_bounds
         ax_demo.set_xlim(minx, maxx)
         ax_demo.set_ylim(miny, maxy)
+        ax_demo.set_aspect("equal")  # projected CRS: keep map proportions
         fig_demo.tight_layout()
 
     # Show all figure windows